@@ -0,0 +1 @@
+"""Performance benchmarks for RSS to NotebookLM."""
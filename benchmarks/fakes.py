@@ -0,0 +1,160 @@
+"""In-process stand-ins for the Docs API and HTTP endpoints."""
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+import requests
+from google.auth.credentials import AnonymousCredentials
+from googleapiclient.discovery import build
+from requests.adapters import BaseAdapter
+
+from src.google_drive_client import GoogleDriveClient
+
+
+class _Request:
+    """A deferred fake API call, executed like googleapiclient's HttpRequest."""
+    
+    def __init__(self, func: Callable[[], dict]):
+        self._func = func
+    
+    def execute(self) -> dict:
+        return self._func()
+
+
+class FakeDocsService:
+    """
+    Minimal stand-in for the Docs v1 service returned by ``build()``.
+    
+    Supports ``documents().get()`` and ``documents().batchUpdate()`` with
+    ``insertText`` requests, records every call and sleeps to simulate
+    network latency.
+    """
+    
+    def __init__(self, latency: float = 0.0, title: str = "Benchmark document"):
+        """
+        Initialize fake Docs service.
+        
+        Args:
+            latency: Seconds to sleep per API call
+            title: Document title returned by get
+        """
+        self.latency = latency
+        self.title = title
+        self.calls: List[Dict] = []
+        self.text_length = 0
+        self.bytes_written = 0
+        self._lock = threading.Lock()
+    
+    def documents(self) -> 'FakeDocsService':
+        return self
+    
+    def get(self, documentId: str) -> _Request:
+        return _Request(lambda: self._get(documentId))
+    
+    def batchUpdate(self, documentId: str, body: dict) -> _Request:
+        return _Request(lambda: self._batch_update(documentId, body))
+    
+    def _record(self, method: str, document_id: str, **details):
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.calls.append({'method': method, 'documentId': document_id, **details})
+    
+    def _get(self, document_id: str) -> dict:
+        self._record('get', document_id)
+        with self._lock:
+            end_index = self.text_length + 2
+        return {
+            'title': self.title,
+            'documentId': document_id,
+            'body': {'content': [{'endIndex': 1}, {'endIndex': end_index}]},
+        }
+    
+    def _batch_update(self, document_id: str, body: dict) -> dict:
+        size = 0
+        with self._lock:
+            for request in body.get('requests', []):
+                text = request.get('insertText', {}).get('text', '')
+                self.text_length += len(text)
+                size += len(text.encode('utf-8'))
+            self.bytes_written += size
+        self._record('batchUpdate', document_id, bytes=size)
+        return {'documentId': document_id, 'replies': [{} for _ in body.get('requests', [])]}
+    
+    def call_counts(self) -> Dict[str, int]:
+        """Count recorded calls by method."""
+        counts: Dict[str, int] = {}
+        with self._lock:
+            for call in self.calls:
+                counts[call['method']] = counts.get(call['method'], 0) + 1
+        return counts
+
+
+class FakeDriveClient(GoogleDriveClient):
+    """GoogleDriveClient that talks to a FakeDocsService instead of Google."""
+    
+    def __init__(self, document_id: str = "benchmark-doc", latency: float = 0.0,
+                 service: Optional[FakeDocsService] = None):
+        self.fake_service = service or FakeDocsService(latency)
+        super().__init__('unused-credentials.json', document_id)
+    
+    def _authenticate(self):
+        self.service = self.fake_service
+
+
+class LocalDocsClient(GoogleDriveClient):
+    """GoogleDriveClient using the real API client against a local Docs endpoint."""
+    
+    def __init__(self, endpoint: str, document_id: str = "load-test-doc"):
+        """
+        Initialize local Docs client.
+        
+        Args:
+            endpoint: Base URL of a server implementing the Docs v1 routes
+            document_id: Document ID to append to
+        """
+        self.endpoint = endpoint
+        super().__init__('unused-credentials.json', document_id)
+    
+    def _authenticate(self):
+        self.service = build(
+            'docs', 'v1',
+            credentials=AnonymousCredentials(),
+            client_options={'api_endpoint': self.endpoint},
+            static_discovery=True
+        )
+
+
+class StaticAdapter(BaseAdapter):
+    """Requests transport adapter serving canned responses from memory."""
+    
+    def __init__(self, pages: Dict[str, bytes], content_type: str = 'text/html',
+                 default: Optional[bytes] = None):
+        """
+        Initialize static adapter.
+        
+        Args:
+            pages: Response bodies keyed by URL
+            content_type: Content-Type header for every response
+            default: Body for URLs not in pages (404 if None)
+        """
+        super().__init__()
+        self.pages = pages
+        self.content_type = content_type
+        self.default = default
+    
+    def send(self, request, **kwargs) -> requests.Response:
+        body = self.pages.get(request.url, self.default)
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        response.status_code = 200 if body is not None else 404
+        response._content = body if body is not None else b''
+        response._content_consumed = True
+        response.headers['Content-Type'] = self.content_type
+        response.headers['Content-Length'] = str(len(response._content))
+        return response
+    
+    def close(self):
+        pass
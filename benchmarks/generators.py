@@ -0,0 +1,144 @@
+"""Generators for synthetic feeds, article pages and state files."""
+
+import json
+import random
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from pathlib import Path
+from typing import List
+from xml.sax.saxutils import escape
+
+
+WORDS = (
+    "python data model feed article release security cloud kernel network "
+    "performance database compiler browser research policy market energy "
+    "climate design testing deploy latency memory storage update review"
+).split()
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    """Generate a sentence of random words."""
+    text = ' '.join(rng.choice(WORDS) for _ in range(words))
+    return text.capitalize() + '.'
+
+
+def generate_feed(entries: int, seed: int = 0, base_url: str = "https://example.com",
+                  id_prefix: str = "item") -> bytes:
+    """
+    Generate an RSS 2.0 feed document.
+    
+    Args:
+        entries: Number of items in the feed
+        seed: Random seed for reproducible content
+        base_url: Base URL for article links
+        id_prefix: Prefix for item GUIDs
+    
+    Returns:
+        Feed XML as bytes
+    """
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>\n',
+        '<rss version="2.0"><channel>',
+        '<title>Synthetic feed</title>',
+        f'<link>{escape(base_url)}</link>',
+        '<description>Generated for benchmarks</description>',
+    ]
+    for i in range(entries):
+        published = format_datetime(start + timedelta(minutes=i))
+        parts.append(
+            '<item>'
+            f'<title>{escape(_sentence(rng, 8))}</title>'
+            f'<link>{escape(base_url)}/articles/{id_prefix}-{i}</link>'
+            f'<guid>{escape(id_prefix)}-{i}</guid>'
+            f'<pubDate>{published}</pubDate>'
+            f'<description>{escape(_sentence(rng, 30))}</description>'
+            '</item>'
+        )
+    parts.append('</channel></rss>')
+    return ''.join(parts).encode('utf-8')
+
+
+def generate_article_html(paragraphs: int = 200, seed: int = 0,
+                          boilerplate: bool = True, comments: int = 0) -> bytes:
+    """
+    Generate a realistic article page.
+    
+    The page includes scripts, styles, navigation and, optionally, the kind
+    of repeated site chrome (cookie banner, related links) real sites carry.
+    
+    Args:
+        paragraphs: Number of paragraphs in the article body
+        seed: Random seed for reproducible content
+        boilerplate: Include cookie banner and related-article blocks
+        comments: Number of reader comments after the article
+    
+    Returns:
+        HTML as bytes
+    """
+    rng = random.Random(seed)
+    parts = [
+        '<!DOCTYPE html><html><head><title>Article</title>',
+        '<style>' + 'body { margin: 0; } ' * 200 + '</style>',
+        '<script>' + 'var x = 1; ' * 500 + '</script>',
+        '</head><body>',
+        '<header><nav>' + ''.join(f'<a href="/s{i}">Section {i}</a>' for i in range(30)) + '</nav></header>',
+    ]
+    parts.append('<div class="post-content"><article>')
+    # Many sites render banners and prompts inside the article element,
+    # where tag-based removal does not reach them
+    if boilerplate:
+        parts.append('<div class="cookie-banner"><p>We use cookies to improve your experience. '
+                     'By continuing you accept our cookie policy.</p></div>')
+    parts.append(f'<h1>{escape(_sentence(rng, 10))}</h1>')
+    for _ in range(paragraphs):
+        parts.append(f'<p>{escape(" ".join(_sentence(rng, 15) for _ in range(4)))}</p>')
+    if boilerplate:
+        parts.append('<div class="related"><p>Related articles</p><ul>'
+                     + ''.join(f'<li><a href="/r{i}">Related story {i}</a></li>' for i in range(10))
+                     + '</ul><p>Subscribe to our newsletter for more stories like this.</p></div>')
+    parts.append('</article></div>')
+    if comments:
+        parts.append('<section class="comments">')
+        for _ in range(comments):
+            parts.append(f'<div class="comment"><p>{escape(_sentence(rng, 25))}</p></div>')
+        parts.append('</section>')
+    parts.append('<footer>' + '<p>Footer link</p>' * 20 + '</footer></body></html>')
+    return ''.join(parts).encode('utf-8')
+
+
+def generate_item_ids(count: int, prefix: str = "item") -> List[str]:
+    """
+    Generate item IDs in the same form as generated feeds.
+    
+    Args:
+        count: Number of IDs
+        prefix: ID prefix
+    
+    Returns:
+        List of IDs
+    """
+    return [f"{prefix}-{i}" for i in range(count)]
+
+
+def write_state_file(path: Path, ids: int, prefix: str = "seen") -> Path:
+    """
+    Write a state file in StateManager's format.
+    
+    Args:
+        path: Destination path
+        ids: Number of processed item IDs
+        prefix: ID prefix (use a different prefix from generated feeds so
+            feed items are unprocessed)
+    
+    Returns:
+        The path written
+    """
+    data = {
+        'processed_items': generate_item_ids(ids, prefix),
+        'last_updated': datetime.now().isoformat()
+    }
+    with open(path, 'w') as f:
+        json.dump(data, f)
+    return path
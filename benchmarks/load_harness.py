@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+End-to-end load and soak harness.
+
+Starts a local server (in a child process) serving synthetic feeds, article
+pages and a fake Docs API, then drives the real RSSToNotebookLMApp against it.
+
+Usage:
+    # How does a full run_once scale with worker count?
+    python -m benchmarks.load_harness scale --feeds 200 --workers 1 2 4 8
+    
+    # Does memory grow over a long continuous session?
+    python -m benchmarks.load_harness soak --feeds 100 --cycles 500 --item-rate 0.05
+"""
+
+import argparse
+import contextlib
+import json
+import logging
+import multiprocessing
+import os
+import statistics
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+from typing import Dict, List
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.fakes import LocalDocsClient
+from benchmarks.servers import run_server_process
+from src.app import RSSToNotebookLMApp
+from src.logging_setup import configure_logging, shutdown_logging
+from src.metrics import REGISTRY
+
+
+def current_rss() -> int:
+    """Resident set size of this process in bytes."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        import resource
+        # Peak rather than current RSS where /proc is unavailable
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class LoadServer:
+    """Feed and Docs server running in a child process."""
+    
+    def __init__(self, **settings):
+        """
+        Start the server.
+        
+        Args:
+            **settings: LoadServerState settings (feeds, item_rate, ...)
+        """
+        parent, child = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(
+            target=run_server_process, args=(child,), kwargs=settings, daemon=True
+        )
+        self.process.start()
+        port = parent.recv()
+        self.base_url = f"http://127.0.0.1:{port}"
+    
+    def _post(self, path: str, data: Dict) -> Dict:
+        request = urllib.request.Request(
+            self.base_url + path, data=json.dumps(data).encode('utf-8'),
+            headers={'Content-Type': 'application/json'}, method='POST'
+        )
+        with urllib.request.urlopen(request) as response:
+            return json.loads(response.read())
+    
+    def configure(self, **settings):
+        """Change server settings (see LoadServerState)."""
+        self._post('/_admin/configure', settings)
+    
+    def reset(self):
+        """Reset feeds and statistics."""
+        self._post('/_admin/reset', {})
+    
+    def stats(self) -> Dict[str, int]:
+        """Get request statistics."""
+        with urllib.request.urlopen(self.base_url + '/_admin/stats') as response:
+            return json.loads(response.read())
+    
+    def stop(self):
+        """Stop the server process."""
+        self.process.terminate()
+        self.process.join()
+
+
+def write_config(workdir: Path, base_url: str, feeds: int, workers: int,
+                 max_articles: int, check_interval: int, sink: str = 'google_docs') -> Path:
+    """Write an application config pointing at the load server."""
+    config = {
+        'google_drive': {'credentials_file': 'unused.json', 'document_id': 'load-test-doc'},
+        'feeds': [{'url': f"{base_url}/feeds/{i}.xml"} for i in range(feeds)],
+        'settings': {
+            'check_interval': check_interval,
+            'state_file': str(workdir / 'state.json'),
+            'max_articles_per_run': max_articles,
+            'workers': workers,
+            'request_delay': 0,
+        },
+        'boilerplate': {'file': str(workdir / 'boilerplate.json')},
+        'outputs': [{'type': sink}],
+    }
+    path = workdir / 'config.yaml'
+    with open(path, 'w') as f:
+        yaml.safe_dump(config, f)
+    return path
+
+
+def build_app(server: LoadServer, workdir: Path, args, workers: int) -> RSSToNotebookLMApp:
+    """Create an app with fresh state, configured for the load server."""
+    for name in ('state.json', 'state.json.snapshot.gz'):
+        if (workdir / name).exists():
+            (workdir / name).unlink()
+    config_path = write_config(workdir, server.base_url, args.feeds, workers,
+                               args.max_articles, args.interval, args.sink)
+    return RSSToNotebookLMApp(str(config_path), drive_client=LocalDocsClient(server.base_url))
+
+
+@contextlib.contextmanager
+def app_output(verbose: bool):
+    """Silence application logging unless verbose."""
+    if verbose:
+        configure_logging()
+        try:
+            yield
+        finally:
+            shutdown_logging()
+    else:
+        logging.disable(logging.CRITICAL)
+        try:
+            yield
+        finally:
+            logging.disable(logging.NOTSET)
+
+
+def run_scale(server: LoadServer, workdir: Path, args) -> List[Dict]:
+    """Time a full run_once for each worker count."""
+    rows = []
+    for workers in args.workers:
+        server.reset()
+        REGISTRY.reset()
+        app = build_app(server, workdir, args, workers)
+        rss_before = current_rss()
+        
+        start = time.perf_counter()
+        with app_output(args.verbose):
+            processed = app.run_once()
+        elapsed = time.perf_counter() - start
+        
+        stats = server.stats()
+        rows.append({
+            'workers': workers,
+            'feeds': args.feeds,
+            'processed': processed,
+            'seconds': elapsed,
+            'items_per_second': processed / elapsed if elapsed else 0.0,
+            'docs_get': stats.get('docs_get', 0),
+            'docs_batch_update': stats.get('docs_batchUpdate', 0),
+            'docs_429': stats.get('docs_429', 0),
+            'rss_growth_mb': (current_rss() - rss_before) / 1024 / 1024,
+        })
+        print_row(rows[-1], header=len(rows) == 1)
+    return rows
+
+
+def run_soak(server: LoadServer, workdir: Path, args) -> Dict:
+    """Run a long continuous session, recording cycle time and memory."""
+    REGISTRY.reset()
+    app = build_app(server, workdir, args, args.workers[0])
+    cycles: List[Dict] = []
+    out = sys.stdout
+    
+    def on_stage(stage: str, duration: float):
+        if stage == 'cycle':
+            cycles.append({
+                'cycle': len(cycles) + 1,
+                'seconds': duration,
+                'processed': REGISTRY.get_gauge('cycle_last_processed_items'),
+                'rss_mb': current_rss() / 1024 / 1024,
+            })
+            if len(cycles) % args.report_every == 0:
+                print_row(cycles[-1], header=len(cycles) == args.report_every, file=out)
+    
+    REGISTRY.add_stage_listener(on_stage)
+    try:
+        with app_output(args.verbose):
+            app.run_continuous(max_cycles=args.cycles)
+    finally:
+        REGISTRY.remove_stage_listener(on_stage)
+    
+    # Ignore the first cycles while caches and pools warm up
+    steady = cycles[min(len(cycles) - 1, args.warmup):]
+    memory = [c['rss_mb'] for c in steady]
+    slope = 0.0
+    if len(steady) > 1:
+        slope = statistics.linear_regression([c['cycle'] for c in steady], memory).slope
+    
+    summary = {
+        'cycles': len(cycles),
+        'processed': sum(c['processed'] or 0 for c in cycles),
+        'median_cycle_seconds': statistics.median(c['seconds'] for c in cycles),
+        'max_cycle_seconds': max(c['seconds'] for c in cycles),
+        'rss_start_mb': memory[0],
+        'rss_end_mb': memory[-1],
+        'rss_growth_mb_per_1000_cycles': slope * 1000,
+        'server': server.stats(),
+    }
+    print()
+    for name, value in summary.items():
+        print(f"{name:<32} {value}")
+    return {'summary': summary, 'cycles': cycles}
+
+
+def print_row(row: Dict, header: bool = False, file=None):
+    """Print a result row as an aligned table line."""
+    if header:
+        print('  '.join(f"{name:>16}" for name in row), file=file)
+    print('  '.join(f"{value:>16.3f}" if isinstance(value, float) else f"{str(value):>16}"
+                    for value in row.values()), file=file)
+
+
+def main():
+    """Run the load harness."""
+    parser = argparse.ArgumentParser(description='End-to-end load and soak harness')
+    parser.add_argument('mode', choices=['scale', 'soak'])
+    parser.add_argument('--feeds', type=int, default=100, help='Number of feeds served')
+    parser.add_argument('--initial-items', type=int, default=20, help='Items per feed at start')
+    parser.add_argument('--item-rate', type=float, default=0.0,
+                        help='New items per second per feed')
+    parser.add_argument('--paragraphs', type=int, default=50, help='Paragraphs per article page')
+    parser.add_argument('--article-latency', type=float, default=0.0,
+                        help='Article page latency in seconds')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8],
+                        help='Worker counts to compare (soak uses the first)')
+    parser.add_argument('--max-articles', type=int, default=0, help='max_articles_per_run')
+    parser.add_argument('--interval', type=int, default=1, help='check_interval for soak runs')
+    parser.add_argument('--cycles', type=int, default=100, help='Cycles to run in soak mode')
+    parser.add_argument('--warmup', type=int, default=5, help='Soak cycles ignored for memory growth')
+    parser.add_argument('--report-every', type=int, default=10, help='Print every Nth soak cycle')
+    parser.add_argument('--docs-latency', type=float, default=0.0, help='Docs API latency in seconds')
+    parser.add_argument('--docs-error-rate', type=float, default=0.0,
+                        help='Fraction of Docs API calls answered with 429')
+    parser.add_argument('--docs-slow-rate', type=float, default=0.0,
+                        help='Fraction of Docs API calls that are slow')
+    parser.add_argument('--docs-slow-latency', type=float, default=5.0,
+                        help='Latency of slow Docs API calls in seconds')
+    parser.add_argument('--sink', choices=['google_docs', 'null'], default='google_docs',
+                        help="Output sink ('null' measures the pipeline without Docs writes)")
+    parser.add_argument('--output', help='Write JSON results to this file')
+    parser.add_argument('--verbose', action='store_true', help='Show application output')
+    args = parser.parse_args()
+    
+    server = LoadServer(feeds=args.feeds, initial_items=args.initial_items,
+                        item_rate=args.item_rate, paragraphs=args.paragraphs,
+                        article_latency=args.article_latency)
+    try:
+        server.configure(docs_latency=args.docs_latency, docs_error_rate=args.docs_error_rate,
+                         docs_slow_rate=args.docs_slow_rate, docs_slow_latency=args.docs_slow_latency)
+        with tempfile.TemporaryDirectory() as workdir:
+            if args.mode == 'scale':
+                results = {'rows': run_scale(server, Path(workdir), args)}
+            else:
+                results = run_soak(server, Path(workdir), args)
+    finally:
+        server.stop()
+    
+    if args.output:
+        results['parameters'] = vars(args)
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
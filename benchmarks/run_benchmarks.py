@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Microbenchmarks for the feed processing pipeline.
+
+Usage:
+    python -m benchmarks.run_benchmarks --output results.json
+    python -m benchmarks.run_benchmarks --compare results.json
+"""
+
+import argparse
+import json
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.fakes import FakeDriveClient, StaticAdapter
+from benchmarks.generators import generate_article_html, generate_feed, write_state_file
+from src.content_extractor import ContentExtractor
+from src.rss_parser import RSSParser
+from src.state_manager import StateManager
+
+
+class Benchmark:
+    """A named benchmark with optional per-run setup."""
+    
+    def __init__(self, name: str, func: Callable[[object], object],
+                 setup: Optional[Callable[[], object]] = None, ops: int = 1,
+                 repeat: int = 5):
+        """
+        Initialize benchmark.
+        
+        Args:
+            name: Benchmark name used in results
+            func: Function timed on each run, receiving setup's return value
+            setup: Untimed function run before each timed run
+            ops: Operations performed per run, for throughput
+            repeat: Number of timed runs
+        """
+        self.name = name
+        self.func = func
+        self.setup = setup
+        self.ops = ops
+        self.repeat = repeat
+    
+    def run(self) -> Dict:
+        """
+        Run the benchmark.
+        
+        Returns:
+            Timing summary
+        """
+        # Warm-up run, untimed
+        self.func(self.setup() if self.setup else None)
+        
+        times = []
+        for _ in range(self.repeat):
+            arg = self.setup() if self.setup else None
+            start = time.perf_counter()
+            self.func(arg)
+            times.append(time.perf_counter() - start)
+        
+        median = statistics.median(times)
+        return {
+            'runs': self.repeat,
+            'ops': self.ops,
+            'min': min(times),
+            'median': median,
+            'mean': statistics.mean(times),
+            'max': max(times),
+            'stdev': statistics.stdev(times) if len(times) > 1 else 0.0,
+            'ops_per_second': self.ops / median if median else None,
+        }
+
+
+def build_benchmarks(entries: int, state_ids: int, paragraphs: int,
+                     docs_latency: float, workdir: Path) -> List[Benchmark]:
+    """
+    Build the benchmark set.
+    
+    Args:
+        entries: Items in the synthetic feed
+        state_ids: Processed IDs in the synthetic state file
+        paragraphs: Paragraphs in the synthetic article page
+        docs_latency: Simulated Docs API latency in seconds
+        workdir: Directory for temporary files
+    
+    Returns:
+        List of benchmarks
+    """
+    feed_xml = generate_feed(entries)
+    items = RSSParser.parse_feed(feed_xml, feed_url='https://example.com/feed.xml')
+    
+    state_path = write_state_file(workdir / 'state.json', state_ids)
+    state_manager = StateManager(str(state_path))
+    
+    article_url = 'https://example.com/articles/large'
+    extractor = ContentExtractor()
+    commented_url = 'https://example.com/articles/commented'
+    extractor.session.mount('https://', StaticAdapter({
+        article_url: generate_article_html(paragraphs),
+        # Long comment threads after the article are not needed for extraction
+        commented_url: generate_article_html(paragraphs, comments=paragraphs * 20),
+    }))
+    content = extractor.extract_with_metadata(article_url, 'Large article')
+    
+    drive_client = FakeDriveClient(latency=docs_latency)
+    
+    def fresh_state_copy() -> StateManager:
+        copy_path = workdir / 'state-copy.json'
+        shutil.copyfile(state_path, copy_path)
+        return StateManager(str(copy_path))
+    
+    return [
+        Benchmark('parse', lambda _: RSSParser.parse_feed(feed_xml), ops=entries, repeat=3),
+        Benchmark('filter', lambda _: RSSParser.filter_items(items, 'python'), ops=entries),
+        Benchmark('dedup', lambda _: state_manager.get_unprocessed_items(items), ops=entries),
+        Benchmark('extract', lambda _: extractor.extract_content(article_url)),
+        Benchmark('extract_commented', lambda _: extractor.extract_content(commented_url)),
+        Benchmark('append', lambda _: drive_client.append_content(content), ops=1, repeat=20),
+        Benchmark('state_load', lambda _: StateManager(str(state_path)), repeat=3),
+        Benchmark('state_save', lambda manager: manager._save_state(),
+                  setup=fresh_state_copy, repeat=3),
+        Benchmark('mark_processed', lambda manager: manager.mark_processed('new-item'),
+                  setup=fresh_state_copy, repeat=3),
+    ]
+
+
+def git_commit() -> Optional[str]:
+    """Get the current git commit, if available."""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+            cwd=Path(__file__).parent, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """
+    Compare results with a baseline and print a table to stderr.
+    
+    Args:
+        results: Current results
+        baseline: Baseline results
+        threshold: Relative slowdown of the median counted as a regression
+    
+    Returns:
+        Names of regressed benchmarks
+    """
+    regressions = []
+    print(f"{'benchmark':<16} {'baseline':>12} {'current':>12} {'change':>9}", file=sys.stderr)
+    for name, current in results['benchmarks'].items():
+        base = baseline.get('benchmarks', {}).get(name)
+        if not base:
+            print(f"{name:<16} {'-':>12} {current['median']:>11.4f}s {'new':>9}", file=sys.stderr)
+            continue
+        change = (current['median'] - base['median']) / base['median']
+        marker = ''
+        if change > threshold:
+            regressions.append(name)
+            marker = '  REGRESSION'
+        print(f"{name:<16} {base['median']:>11.4f}s {current['median']:>11.4f}s {change:>+8.1%}{marker}",
+              file=sys.stderr)
+    return regressions
+
+
+def main():
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(description='Run pipeline microbenchmarks')
+    parser.add_argument('--entries', type=int, default=10000, help='Items in the synthetic feed')
+    parser.add_argument('--state-ids', type=int, default=1000000, help='IDs in the synthetic state file')
+    parser.add_argument('--paragraphs', type=int, default=500, help='Paragraphs in the synthetic article')
+    parser.add_argument('--docs-latency', type=float, default=0.0,
+                        help='Simulated Docs API latency per call in seconds')
+    parser.add_argument('--quick', action='store_true', help='Use sizes 10x smaller')
+    parser.add_argument('--only', nargs='+', metavar='NAME', help='Run only these benchmarks')
+    parser.add_argument('--output', help='Write JSON results to this file')
+    parser.add_argument('--compare', metavar='BASELINE', help='Compare with a previous results file')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='Median slowdown counted as a regression (default: 0.1)')
+    args = parser.parse_args()
+    
+    scale = 10 if args.quick else 1
+    entries = args.entries // scale
+    state_ids = args.state_ids // scale
+    paragraphs = args.paragraphs // scale
+    
+    with tempfile.TemporaryDirectory() as workdir:
+        benchmarks = build_benchmarks(entries, state_ids, paragraphs, args.docs_latency, Path(workdir))
+        if args.only:
+            benchmarks = [b for b in benchmarks if b.name in args.only]
+        
+        results = {
+            'commit': git_commit(),
+            'timestamp': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'parameters': {
+                'entries': entries,
+                'state_ids': state_ids,
+                'paragraphs': paragraphs,
+                'docs_latency': args.docs_latency,
+            },
+            'benchmarks': {},
+        }
+        for benchmark in benchmarks:
+            result = benchmark.run()
+            results['benchmarks'][benchmark.name] = result
+            print(f"{benchmark.name:<16} median {result['median']:.4f}s "
+                  f"(min {result['min']:.4f}s, {result['runs']} runs)", file=sys.stderr)
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
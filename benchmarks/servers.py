@@ -0,0 +1,241 @@
+"""Local HTTP servers serving synthetic feeds, article pages and a fake Docs API."""
+
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from xml.sax.saxutils import escape
+from email.utils import formatdate
+
+from benchmarks.generators import generate_article_html
+
+
+class LoadServerState:
+    """Shared, mutable state behind the feed and Docs servers."""
+    
+    def __init__(self, feeds: int = 100, initial_items: int = 20, item_rate: float = 0.0,
+                 window: int = 50, paragraphs: int = 50, article_latency: float = 0.0):
+        """
+        Initialize server state.
+        
+        Args:
+            feeds: Number of feeds served
+            initial_items: Items in each feed at start
+            item_rate: New items per second added to each feed
+            window: Most recent items listed in a feed document
+            paragraphs: Paragraphs per article page
+            article_latency: Seconds to delay each article response
+        """
+        self.lock = threading.Lock()
+        self.start = time.time()
+        self.feeds = feeds
+        self.initial_items = initial_items
+        self.item_rate = item_rate
+        self.window = window
+        self.paragraphs = paragraphs
+        self.article_latency = article_latency
+        
+        # Docs API behaviour
+        self.docs_latency = 0.0
+        self.docs_error_rate = 0.0
+        self.docs_slow_rate = 0.0
+        self.docs_slow_latency = 5.0
+        self.rng = random.Random(0)
+        
+        self.stats: Dict[str, int] = {}
+        self.document_length = 1
+    
+    def configure(self, **settings):
+        """Update any of the settings passed to __init__ or the docs_* settings."""
+        with self.lock:
+            for name, value in settings.items():
+                if not hasattr(self, name):
+                    raise ValueError(f"Unknown setting: {name}")
+                setattr(self, name, value)
+    
+    def count(self, name: str, amount: int = 1):
+        """Increment a statistics counter."""
+        with self.lock:
+            self.stats[name] = self.stats.get(name, 0) + amount
+    
+    def item_count(self) -> int:
+        """Number of items published so far in each feed."""
+        return self.initial_items + int((time.time() - self.start) * self.item_rate)
+    
+    def reset(self):
+        """Restart feeds from their initial items and clear statistics."""
+        with self.lock:
+            self.start = time.time()
+            self.stats = {}
+            self.document_length = 1
+
+
+def render_feed(state: LoadServerState, base_url: str, feed: int, count: int) -> bytes:
+    """Render the latest items of a feed as RSS."""
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>\n<rss version="2.0"><channel>',
+        f'<title>Load feed {feed}</title><link>{base_url}</link><description>Load test</description>',
+    ]
+    for i in range(count - 1, max(-1, count - 1 - state.window), -1):
+        link = f"{base_url}/articles/{feed}/{i}"
+        parts.append(
+            f'<item><title>Feed {feed} article {i}</title><link>{escape(link)}</link>'
+            f'<guid>load-{feed}-{i}</guid>'
+            f'<pubDate>{formatdate(state.start + i, usegmt=True)}</pubDate>'
+            f'<description>Synthetic article {i} of feed {feed}</description></item>'
+        )
+    parts.append('</channel></rss>')
+    return ''.join(parts).encode('utf-8')
+
+
+class LoadRequestHandler(BaseHTTPRequestHandler):
+    """Routes feed, article, Docs API and admin requests."""
+    
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately; without this, Nagle's
+    # algorithm and delayed ACKs add ~40ms to every keep-alive response
+    disable_nagle_algorithm = True
+    state: LoadServerState
+    
+    FEED_PATH = re.compile(r'^/feeds/(\d+)\.xml$')
+    ARTICLE_PATH = re.compile(r'^/articles/(\d+)/(\d+)$')
+    DOC_PATH = re.compile(r'^/v1/documents/([^/:?]+)(:batchUpdate)?(\?.*)?$')
+    
+    def do_GET(self):
+        feed_match = self.FEED_PATH.match(self.path)
+        article_match = self.ARTICLE_PATH.match(self.path)
+        doc_match = self.DOC_PATH.match(self.path)
+        
+        if feed_match:
+            self._serve_feed(int(feed_match.group(1)))
+        elif article_match:
+            self.state.count('article_requests')
+            if self.state.article_latency:
+                time.sleep(self.state.article_latency)
+            seed = int(article_match.group(1)) * 100000 + int(article_match.group(2))
+            body = generate_article_html(self.state.paragraphs, seed=seed)
+            self.state.count('article_bytes', len(body))
+            self._respond(200, body, 'text/html; charset=utf-8')
+        elif doc_match and not doc_match.group(2):
+            self._docs_call('get', lambda: {
+                'documentId': doc_match.group(1),
+                'title': 'Load test document',
+                'body': {'content': [{'endIndex': 1}, {'endIndex': self.state.document_length + 1}]},
+            })
+        elif self.path == '/_admin/stats':
+            with self.state.lock:
+                stats = dict(self.state.stats)
+            self._respond_json(200, stats)
+        else:
+            self._respond(404, b'Not found\n', 'text/plain')
+    
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        body = self.rfile.read(length) if length else b''
+        doc_match = self.DOC_PATH.match(self.path)
+        
+        if doc_match and doc_match.group(2):
+            self._docs_call('batchUpdate', lambda: self._batch_update(doc_match.group(1), body))
+        elif self.path == '/_admin/configure':
+            try:
+                self.state.configure(**json.loads(body or b'{}'))
+            except (ValueError, TypeError) as e:
+                self._respond_json(400, {'error': str(e)})
+                return
+            self._respond_json(200, {'ok': True})
+        elif self.path == '/_admin/reset':
+            self.state.reset()
+            self._respond_json(200, {'ok': True})
+        else:
+            self._respond(404, b'Not found\n', 'text/plain')
+    
+    def _serve_feed(self, feed: int):
+        if feed >= self.state.feeds:
+            self._respond(404, b'Not found\n', 'text/plain')
+            return
+        count = self.state.item_count()
+        etag = f'"{count}"'
+        if self.headers.get('If-None-Match') == etag:
+            self.state.count('feed_not_modified')
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        self.state.count('feed_requests')
+        base_url = f"http://{self.headers.get('Host')}"
+        self._respond(200, render_feed(self.state, base_url, feed, count),
+                      'application/rss+xml', {'ETag': etag})
+    
+    def _docs_call(self, method: str, handler):
+        self.state.count(f'docs_{method}')
+        with self.state.lock:
+            error = self.state.rng.random() < self.state.docs_error_rate
+            slow = self.state.rng.random() < self.state.docs_slow_rate
+            latency = self.state.docs_slow_latency if slow else self.state.docs_latency
+        if latency:
+            time.sleep(latency)
+        if error:
+            self.state.count('docs_429')
+            self._respond_json(429, {'error': {'code': 429, 'message': 'Rate limit exceeded',
+                                               'status': 'RESOURCE_EXHAUSTED'}})
+            return
+        self._respond_json(200, handler())
+    
+    def _batch_update(self, document_id: str, body: bytes) -> dict:
+        requests = json.loads(body or b'{}').get('requests', [])
+        written = 0
+        for request in requests:
+            text = request.get('insertText', {}).get('text', '')
+            written += len(text.encode('utf-8'))
+            with self.state.lock:
+                self.state.document_length += len(text)
+        self.state.count('docs_bytes', written)
+        return {'documentId': document_id, 'replies': [{} for _ in requests]}
+    
+    def _respond_json(self, status: int, data: dict):
+        self._respond(status, json.dumps(data).encode('utf-8'), 'application/json')
+    
+    def _respond(self, status: int, body: bytes, content_type: str,
+                 headers: Optional[Dict[str, str]] = None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(state: LoadServerState, host: str = '127.0.0.1', port: int = 0,
+          ready: Optional[object] = None) -> ThreadingHTTPServer:
+    """
+    Create a server for the given state.
+    
+    Args:
+        state: Server state
+        host: Interface to bind to
+        port: Port to bind to (0 picks a free port)
+        ready: Optional multiprocessing connection to send the bound port to
+    
+    Returns:
+        The server (not yet serving)
+    """
+    handler = type('BoundLoadRequestHandler', (LoadRequestHandler,), {'state': state})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    if ready is not None:
+        ready.send(server.server_address[1])
+    return server
+
+
+def run_server_process(ready, **settings):
+    """Entry point for running the servers in a child process."""
+    server = serve(LoadServerState(**settings), ready=ready)
+    server.serve_forever()
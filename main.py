@@ -2,13 +2,26 @@
 """Main entry point for RSS to NotebookLM application."""
 
 import argparse
+import logging
+import signal
 import sys
+import tempfile
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from src.app import RSSToNotebookLMApp
+from src.logging_setup import configure_logging, shutdown_logging
+from src.profiling import RunProfiler
+from src.replay import Recorder, Replayer
+
+logger = logging.getLogger('rss_to_notebooklm')
+
+
+def _terminate(signum, frame):
+    """Stop like Ctrl+C, so shutdown work (such as the snapshot) still runs."""
+    raise KeyboardInterrupt
 
 
 def main():
@@ -26,23 +39,88 @@ def main():
         action='store_true',
         help='Run continuously, checking feeds periodically'
     )
+    parser.add_argument(
+        '--profile',
+        metavar='DIR',
+        help='Profile runs with cProfile and tracemalloc, writing reports to DIR'
+    )
+    parser.add_argument(
+        '--profile-every',
+        type=int,
+        default=1,
+        metavar='N',
+        help='With --profile and --continuous, profile every Nth cycle (0 = only on SIGUSR1, default: 1)'
+    )
+    parser.add_argument(
+        '--record',
+        metavar='FILE',
+        help='Record feed, article and Docs API traffic to FILE (gzipped JSON Lines)'
+    )
+    parser.add_argument(
+        '--replay',
+        metavar='FILE',
+        help='Replay a recording offline, using its configuration instead of --config'
+    )
+    parser.add_argument(
+        '--replay-speed',
+        type=float,
+        default=1.0,
+        metavar='X',
+        help='With --replay, play back X times faster than recorded (0 = no delays, default: 1)'
+    )
     
     args = parser.parse_args()
+    if args.record and args.replay:
+        parser.error('--record and --replay cannot be combined')
     
+    configure_logging()
+    recorder = None
     try:
-        app = RSSToNotebookLMApp(args.config)
+        if args.replay:
+            replayer = Replayer(args.replay, speed=args.replay_speed)
+            config_path = replayer.prepare(tempfile.mkdtemp(prefix='rss-replay-'))
+            logger.info("Replaying %s using %s", args.replay, config_path)
+            app = RSSToNotebookLMApp(str(config_path), drive_client=replayer.docs_client())
+            replayer.attach(app)
+        else:
+            app = RSSToNotebookLMApp(args.config)
+        configure_logging(app.config.log_level, app.config.log_format,
+                          app.config.log_repeat_limit, app.config.log_repeat_window)
+        
+        if args.record:
+            recorder = Recorder(args.record)
+            recorder.attach(app)
+        
+        if args.profile:
+            app.profiler = RunProfiler(args.profile, every=args.profile_every)
         
         if args.continuous:
+            if app.profiler:
+                app.profiler.install_signal_handler()
+            # Container runtimes stop processes with SIGTERM
+            signal.signal(signal.SIGTERM, _terminate)
             app.run_continuous()
         else:
-            app.run_once()
+            app.restore_snapshot()
+            if app.profiler:
+                # A single run is always profiled; sampling applies to cycles
+                app.profiler.profile(app.run_once)
+            else:
+                app.run_once()
+            app.save_snapshot()
     
     except KeyboardInterrupt:
-        print("\nInterrupted by user")
+        logger.info("Interrupted by user")
         sys.exit(0)
     except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
+        logger.error("%s", e)
         sys.exit(1)
+    finally:
+        if recorder:
+            recorder.close()
+            logger.info("Recorded %d events to %s", recorder.events, args.record)
+        # Write out records still queued for the writer thread
+        shutdown_logging()
 
 
 if __name__ == '__main__':
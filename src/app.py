@@ -1,32 +1,93 @@
 """Main application logic."""
 
+import logging
 import time
-from typing import List
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, List, Optional, Set, Tuple
 from .config import AppConfig, FeedConfig
 from .rss_parser import RSSParser, RSSItem
 from .content_extractor import ContentExtractor
+from .boilerplate import BoilerplateModel
 from .google_drive_client import GoogleDriveClient
 from .state_manager import StateManager
+from .metrics import REGISTRY, MetricsServer
+from .profiling import RunProfiler
+from .process_lock import ProcessLock
+from .scheduler import ItemScheduler
+from .sinks import GoogleDocsSink, Sink, create_sink
+from .snapshot import SnapshotStore
+from .logging_setup import log_context
+
+logger = logging.getLogger(__name__)
 
 
 class RSSToNotebookLMApp:
     """Main application class."""
     
-    def __init__(self, config_path: str = "config.yaml"):
+    # Seconds between checks for configuration changes in continuous mode
+    config_poll_interval = 5
+    
+    def __init__(self, config_path: str = "config.yaml",
+                 drive_client: Optional[GoogleDriveClient] = None):
         """
         Initialize the application.
         
         Args:
             config_path: Path to configuration file
+            drive_client: Pre-built Docs client (default: authenticate
+                using the configured credentials if a Google Docs output
+                is configured)
         """
         self.config = AppConfig(config_path)
+        self._config_signature = self._read_config_signature()
+        self.metrics_server: Optional[MetricsServer] = None
         self.rss_parser = RSSParser()
-        self.content_extractor = ContentExtractor()
-        self.drive_client = GoogleDriveClient(
-            self.config.credentials_file,
-            self.config.document_id
+        boilerplate = None
+        if self.config.boilerplate_enabled:
+            boilerplate = BoilerplateModel(
+                str(self.config.boilerplate_file),
+                min_articles=self.config.boilerplate_min_articles,
+                threshold=self.config.boilerplate_threshold
+            )
+        self.content_extractor = ContentExtractor(
+            boilerplate=boilerplate,
+            max_bytes=self.config.extraction_max_bytes,
+            max_pdf_bytes=self.config.extraction_max_pdf_bytes,
+            max_pdf_pages=self.config.extraction_max_pdf_pages
         )
+        self.drive_client = drive_client
+        if self.drive_client is None and any(output.type == 'google_docs'
+                                             for output in self.config.outputs):
+            self.drive_client = GoogleDriveClient(
+                self.config.credentials_file,
+                self.config.document_id
+            )
+        self.sinks: List[Sink] = [
+            create_sink(output, self.drive_client, self.config.request_delay)
+            for output in self.config.outputs
+        ]
+        # Stable keys recording in the state file which outputs wrote an item
+        self._sink_keys = [f"{output.type}:{index}" for index, output in enumerate(self.config.outputs)]
+        # Items written to some sinks but not yet acknowledged by all of them,
+        # with the indexes of the sinks still to acknowledge
+        self._unacknowledged: Dict[str, Tuple[RSSItem, Set[int]]] = {}
+        self._committed_count = 0
         self.state_manager = StateManager(str(self.config.state_file))
+        self.process_lock = ProcessLock(str(self.config.lock_file))
+        self.scheduler = ItemScheduler(self.config.scheduling, self.config.newest_first)
+        # Optional profiler used to sample runs in continuous mode
+        self.profiler: Optional[RunProfiler] = None
+        # Items left unfinished by a cycle deadline, processed first next cycle
+        self.pending_items: List[RSSItem] = []
+        # Index of the feed to poll first (rotated when a deadline cuts polling short)
+        self._feed_offset = 0
+        self._deadline: Optional[float] = None
+        # Wall-clock time the last cycle finished, used to resume the schedule
+        self.last_cycle_time: Optional[float] = None
+        self.snapshot_store: Optional[SnapshotStore] = None
+        if self.config.snapshot_file:
+            self.snapshot_store = SnapshotStore(str(self.config.snapshot_file))
     
     def process_feed(self, feed_config: FeedConfig) -> List[RSSItem]:
         """
@@ -38,31 +99,40 @@ class RSSToNotebookLMApp:
         Returns:
             List of matching RSS items
         """
-        print(f"Processing feed: {feed_config.url}")
-        
-        try:
-            # Parse RSS feed
-            items = self.rss_parser.parse_feed(feed_config.url)
-            print(f"  Found {len(items)} items in feed")
+        with log_context(feed=feed_config.url):
+            logger.info("Processing feed: %s", feed_config.url)
             
-            # Filter items
-            if feed_config.filter_text:
-                items = self.rss_parser.filter_items(items, feed_config.filter_text)
-                print(f"  {len(items)} items match filter: '{feed_config.filter_text}'")
+            try:
+                # Fetch and parse RSS feed
+                items = self.rss_parser.fetch_feed(
+                    feed_config.url,
+                    timeout=self._request_timeout(self.rss_parser.timeout)
+                )
+                REGISTRY.inc('feed_items_total', len(items), feed=feed_config.url, stage='found')
+                logger.info("Found %d items in feed", len(items))
+                
+                # Filter items
+                if feed_config.filter_text:
+                    items = self.rss_parser.filter_items(items, feed_config.filter_text)
+                    REGISTRY.inc('feed_items_total', len(items), feed=feed_config.url, stage='matched')
+                    logger.info("%d items match filter: '%s'", len(items), feed_config.filter_text)
+                
+                # Filter out already processed items
+                unprocessed = self.state_manager.get_unprocessed_items(items)
+                REGISTRY.inc('feed_items_total', len(unprocessed), feed=feed_config.url, stage='new')
+                logger.info("%d new items to process", len(unprocessed))
+                
+                return unprocessed
             
-            # Filter out already processed items
-            unprocessed = self.state_manager.get_unprocessed_items(items)
-            print(f"  {len(unprocessed)} new items to process")
-            
-            return unprocessed
-        
-        except Exception as e:
-            print(f"Error processing feed {feed_config.url}: {e}")
-            return []
+            except Exception as e:
+                REGISTRY.inc('feed_errors_total', feed=feed_config.url)
+                logger.error("Error processing feed %s: %s", feed_config.url, e,
+                             extra={'stage': 'feed_fetch'})
+                return []
     
     def process_item(self, item: RSSItem) -> bool:
         """
-        Process a single RSS item: extract content and add to Google Doc.
+        Process a single RSS item: extract content and write it to the outputs.
         
         Args:
             item: RSS item to process
@@ -70,87 +140,510 @@ class RSSToNotebookLMApp:
         Returns:
             True if successful, False otherwise
         """
-        print(f"  Processing: {item.title}")
+        return self.append_item(item, self.extract_item(item))
+    
+    def extract_item(self, item: RSSItem) -> Optional[str]:
+        """
+        Extract the formatted article content for an RSS item.
         
-        # Extract content from article URL
-        content = self.content_extractor.extract_with_metadata(
-            item.link,
-            item.title
-        )
+        Safe to call from worker threads.
         
-        if not content:
-            print(f"    Failed to extract content from {item.link}")
-            return False
+        Args:
+            item: RSS item to extract
+            
+        Returns:
+            Formatted content, or None if extraction fails
+        """
+        timeout = self._request_timeout(self.content_extractor.timeout)
+        with log_context(feed=item.feed_url, item=item.id), \
+                REGISTRY.time('item_extract', feed=item.feed_url or 'unknown'):
+            return self.content_extractor.extract_with_metadata(
+                item.link,
+                item.title,
+                timeout=timeout
+            )
+    
+    def append_item(self, item: RSSItem, content: Optional[str]) -> bool:
+        """
+        Write extracted content to every output sink.
+        
+        Sinks may buffer the content; the item is marked processed once
+        every sink has acknowledged writing it. Sinks that acknowledged the
+        item in an earlier run are skipped.
         
-        # Append to Google Doc
-        success = self.drive_client.append_content(content)
+        Args:
+            item: RSS item the content belongs to
+            content: Extracted content (None if extraction failed)
+            
+        Returns:
+            True if the content was handed to the sinks, False otherwise
+        """
+        feed = item.feed_url or 'unknown'
+        with log_context(feed=item.feed_url, item=item.id):
+            logger.info("Processing: %s", item.title)
+            if not content:
+                REGISTRY.inc('items_processed_total', feed=feed, result='extract_failed')
+                logger.warning("Failed to extract content from %s", item.link, extra={'stage': 'extract'})
+                return False
         
-        if success:
-            # Mark as processed
-            self.state_manager.mark_processed(item.id)
-            print(f"    Successfully added to Google Doc")
+        written = self.state_manager.written_outputs(item.id)
+        waiting = {index for index, key in enumerate(self._sink_keys) if key not in written}
+        if not waiting:
+            # Every output wrote the item before the configuration changed
+            self.state_manager.mark_processed_many([item.id])
+            self._committed_count += 1
             return True
-        else:
-            print(f"    Failed to add to Google Doc")
-            return False
+        self._unacknowledged[item.id] = (item, waiting)
+        for index in sorted(waiting):
+            self._acknowledge(index, self.sinks[index].write(item.id, content))
+        return True
+    
+    def flush_sinks(self, due_only: bool = False):
+        """
+        Flush buffered output and mark acknowledged items processed.
+        
+        Args:
+            due_only: Only flush sinks whose oldest buffered item is past its
+                maximum delay
+        """
+        for index, sink in enumerate(self.sinks):
+            self._acknowledge(index, sink.flush_if_due() if due_only else sink.flush())
+    
+    def _acknowledge(self, sink_index: int, item_ids: List[str]):
+        """Record items written by a sink, committing those all sinks have written."""
+        committed = []
+        partial = []
+        for item_id in item_ids:
+            entry = self._unacknowledged.get(item_id)
+            if entry is None:
+                continue
+            item, waiting = entry
+            waiting.discard(sink_index)
+            if not waiting:
+                del self._unacknowledged[item_id]
+                committed.append(item_id)
+                REGISTRY.inc('items_processed_total', feed=item.feed_url or 'unknown', result='ok')
+            else:
+                partial.append(item_id)
+        if committed or partial:
+            # One state save per flush rather than per item; partial writes are
+            # saved so a retry only goes to the sinks that failed
+            self.state_manager.record_writes(self._sink_keys[sink_index], partial, committed)
+            self._committed_count += len(committed)
     
     def run_once(self) -> int:
         """
         Run the application once (process all feeds).
         
+        Returns:
+            Number of articles processed (0 if skipped because another
+            run holds the lock)
+        """
+        wait = self.config.on_overlap == 'wait'
+        lock_timeout = self.config.lock_timeout or None
+        try:
+            acquired = self.process_lock.acquire(wait=wait, timeout=lock_timeout)
+        except OSError as e:
+            REGISTRY.inc('cycles_skipped_total')
+            logger.error("Cannot open lock file %s: %s; skipping this run", self.config.lock_file, e)
+            return 0
+        if not acquired:
+            REGISTRY.inc('cycles_skipped_total')
+            logger.warning("Another run holds %s; skipping this run", self.config.lock_file)
+            return 0
+        
+        cycle_start = time.perf_counter()
+        try:
+            # Another process may have processed items since we last looked
+            self.state_manager.refresh()
+            if self.config.cycle_deadline:
+                self._deadline = time.monotonic() + self.config.cycle_deadline
+            with REGISTRY.time('cycle'):
+                processed_count = self._run_cycle()
+                REGISTRY.set_gauge('cycle_last_processed_items', processed_count)
+            if self.content_extractor.boilerplate:
+                self.content_extractor.boilerplate.save()
+        finally:
+            self._deadline = None
+            self.process_lock.release()
+        duration = time.perf_counter() - cycle_start
+        
+        REGISTRY.inc('cycles_total')
+        REGISTRY.set_gauge('cycle_duration_seconds', duration)
+        self.last_cycle_time = time.time()
+        REGISTRY.set_gauge('cycle_last_success_timestamp_seconds', self.last_cycle_time)
+        if duration > self.config.check_interval:
+            REGISTRY.inc('cycle_overruns_total')
+        
+        return processed_count
+    
+    def _run_cycle(self) -> int:
+        """
+        Process all feeds and append new articles.
+        
         Returns:
             Number of articles processed
         """
-        print("=" * 60)
-        print("RSS to NotebookLM - Processing feeds")
-        print("=" * 60)
+        logger.info("RSS to NotebookLM - Processing feeds")
         
         # Get document info
-        doc_info = self.drive_client.get_document_info()
-        if doc_info:
-            print(f"Target document: {doc_info['title']}")
-        print()
+        if self.drive_client:
+            doc_info = self.drive_client.get_document_info()
+            if doc_info:
+                logger.info("Target document: %s", doc_info['title'])
         
-        all_items = []
+        # Items carried over from a cycle cut short by the deadline go first
+        all_items = self.state_manager.get_unprocessed_items(self.pending_items)
+        self.pending_items = []
+        if all_items:
+            logger.info("%d items carried over from the previous cycle", len(all_items))
+        seen_ids = {item.id for item in all_items}
         
-        # Process each feed
-        for feed_config in self.config.feeds:
+        # Process each feed, starting where a deadline last cut polling short
+        feeds = self.config.feeds
+        offset = self._feed_offset % len(feeds)
+        self._feed_offset = 0
+        feed_items = []
+        for position, feed_config in enumerate(feeds[offset:] + feeds[:offset]):
+            if self._deadline_passed():
+                self._feed_offset = (offset + position) % len(feeds)
+                REGISTRY.inc('cycle_deadline_exceeded_total', stage='feeds')
+                logger.warning("Cycle deadline reached; %d feeds will be polled first next cycle",
+                               len(feeds) - position)
+                break
             items = self.process_feed(feed_config)
-            all_items.extend(items)
-            print()
+            feed_items.append((feed_config, [item for item in items if item.id not in seen_ids]))
+        
+        # Keep scheduling in config order even when polling started mid-list
+        config_order = {id(feed_config): index for index, feed_config in enumerate(feeds)}
+        feed_items.sort(key=lambda pair: config_order[id(pair[0])])
+        all_items.extend(self.scheduler.order(feed_items))
         
         # Process items
+        processed_count = self._process_items(all_items)
+        
+        logger.info("Processing complete. %d articles processed.", processed_count)
+        
+        return processed_count
+    
+    def _process_items(self, items: List[RSSItem]) -> int:
+        """
+        Extract items and write them to the outputs, respecting max_articles_per_run.
+        
+        Extraction runs on up to ``workers`` threads ahead of the writes,
+        which happen one at a time in the original item order. If the cycle
+        deadline passes, outstanding extractions are cancelled and every
+        item not yet written is carried over to the next cycle. Buffered
+        output is flushed before returning.
+        
+        Args:
+            items: Items to process, in order
+            
+        Returns:
+            Number of articles written to every output
+        """
+        self._committed_count = 0
         processed_count = 0
         max_items = self.config.max_articles_per_run
+        workers = max(1, self.config.workers)
+        pending = deque(items)
+        in_flight = deque()
+        executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
         
-        for item in all_items:
-            if max_items > 0 and processed_count >= max_items:
-                print(f"Reached maximum articles per run ({max_items})")
-                break
-            
-            if self.process_item(item):
-                processed_count += 1
-                # Small delay to avoid rate limiting
-                time.sleep(1)
+        try:
+            while pending or in_flight:
+                # Keep the workers busy without extracting more than the budget allows
+                while (pending and len(in_flight) < workers and not self._deadline_passed() and
+                       (max_items <= 0 or processed_count + len(in_flight) < max_items)):
+                    item = pending.popleft()
+                    in_flight.append((item, self._submit_extraction(executor, item)))
+                
+                if self._deadline_passed():
+                    break
+                
+                if not in_flight:
+                    logger.info("Reached maximum articles per run (%d)", max_items)
+                    break
+                
+                item, future = in_flight[0]
+                try:
+                    content = future.result(timeout=self._time_remaining())
+                except FutureTimeoutError:
+                    break
+                in_flight.popleft()
+                
+                if self.append_item(item, content):
+                    processed_count += 1
+                self.flush_sinks(due_only=True)
+        finally:
+            if executor:
+                # Running extractions finish within their (deadline-capped)
+                # timeout in the background; their results are discarded
+                executor.shutdown(wait=False, cancel_futures=True)
         
-        print()
-        print("=" * 60)
-        print(f"Processing complete. {processed_count} articles processed.")
-        print("=" * 60)
+        if self._deadline_passed() and (in_flight or pending):
+            self.pending_items = [item for item, _ in in_flight] + list(pending)
+            REGISTRY.inc('cycle_deadline_exceeded_total', stage='items')
+            logger.warning("Cycle deadline reached; carrying %d unfinished items over to the next cycle",
+                           len(self.pending_items))
         
-        return processed_count
+        # Finished items are written even if the deadline has passed
+        self.flush_sinks()
+        if self._unacknowledged:
+            for item, _ in self._unacknowledged.values():
+                REGISTRY.inc('items_processed_total', feed=item.feed_url or 'unknown', result='write_failed')
+            logger.error("%d articles could not be written and will be retried next run",
+                         len(self._unacknowledged), extra={'stage': 'sink_flush'})
+            self._unacknowledged = {}
+        
+        return self._committed_count
+    
+    def _time_remaining(self) -> Optional[float]:
+        """Seconds left before the cycle deadline, or None without a deadline."""
+        if self._deadline is None:
+            return None
+        return max(0.0, self._deadline - time.monotonic())
+    
+    def _request_timeout(self, timeout: float) -> float:
+        """Cap a request timeout so a single request never outlives the cycle deadline."""
+        remaining = self._time_remaining()
+        if remaining is None:
+            return timeout
+        return max(0.1, min(timeout, remaining))
     
-    def run_continuous(self):
-        """Run the application continuously, checking feeds periodically."""
-        print("Running in continuous mode...")
-        print(f"Check interval: {self.config.check_interval} seconds")
-        print("Press Ctrl+C to stop")
-        print()
+    def _deadline_passed(self) -> bool:
+        """Whether the current cycle's deadline has passed."""
+        return self._deadline is not None and time.monotonic() >= self._deadline
+    
+    def _submit_extraction(self, executor: Optional[ThreadPoolExecutor], item: RSSItem) -> Future:
+        """Start extracting an item, inline if there is no executor."""
+        if executor:
+            return executor.submit(self.extract_item, item)
+        future = Future()
+        future.set_result(self.extract_item(item))
+        return future
+    
+    def run_continuous(self, max_cycles: Optional[int] = None):
+        """
+        Run the application continuously, checking feeds periodically.
         
+        Args:
+            max_cycles: Stop after this many cycles (default: run until interrupted)
+        """
+        logger.info("Running in continuous mode...")
+        logger.info("Check interval: %s seconds", self.config.check_interval)
+        logger.info("Press Ctrl+C to stop")
+        
+        if self.config.metrics_port:
+            self.metrics_server = MetricsServer(
+                REGISTRY,
+                self.config.metrics_port,
+                self.config.metrics_host,
+                max_cycle_age=2 * self.config.check_interval
+            )
+            self.metrics_server.start()
+            logger.info("Serving metrics on http://%s:%d/metrics",
+                        self.config.metrics_host, self.metrics_server.port)
+        REGISTRY.set_gauge('check_interval_seconds', self.config.check_interval)
+        
+        cycles = 0
+        last_snapshot = time.monotonic()
         try:
+            # After a restart, keep to the schedule of the previous process
+            if self.restore_snapshot() and self.last_cycle_time:
+                elapsed = time.time() - self.last_cycle_time
+                if 0 <= elapsed < self.config.check_interval:
+                    logger.info("Next check in %.0f seconds (resuming previous schedule)",
+                                self.config.check_interval - elapsed)
+                    self._wait_for_next_cycle(time.monotonic() - elapsed)
+            
             while True:
-                self.run_once()
-                print(f"\nWaiting {self.config.check_interval} seconds until next check...\n")
-                time.sleep(self.config.check_interval)
+                if self.profiler:
+                    self.profiler.maybe_profile(self.run_once)
+                else:
+                    self.run_once()
+                cycles += 1
+                if (self.config.snapshot_interval and
+                        time.monotonic() - last_snapshot >= self.config.snapshot_interval):
+                    self.save_snapshot()
+                    last_snapshot = time.monotonic()
+                if max_cycles is not None and cycles >= max_cycles:
+                    break
+                logger.info("Waiting %s seconds until next check...", self.config.check_interval)
+                self._wait_for_next_cycle(time.monotonic())
         except KeyboardInterrupt:
-            print("\nStopping application...")
+            logger.info("Stopping application...")
+        finally:
+            self.save_snapshot()
+            if self.metrics_server:
+                self.metrics_server.stop()
+                self.metrics_server = None
+    
+    def save_snapshot(self):
+        """Save feed caches, carried-over items and cycle timing for a warm restart."""
+        if not self.snapshot_store:
+            return
+        feeds = {
+            url: {
+                'validators': self.rss_parser.validators.get(url, {}),
+                'items': [item.to_dict() for item in items],
+            }
+            for url, items in self.rss_parser.cached_items.items()
+        }
+        self.snapshot_store.save({
+            'saved_at': time.time(),
+            'last_cycle_time': self.last_cycle_time,
+            'feed_offset': self._feed_offset,
+            'feeds': feeds,
+            'pending_items': [item.to_dict() for item in self.pending_items],
+        })
+    
+    def restore_snapshot(self) -> bool:
+        """
+        Restore state saved by save_snapshot, if there is a snapshot.
+        
+        Feed validators and last-seen items let the first cycle revalidate
+        feeds with conditional GETs instead of downloading them in full.
+        Data for feeds no longer configured is ignored. A malformed snapshot
+        is ignored as a whole, which only means a cold start.
+        
+        Returns:
+            True if a snapshot was restored
+        """
+        data = self.snapshot_store.load() if self.snapshot_store else None
+        if not data:
+            return False
+        
+        urls = {feed.url for feed in self.config.feeds}
+        try:
+            validators = {}
+            cached_items = {}
+            for url, feed in data.get('feeds', {}).items():
+                if url in urls:
+                    validators[url] = dict(feed['validators'])
+                    cached_items[url] = [RSSItem.from_dict(item) for item in feed['items']]
+            pending = [RSSItem.from_dict(item) for item in data.get('pending_items', [])]
+            feed_offset = int(data.get('feed_offset', 0))
+            last_cycle_time = data.get('last_cycle_time')
+            if last_cycle_time is not None:
+                last_cycle_time = float(last_cycle_time)
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            REGISTRY.inc('snapshot_errors_total', operation='restore')
+            logger.warning("Ignoring malformed snapshot: %r", e)
+            return False
+        
+        self.rss_parser.validators.update(validators)
+        self.rss_parser.cached_items.update(cached_items)
+        self.pending_items = [item for item in pending
+                              if item.feed_url is None or item.feed_url in urls]
+        self._feed_offset = feed_offset
+        self.last_cycle_time = last_cycle_time
+        
+        REGISTRY.inc('snapshot_restores_total')
+        logger.info("Restored snapshot: %d feeds, %d carried-over items", len(validators), len(self.pending_items))
+        return True
+    
+    def _wait_for_next_cycle(self, cycle_end: float):
+        """
+        Sleep until the next cycle is due, applying configuration changes meanwhile.
+        
+        Args:
+            cycle_end: time.monotonic() when the last cycle finished
+        """
+        while True:
+            remaining = cycle_end + self.config.check_interval - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(min(remaining, self.config_poll_interval))
+            self.reload_config()
+    
+    def _read_config_signature(self):
+        """Get the config file's (mtime, size), or None if it cannot be read."""
+        try:
+            stat = self.config.config_path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    def reload_config(self) -> bool:
+        """
+        Reload the configuration file if it changed since it was last loaded.
+        
+        The new configuration is fully validated before anything is changed;
+        if it is invalid the current configuration stays in effect.
+        
+        Returns:
+            True if a new configuration was applied
+        """
+        signature = self._read_config_signature()
+        if signature is None or signature == self._config_signature:
+            return False
+        self._config_signature = signature
+        
+        try:
+            new_config = AppConfig(str(self.config.config_path))
+        except Exception as e:
+            REGISTRY.inc('config_reloads_total', result='invalid')
+            logger.error("Configuration change ignored, keeping current configuration: %s", e)
+            return False
+        
+        self.apply_config(new_config)
+        REGISTRY.inc('config_reloads_total', result='applied')
+        return True
+    
+    def apply_config(self, new_config: AppConfig):
+        """
+        Switch to a new configuration without a restart.
+        
+        HTTP sessions, Google credentials, loaded state and per-feed caches
+        are kept. Settings that need a restart keep their current values.
+        
+        Args:
+            new_config: Validated configuration to apply
+        """
+        old_config = self.config
+        
+        # Settings tied to resources created at startup
+        for name in ('credentials_file', 'state_file', 'lock_file', 'metrics_port', 'metrics_host',
+                     'boilerplate_enabled', 'boilerplate_file', 'outputs', 'snapshot_file',
+                     'log_format', 'log_repeat_limit', 'log_repeat_window'):
+            if getattr(new_config, name) != getattr(old_config, name):
+                logger.warning("Configuration: changing '%s' requires a restart; keeping current value", name)
+                setattr(new_config, name, getattr(old_config, name))
+        
+        if self.drive_client and new_config.document_id != old_config.document_id:
+            logger.info("Configuration: target document changed to %s", new_config.document_id)
+            self.drive_client.document_id = new_config.document_id
+        
+        old_urls = {feed.url for feed in old_config.feeds}
+        new_urls = {feed.url for feed in new_config.feeds}
+        for url in sorted(new_urls - old_urls):
+            logger.info("Configuration: added feed %s", url)
+        for url in sorted(old_urls - new_urls):
+            logger.info("Configuration: removed feed %s", url)
+            self.rss_parser.validators.pop(url, None)
+            self.rss_parser.cached_items.pop(url, None)
+        
+        # Carried-over items from removed feeds are dropped
+        self.pending_items = [item for item in self.pending_items
+                              if item.feed_url is None or item.feed_url in new_urls]
+        
+        if new_config.log_level != old_config.log_level:
+            logger.info("Configuration: log level changed to %s", new_config.log_level)
+            logging.getLogger().setLevel(new_config.log_level)
+        
+        self.config = new_config
+        for sink in self.sinks:
+            if isinstance(sink, GoogleDocsSink):
+                sink.min_interval = new_config.request_delay
+        self.scheduler = ItemScheduler(new_config.scheduling, new_config.newest_first)
+        self.content_extractor.max_bytes = new_config.extraction_max_bytes
+        self.content_extractor.max_pdf_bytes = new_config.extraction_max_pdf_bytes
+        self.content_extractor.max_pdf_pages = new_config.extraction_max_pdf_pages
+        if self.content_extractor.boilerplate:
+            self.content_extractor.boilerplate.min_articles = new_config.boilerplate_min_articles
+            self.content_extractor.boilerplate.threshold = new_config.boilerplate_threshold
+        REGISTRY.set_gauge('check_interval_seconds', new_config.check_interval)
+        if self.metrics_server:
+            self.metrics_server.max_cycle_age = 2 * new_config.check_interval
+        logger.info("Configuration reloaded")
@@ -0,0 +1,161 @@
+"""Per-site detection of repeated boilerplate text blocks."""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List
+from urllib.parse import urlparse
+from .metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+
+class BoilerplateModel:
+    """
+    Learns which text blocks repeat across articles from the same site.
+    
+    A block is the text of one block-level element, such as a paragraph,
+    list item or heading, so a common word inside a sentence is never
+    matched on its own. For each domain the model counts, per hashed and
+    normalised block, the number of articles it appeared in. Once a domain
+    has enough articles, blocks found in at least ``threshold`` of them
+    (cookie banners, related links, subscription prompts) are dropped from
+    new articles. Blocks shorter than ``min_block_length`` are always kept.
+    """
+    
+    def __init__(self, model_file: str = ".boilerplate.json", min_articles: int = 5,
+                 threshold: float = 0.5, max_blocks_per_domain: int = 5000,
+                 max_domains: int = 500, window: int = 1000, min_block_length: int = 10):
+        """
+        Initialize boilerplate model.
+        
+        Args:
+            model_file: Path the model is persisted to
+            min_articles: Articles seen from a domain before filtering starts
+            threshold: Fraction of a domain's articles a block must appear in
+                to count as boilerplate
+            max_blocks_per_domain: Maximum block hashes kept per domain
+            max_domains: Maximum domains kept (least recently seen are dropped)
+            window: Article count after which a domain's counts are halved,
+                so the model follows site redesigns
+            min_block_length: Shortest block, in characters, that is learned
+                and can be dropped
+        """
+        self.model_file = Path(model_file)
+        self.min_articles = min_articles
+        self.threshold = threshold
+        self.max_blocks_per_domain = max_blocks_per_domain
+        self.max_domains = max_domains
+        self.window = window
+        self.min_block_length = min_block_length
+        self.domains: Dict[str, dict] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._load()
+    
+    def _load(self):
+        """Load the model from file."""
+        if not self.model_file.exists():
+            return
+        try:
+            with open(self.model_file, 'r') as f:
+                self.domains = json.load(f).get('domains', {})
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning("Could not load boilerplate model: %s", e)
+            self.domains = {}
+    
+    def save(self):
+        """Save the model to file if it changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = json.dumps({'domains': self.domains})
+            self._dirty = False
+        try:
+            temp_file = self.model_file.with_name(self.model_file.name + '.tmp')
+            with open(temp_file, 'w') as f:
+                f.write(data)
+            os.replace(temp_file, self.model_file)
+        except IOError as e:
+            logger.warning("Could not save boilerplate model: %s", e)
+    
+    @staticmethod
+    def fingerprint(block: str) -> str:
+        """Hash a text block after normalising case and whitespace."""
+        normalized = re.sub(r'\s+', ' ', block).strip().lower()
+        return hashlib.blake2b(normalized.encode('utf-8'), digest_size=8).hexdigest()
+    
+    def filter_blocks(self, url: str, blocks: List[str]) -> List[str]:
+        """
+        Drop known boilerplate blocks from an article and learn from it.
+        
+        Args:
+            url: Article URL (its domain selects the model)
+            blocks: Text of the article's block-level elements, in order
+        
+        Returns:
+            Blocks that are not boilerplate (all blocks if every one would
+            be dropped)
+        """
+        domain = urlparse(url).netloc.lower()
+        if not domain or not blocks:
+            return blocks
+        # Short blocks are too generic to tell boilerplate from article text
+        hashes = [self.fingerprint(block) if len(block.strip()) >= self.min_block_length else None
+                  for block in blocks]
+        
+        with self._lock:
+            stats = self.domains.get(domain)
+            if stats is None:
+                stats = self.domains[domain] = {'articles': 0, 'blocks': {}, 'last_seen': 0}
+            articles = stats['articles']
+            counts = stats['blocks']
+            
+            kept = blocks
+            if articles >= self.min_articles:
+                limit = self.threshold * articles
+                kept = [block for block, h in zip(blocks, hashes)
+                        if h is None or counts.get(h, 0) < limit]
+                if not kept:
+                    kept = blocks
+            
+            # Learn from this article: one count per distinct block
+            stats['articles'] = articles + 1
+            stats['last_seen'] = time.time()
+            for h in set(hashes) - {None}:
+                counts[h] = counts.get(h, 0) + 1
+            self._prune(domain, stats)
+            self._dirty = True
+        
+        dropped = sum(len(block) for block in blocks) - sum(len(block) for block in kept)
+        if dropped:
+            REGISTRY.inc('boilerplate_bytes_dropped_total', dropped)
+            REGISTRY.inc('boilerplate_blocks_dropped_total', len(blocks) - len(kept))
+        return kept
+    
+    def _prune(self, domain: str, stats: dict):
+        """Keep the model within its size bounds. Caller holds the lock."""
+        counts = stats['blocks']
+        
+        # Halve counts once the window is full so old layouts fade out
+        if stats['articles'] >= self.window:
+            stats['articles'] //= 2
+            for h in list(counts):
+                counts[h] //= 2
+                if not counts[h]:
+                    del counts[h]
+        
+        # Drop the rarest blocks, which are article text rather than boilerplate
+        if len(counts) > self.max_blocks_per_domain:
+            keep = sorted(counts, key=counts.get, reverse=True)[:self.max_blocks_per_domain // 2]
+            stats['blocks'] = {h: counts[h] for h in keep}
+        
+        if len(self.domains) > self.max_domains:
+            oldest = min((d for d in self.domains if d != domain),
+                         key=lambda d: self.domains[d]['last_seen'])
+            del self.domains[oldest]
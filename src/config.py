@@ -8,9 +8,14 @@ from typing import List, Dict, Optional
 class FeedConfig:
     """Configuration for a single RSS feed."""
     
-    def __init__(self, url: str, filter_text: Optional[str] = None):
+    def __init__(self, url: str, filter_text: Optional[str] = None,
+                 weight: float = 1.0, max_items: int = 0):
         self.url = url
         self.filter_text = filter_text
+        # Share of the per-run article budget under weighted scheduling
+        self.weight = weight
+        # Maximum new items taken from this feed per run (0 = unlimited)
+        self.max_items = max_items
     
     def matches_filter(self, text: str) -> bool:
         """Check if text matches the filter (case-insensitive)."""
@@ -19,6 +24,21 @@ class FeedConfig:
         return self.filter_text.lower() in text.lower()
 
 
+class OutputConfig:
+    """Configuration for a single output sink."""
+    
+    TYPES = ('google_docs', 'file', 'null')
+    
+    def __init__(self, type: str, options: Optional[Dict] = None):
+        self.type = type
+        # Sink-specific settings (buffer limits, file directory, ...)
+        self.options = options or {}
+    
+    def __eq__(self, other) -> bool:
+        return (isinstance(other, OutputConfig) and
+                self.type == other.type and self.options == other.options)
+
+
 class AppConfig:
     """Application configuration."""
     
@@ -42,7 +62,19 @@ class AppConfig:
         self.credentials_file = google_drive.get('credentials_file', 'credentials.json')
         self.document_id = google_drive.get('document_id')
         
-        if not self.document_id:
+        # Output sinks (default: append to the Google Doc)
+        outputs_data = config_data.get('outputs') or [{'type': 'google_docs'}]
+        self.outputs: List[OutputConfig] = []
+        for output_data in outputs_data:
+            options = dict(output_data)
+            output_type = options.pop('type', None)
+            if output_type not in OutputConfig.TYPES:
+                raise ValueError(f"Each output must have a 'type' of {', '.join(OutputConfig.TYPES)}")
+            if output_type == 'file' and not options.get('directory'):
+                raise ValueError("File outputs must have a 'directory' field")
+            self.outputs.append(OutputConfig(output_type, options))
+        
+        if not self.document_id and any(output.type == 'google_docs' for output in self.outputs):
             raise ValueError("google_drive.document_id must be specified in config.yaml")
         
         # Feed configurations
@@ -53,7 +85,13 @@ class AppConfig:
             if not url:
                 raise ValueError("Each feed must have a 'url' field")
             filter_text = feed_data.get('filter')
-            self.feeds.append(FeedConfig(url, filter_text))
+            weight = feed_data.get('weight', 1.0)
+            if not isinstance(weight, (int, float)) or weight <= 0:
+                raise ValueError(f"Feed 'weight' must be a positive number: {url}")
+            max_items = feed_data.get('max_items', 0)
+            if not isinstance(max_items, int) or isinstance(max_items, bool) or max_items < 0:
+                raise ValueError(f"Feed 'max_items' must be a non-negative integer: {url}")
+            self.feeds.append(FeedConfig(url, filter_text, weight, max_items))
         
         if not self.feeds:
             raise ValueError("At least one feed must be configured")
@@ -63,3 +101,53 @@ class AppConfig:
         self.check_interval = settings.get('check_interval', 3600)
         self.state_file = Path(settings.get('state_file', '.rss_state.json'))
         self.max_articles_per_run = settings.get('max_articles_per_run', 0)
+        self.scheduling = settings.get('scheduling', 'fifo')
+        if self.scheduling not in ('fifo', 'round_robin', 'weighted'):
+            raise ValueError("settings.scheduling must be 'fifo', 'round_robin' or 'weighted'")
+        self.newest_first = settings.get('newest_first', False)
+        self.workers = settings.get('workers', 1)
+        self.request_delay = settings.get('request_delay', 1)
+        
+        # Cycle time budget (0 = none) and overlapping-run handling
+        self.cycle_deadline = settings.get('cycle_deadline', 0)
+        self.lock_file = Path(settings.get('lock_file', f"{self.state_file}.lock"))
+        self.on_overlap = settings.get('on_overlap', 'skip')
+        if self.on_overlap not in ('skip', 'wait'):
+            raise ValueError("settings.on_overlap must be 'skip' or 'wait'")
+        self.lock_timeout = settings.get('lock_timeout', 0)
+        
+        # Warm-start snapshot of feed caches and carried-over items ("" = disabled)
+        snapshot_file = settings.get('snapshot_file', f"{self.state_file}.snapshot.gz")
+        self.snapshot_file = Path(snapshot_file) if snapshot_file else None
+        self.snapshot_interval = settings.get('snapshot_interval', 300)
+        
+        # Site boilerplate detection
+        boilerplate = config_data.get('boilerplate', {})
+        self.boilerplate_enabled = boilerplate.get('enabled', True)
+        self.boilerplate_file = Path(boilerplate.get('file', f"{self.state_file}.boilerplate.json"))
+        self.boilerplate_min_articles = boilerplate.get('min_articles', 5)
+        self.boilerplate_threshold = boilerplate.get('threshold', 0.5)
+        if not 0 < self.boilerplate_threshold <= 1:
+            raise ValueError("boilerplate.threshold must be between 0 and 1")
+        
+        # Article download limits
+        extraction = config_data.get('extraction', {})
+        self.extraction_max_bytes = extraction.get('max_bytes', 5000000)
+        self.extraction_max_pdf_bytes = extraction.get('max_pdf_bytes', 20000000)
+        self.extraction_max_pdf_pages = extraction.get('max_pdf_pages', 50)
+        
+        # Log output
+        logging_config = config_data.get('logging', {})
+        self.log_level = str(logging_config.get('level', 'INFO')).upper()
+        if self.log_level not in ('DEBUG', 'INFO', 'WARNING', 'ERROR'):
+            raise ValueError("logging.level must be DEBUG, INFO, WARNING or ERROR")
+        self.log_format = logging_config.get('format', 'text')
+        if self.log_format not in ('text', 'json'):
+            raise ValueError("logging.format must be 'text' or 'json'")
+        self.log_repeat_limit = logging_config.get('repeat_limit', 5)
+        self.log_repeat_window = logging_config.get('repeat_window', 60)
+        
+        # Metrics endpoint (0 = disabled)
+        metrics = config_data.get('metrics', {})
+        self.metrics_port = metrics.get('port', 0)
+        self.metrics_host = metrics.get('host', '0.0.0.0')
@@ -1,86 +1,367 @@
 """Extract content from web pages."""
 
+import logging
+import re
 import requests
 from bs4 import BeautifulSoup
-from typing import Optional
+from tempfile import SpooledTemporaryFile
+from typing import Iterator, List, Optional
 import time
+from .metrics import REGISTRY
+from .boilerplate import BoilerplateModel
+
+try:
+    from pypdf import PdfReader
+except ImportError:  # PDF extraction is optional
+    PdfReader = None
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+HTML_TYPES = ('text/html', 'application/xhtml+xml')
+PDF_TYPES = ('application/pdf', 'application/x-pdf')
+# Readable text that is extracted whole when it is not sniffed as HTML
+TEXT_TYPES = ('text/plain', 'text/xml', 'application/xml')
+# Elements whose text forms one block for boilerplate detection
+BLOCK_TAGS = frozenset((
+    'p', 'li', 'dt', 'dd', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'div', 'section', 'blockquote',
+    'pre', 'figcaption', 'td', 'th', 'caption', 'table', 'ul', 'ol', 'dl', 'form', 'article', 'main',
+    'body',
+))
+
+
+class _MainContentScanner:
+    """
+    Watches streamed HTML for the end of the element holding the article.
+    
+    Extraction prefers the first <main> element over any <article>, so the
+    page is complete enough to extract once a <main> has been closed. An
+    <article> is only extracted when the page has no <main>, which is not
+    known until the body ends, so pages without a <main> are downloaded
+    up to </body>. A <main> inside the header, nav, aside and footer
+    elements that extraction removes does not count. Only the tags that
+    matter are scanned for (skipping scripts, styles and comments), which
+    is much cheaper than tokenising the whole page.
+    """
+    
+    TOKEN = re.compile(r'<(/?)(main|body|header|nav|aside|footer)(?=[\s>/])'
+                       r'|<(script|style)(?=[\s>/])|<!--')
+    # Longest token plus the character after it, kept across chunk boundaries
+    TAIL = 12
+    # Elements removed before extraction (see ContentExtractor._extract_blocks)
+    REMOVED = ('header', 'nav', 'aside', 'footer')
+    
+    def __init__(self):
+        self.main_depth = 0
+        self.removed_depth = 0
+        self.complete = False
+        self._pending = ''
+        # End marker of the script, style or comment being skipped
+        self._closing: Optional[str] = None
+    
+    def feed(self, text: str):
+        """Scan the next piece of the document."""
+        text = self._pending + text.lower()
+        pos = 0
+        while not self.complete:
+            if self._closing:
+                end = text.find(self._closing, pos)
+                if end < 0:
+                    pos = max(pos, len(text) - len(self._closing))
+                    break
+                pos = end + len(self._closing)
+                self._closing = None
+                continue
+            
+            match = self.TOKEN.search(text, pos)
+            if not match:
+                pos = max(pos, len(text) - self.TAIL)
+                break
+            pos = match.end()
+            if match.group(0) == '<!--':
+                self._closing = '-->'
+            elif match.group(3):
+                self._closing = '</' + match.group(3)
+            elif match.group(2) in self.REMOVED:
+                if not match.group(1):
+                    self.removed_depth += 1
+                elif self.removed_depth:
+                    self.removed_depth -= 1
+            elif self.removed_depth:
+                continue
+            elif match.group(2) == 'body':
+                self.complete = bool(match.group(1))
+            elif not match.group(1):
+                self.main_depth += 1
+            elif self.main_depth:
+                self.main_depth -= 1
+                self.complete = not self.main_depth
+        self._pending = text[pos:]
 
 
 class ContentExtractor:
     """Extract main content from web pages."""
     
-    def __init__(self, timeout: int = 30):
+    def __init__(self, timeout: int = 30, boilerplate: Optional[BoilerplateModel] = None,
+                 max_bytes: int = 5000000, max_pdf_bytes: int = 20000000, max_pdf_pages: int = 50):
         """
         Initialize content extractor.
         
         Args:
-            timeout: Request timeout in seconds
+            timeout: Request timeout in seconds (also caps the total download time)
+            boilerplate: Optional model used to drop text repeated across a site's articles
+            max_bytes: Maximum bytes of HTML downloaded per article (longer
+                pages are truncated), and of text extracted from a PDF
+            max_pdf_bytes: Maximum size of a PDF (larger PDFs are skipped)
+            max_pdf_pages: Maximum pages of a PDF extracted
         """
         self.timeout = timeout
+        self.boilerplate = boilerplate
+        self.max_bytes = max_bytes
+        self.max_pdf_bytes = max_pdf_bytes
+        self.max_pdf_pages = max_pdf_pages
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
     
-    def extract_content(self, url: str) -> Optional[str]:
+    def extract_content(self, url: str, timeout: Optional[float] = None) -> Optional[str]:
         """
-        Extract main content from a web page.
+        Extract main content from a web page or PDF.
+        
+        The response is streamed: HTML is downloaded only until the main
+        content is complete or ``max_bytes`` is reached, plain text and XML
+        up to ``max_bytes``, PDFs are spooled to disk once large, and other
+        content types are skipped after the first chunk.
         
         Args:
             url: URL of the web page
+            timeout: Request timeout in seconds (default: the extractor's timeout)
             
         Returns:
             Extracted content as plain text, or None if extraction fails
         """
+        timeout = timeout or self.timeout
         try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Remove script and style elements
-            for script in soup(["script", "style", "nav", "header", "footer", "aside"]):
-                script.decompose()
+            with REGISTRY.time('article_fetch'):
+                response = self.session.get(url, timeout=timeout, stream=True)
+            with response:
+                REGISTRY.inc('article_fetch_total', status=response.status_code)
+                response.raise_for_status()
+                
+                chunks = response.iter_content(CHUNK_SIZE)
+                first = next(chunks, b'')
+                content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+                kind = self._content_kind(content_type, first)
+                deadline = time.monotonic() + timeout
+                
+                if kind in ('html', 'text'):
+                    with REGISTRY.time('article_download'):
+                        html = self._read_html(first, chunks, deadline, stop_early=kind == 'html')
+                    with REGISTRY.time('extract'):
+                        blocks = self._extract_blocks(html)
+                    if self.boilerplate and kind == 'html':
+                        with REGISTRY.time('boilerplate_filter'):
+                            blocks = self.boilerplate.filter_blocks(url, blocks)
+                    # One paragraph per line of text, as before blocks were grouped
+                    blocks = [line for block in blocks for line in block.split('\n')]
+                elif kind == 'pdf':
+                    blocks = self._extract_pdf(url, response, first, chunks, deadline)
+                    if blocks is None:
+                        return None
+                else:
+                    REGISTRY.inc('extract_errors_total', reason='unsupported_type')
+                    logger.info("Skipping %s: unsupported content type '%s'", url, content_type or 'unknown',
+                                extra={'stage': 'extract'})
+                    return None
             
-            # Try to find main content areas
-            main_content = (
-                soup.find('main') or
-                soup.find('article') or
-                soup.find('div', class_=lambda x: x and ('content' in x.lower() or 'article' in x.lower() or 'post' in x.lower())) or
-                soup.find('body')
-            )
-            
-            if main_content:
-                # Get text and clean it up
-                text = main_content.get_text(separator='\n', strip=True)
-                # Remove excessive whitespace
-                lines = [line.strip() for line in text.split('\n') if line.strip()]
-                return '\n\n'.join(lines)
-            else:
-                # Fallback to body text
-                text = soup.get_text(separator='\n', strip=True)
-                lines = [line.strip() for line in text.split('\n') if line.strip()]
-                return '\n\n'.join(lines)
+            content = '\n\n'.join(blocks)
+            REGISTRY.inc('extracted_bytes_total', len(content))
+            return content
         
         except requests.RequestException as e:
-            print(f"Error fetching {url}: {e}")
+            REGISTRY.inc('extract_errors_total', reason='fetch')
+            logger.warning("Error fetching %s: %s", url, e, extra={'stage': 'article_fetch'})
             return None
         except Exception as e:
-            print(f"Error extracting content from {url}: {e}")
+            REGISTRY.inc('extract_errors_total', reason='parse')
+            logger.warning("Error extracting content from %s: %s", url, e, extra={'stage': 'extract'})
+            return None
+    
+    @staticmethod
+    def _content_kind(content_type: str, head: bytes) -> str:
+        """
+        Classify a response as 'html', 'pdf', 'text' or 'other'.
+        
+        Args:
+            content_type: Media type from the Content-Type header (may be empty)
+            head: First bytes of the body, sniffed when the header is missing,
+                generic or a text type
+        """
+        if content_type in PDF_TYPES or head.startswith(b'%PDF-'):
+            return 'pdf'
+        if content_type in HTML_TYPES:
+            return 'html'
+        if content_type in ('', 'application/octet-stream') + TEXT_TYPES:
+            start = head.lstrip()[:512].lower()
+            # XHTML may start with an XML declaration before <html>
+            if start.startswith(b'<!doctype html') or b'<html' in start or b'<body' in start:
+                return 'html'
+        if content_type in TEXT_TYPES:
+            return 'text'
+        return 'other'
+    
+    def _read_html(self, first: bytes, chunks: Iterator[bytes], deadline: float,
+                   stop_early: bool = True) -> bytes:
+        """
+        Download HTML until its main content is complete or a limit is reached.
+        
+        Args:
+            first: First chunk of the body
+            chunks: Remaining body chunks
+            deadline: time.monotonic() after which downloading stops
+            stop_early: Whether to stop once the main content is complete;
+                plain text is read up to the limits
+            
+        Returns:
+            HTML downloaded so far
+        """
+        scanner = _MainContentScanner()
+        parts = []
+        size = 0
+        chunk = first
+        while chunk:
+            parts.append(chunk)
+            size += len(chunk)
+            # Tag names are ASCII, so any ASCII-compatible charset scans correctly
+            if stop_early:
+                scanner.feed(chunk.decode('latin-1'))
+            if scanner.complete:
+                REGISTRY.inc('article_early_stops_total')
+                break
+            if size >= self.max_bytes or time.monotonic() >= deadline:
+                REGISTRY.inc('article_truncated_total')
+                break
+            chunk = next(chunks, b'')
+        REGISTRY.inc('article_bytes_total', size)
+        return b''.join(parts)[:self.max_bytes]
+    
+    def _extract_pdf(self, url: str, response: requests.Response, first: bytes,
+                     chunks: Iterator[bytes], deadline: float) -> Optional[List[str]]:
+        """
+        Download a PDF to a spooled temporary file and extract its text.
+        
+        Args:
+            url: URL of the PDF
+            response: Streaming response
+            first: First chunk of the body
+            chunks: Remaining body chunks
+            deadline: time.monotonic() after which the download is abandoned
+            
+        Returns:
+            Lines of text from the first ``max_pdf_pages`` pages, or None if
+            the PDF is skipped
+        """
+        if PdfReader is None:
+            REGISTRY.inc('extract_errors_total', reason='pdf_unsupported')
+            logger.warning("Skipping PDF %s: install pypdf to extract PDFs", url, extra={'stage': 'extract'})
             return None
+        
+        length = response.headers.get('Content-Length', '')
+        if length.isdigit() and int(length) > self.max_pdf_bytes:
+            REGISTRY.inc('extract_errors_total', reason='too_large')
+            logger.info("Skipping PDF %s: %s bytes exceeds the %d byte limit", url, length,
+                        self.max_pdf_bytes, extra={'stage': 'extract'})
+            return None
+        
+        # Small PDFs stay in memory, larger ones go to disk
+        with SpooledTemporaryFile(max_size=1024 * 1024) as pdf_file:
+            with REGISTRY.time('article_download'):
+                size = 0
+                chunk = first
+                while chunk:
+                    size += len(chunk)
+                    if size > self.max_pdf_bytes or time.monotonic() >= deadline:
+                        REGISTRY.inc('extract_errors_total', reason='too_large')
+                        logger.info("Skipping PDF %s: exceeds the size or time limit", url,
+                                    extra={'stage': 'article_download'})
+                        return None
+                    pdf_file.write(chunk)
+                    chunk = next(chunks, b'')
+            REGISTRY.inc('article_bytes_total', size)
+            
+            with REGISTRY.time('extract_pdf'):
+                pdf_file.seek(0)
+                reader = PdfReader(pdf_file)
+                blocks = []
+                text_size = 0
+                for page in reader.pages[:self.max_pdf_pages]:
+                    lines = [line.strip() for line in (page.extract_text() or '').splitlines()]
+                    blocks.extend(line for line in lines if line)
+                    text_size += sum(len(line) for line in lines)
+                    if text_size >= self.max_bytes:
+                        break
+        return blocks
+    
+    def _extract_blocks(self, html: bytes) -> List[str]:
+        """
+        Extract the main text content from an HTML document.
+        
+        Args:
+            html: Raw HTML content
+            
+        Returns:
+            Text of each block-level element, in document order, with one
+            line per line of text
+        """
+        soup = BeautifulSoup(html, 'html.parser')
+        
+        # Remove script and style elements
+        for script in soup(["script", "style", "nav", "header", "footer", "aside"]):
+            script.decompose()
+        
+        # Try to find main content areas
+        main_content = (
+            soup.find('main') or
+            soup.find('article') or
+            soup.find('div', class_=lambda x: x and ('content' in x.lower() or 'article' in x.lower() or 'post' in x.lower())) or
+            soup.find('body')
+        )
+        
+        # Fallback to the whole document
+        root = main_content or soup
+        blocks = []
+        current = None
+        for string in root.strings:
+            lines = [line.strip() for line in string.split('\n') if line.strip()]
+            if not lines:
+                continue
+            # Group text by its nearest block-level element, so inline links
+            # and emphasis stay part of their paragraph
+            block = string.parent
+            while block is not root and block.name not in BLOCK_TAGS:
+                block = block.parent
+            if block is current:
+                blocks[-1].extend(lines)
+            else:
+                blocks.append(lines)
+                current = block
+        return ['\n'.join(lines) for lines in blocks]
     
-    def extract_with_metadata(self, url: str, title: str) -> Optional[str]:
+    def extract_with_metadata(self, url: str, title: str,
+                              timeout: Optional[float] = None) -> Optional[str]:
         """
         Extract content and format it with metadata.
         
         Args:
             url: URL of the web page
             title: Title of the article
+            timeout: Request timeout in seconds (default: the extractor's timeout)
             
         Returns:
             Formatted content with title and URL, or None if extraction fails
         """
-        content = self.extract_content(url)
+        content = self.extract_content(url, timeout)
         if not content:
             return None
         
@@ -1,5 +1,6 @@
 """Google Drive API client for appending content to Google Docs."""
 
+import logging
 import os
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
@@ -9,12 +10,22 @@ from googleapiclient.errors import HttpError
 import pickle
 from typing import Optional
 from pathlib import Path
+from .metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
 
 
 # Scopes required for Google Docs API
 SCOPES = ['https://www.googleapis.com/auth/documents']
 
 
+def _error_status(error: Exception) -> str:
+    """Get the HTTP status of an API error for metrics labelling."""
+    if isinstance(error, HttpError):
+        return str(error.resp.status)
+    return 'unknown'
+
+
 class GoogleDriveClient:
     """Client for interacting with Google Docs API."""
     
@@ -29,7 +40,11 @@ class GoogleDriveClient:
         self.credentials_file = Path(credentials_file)
         self.document_id = document_id
         self.service = None
-        self._authenticate()
+        with REGISTRY.time('docs_auth'):
+            self._authenticate()
+        # Building the documents resource generates method docstrings from the
+        # discovery document, which costs tens of milliseconds, so do it once
+        self.documents = self.service.documents()
     
     def _authenticate(self):
         """Authenticate with Google API and build service."""
@@ -73,7 +88,9 @@ class GoogleDriveClient:
         """
         try:
             # Get the current document to find the end index
-            doc = self.service.documents().get(documentId=self.document_id).execute()
+            with REGISTRY.time('docs_get'):
+                doc = self.documents.get(documentId=self.document_id).execute()
+            REGISTRY.inc('docs_api_calls_total', method='get')
             end_index = doc['body']['content'][-1]['endIndex'] - 1
             
             # Prepare the request to insert text
@@ -87,18 +104,24 @@ class GoogleDriveClient:
             }]
             
             # Execute the request
-            self.service.documents().batchUpdate(
-                documentId=self.document_id,
-                body={'requests': requests}
-            ).execute()
+            with REGISTRY.time('docs_batch_update'):
+                self.documents.batchUpdate(
+                    documentId=self.document_id,
+                    body={'requests': requests}
+                ).execute()
+            REGISTRY.inc('docs_api_calls_total', method='batchUpdate')
+            REGISTRY.inc('docs_bytes_written_total', len(content.encode('utf-8')))
             
             return True
         
         except HttpError as e:
-            print(f"Error appending to Google Doc: {e}")
+            REGISTRY.inc('docs_api_errors_total', status=_error_status(e))
+            logger.error("Error appending to Google Doc: %s", e, extra={'stage': 'docs_append'})
             return False
         except Exception as e:
-            print(f"Unexpected error: {e}")
+            REGISTRY.inc('docs_api_errors_total', status=_error_status(e))
+            logger.exception("Unexpected error appending to Google Doc: %s", e,
+                             extra={'stage': 'docs_append'})
             return False
     
     def get_document_info(self) -> Optional[dict]:
@@ -109,11 +132,14 @@ class GoogleDriveClient:
             Document metadata or None if error
         """
         try:
-            doc = self.service.documents().get(documentId=self.document_id).execute()
+            with REGISTRY.time('docs_get'):
+                doc = self.documents.get(documentId=self.document_id).execute()
+            REGISTRY.inc('docs_api_calls_total', method='get')
             return {
                 'title': doc.get('title', 'Unknown'),
                 'document_id': self.document_id
             }
         except Exception as e:
-            print(f"Error getting document info: {e}")
+            REGISTRY.inc('docs_api_errors_total', status=_error_status(e))
+            logger.error("Error getting document info: %s", e, extra={'stage': 'docs_get'})
             return None
@@ -0,0 +1,197 @@
+"""Non-blocking, structured logging for the application."""
+
+import contextlib
+import contextvars
+import json
+import logging
+import queue
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional, TextIO, Tuple
+from .metrics import REGISTRY
+
+# Structured fields copied into JSON output when set on a record
+FIELDS = ('feed', 'item', 'stage')
+
+_context: contextvars.ContextVar[Dict[str, str]] = contextvars.ContextVar('log_context', default={})
+_listener: Optional[QueueListener] = None
+_handler: Optional[logging.Handler] = None
+
+
+@contextlib.contextmanager
+def log_context(**fields):
+    """
+    Attach structured fields to every record logged in this context.
+    
+    Fields passed explicitly with ``extra`` take precedence.
+    
+    Args:
+        **fields: Field values, e.g. feed=url, item=item_id
+    """
+    token = _context.set({**_context.get(), **fields})
+    try:
+        yield
+    finally:
+        _context.reset(token)
+
+
+class ContextFilter(logging.Filter):
+    """Copies fields from log_context onto records."""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        for name, value in _context.get().items():
+            if not hasattr(record, name):
+                setattr(record, name, value)
+        return True
+
+
+class RepeatFilter(logging.Filter):
+    """
+    Rate-limits repeated warnings and errors.
+    
+    Records are grouped by logger and message template, so "Error fetching
+    %s" for a thousand URLs counts as one message. At most ``limit``
+    records per group pass in each ``window`` seconds; the first record
+    after a window with suppressed records carries the suppressed count.
+    """
+    
+    def __init__(self, limit: int = 5, window: float = 60.0):
+        """
+        Initialize repeat filter.
+        
+        Args:
+            limit: Records per group allowed per window (0 = unlimited)
+            window: Window length in seconds
+        """
+        super().__init__()
+        self.limit = limit
+        self.window = window
+        # (logger, template) -> [window start, passed, suppressed]
+        self._groups: Dict[Tuple[str, str], list] = {}
+        self._lock = threading.Lock()
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < logging.WARNING or not self.limit:
+            return True
+        key = (record.name, str(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            group = self._groups.get(key)
+            if group is None or now - group[0] >= self.window:
+                suppressed = group[2] if group else 0
+                self._groups[key] = [now, 1, 0]
+                if suppressed:
+                    record.suppressed = suppressed
+                return True
+            if group[1] < self.limit:
+                group[1] += 1
+                return True
+            group[2] += 1
+        REGISTRY.inc('log_records_suppressed_total')
+        return False
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """Queue handler that drops records instead of blocking when the queue is full."""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The listener runs in this process, so records need not be made
+        # picklable; formatting is left to the writer thread
+        return record
+    
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            REGISTRY.inc('log_records_dropped_total')
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as one JSON object per line."""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for name in FIELDS + ('suppressed',):
+            value = getattr(record, name, None)
+            if value is not None:
+                data[name] = value
+        if record.exc_info:
+            data['exception'] = self.formatException(record.exc_info)
+        return json.dumps(data, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """Formats records for a terminal: the message, with the level for warnings and errors."""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        message = record.getMessage()
+        if record.levelno >= logging.WARNING:
+            message = f"{record.levelname}: {message}"
+        suppressed = getattr(record, 'suppressed', None)
+        if suppressed:
+            message += f" ({suppressed} similar messages suppressed)"
+        if record.exc_info:
+            message += '\n' + self.formatException(record.exc_info)
+        return message
+
+
+def configure_logging(level: str = 'INFO', fmt: str = 'text', repeat_limit: int = 5,
+                      repeat_window: float = 60.0, stream: Optional[TextIO] = None,
+                      queue_size: int = 10000):
+    """
+    Route all logging through a queue to a background writer thread.
+    
+    The calling thread only filters and enqueues records; formatting and
+    writing happen on the listener thread, so a slow stdout never blocks
+    processing. Calling this again replaces the previous configuration.
+    
+    Args:
+        level: Minimum level name (DEBUG, INFO, WARNING, ERROR)
+        fmt: 'text' for terminals or 'json' for log aggregation
+        repeat_limit: Repeated warnings/errors allowed per window (0 = unlimited)
+        repeat_window: Rate-limit window in seconds
+        stream: Output stream (default: stdout)
+        queue_size: Records buffered before new ones are dropped
+    
+    Raises:
+        ValueError: If the level or format is unknown
+    """
+    global _listener, _handler
+    if fmt not in ('text', 'json'):
+        raise ValueError(f"Unknown log format: {fmt}")
+    numeric_level = logging.getLevelName(level.upper())
+    if not isinstance(numeric_level, int):
+        raise ValueError(f"Unknown log level: {level}")
+    
+    shutdown_logging()
+    
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(JsonFormatter() if fmt == 'json' else TextFormatter())
+    _listener = QueueListener(queue.Queue(queue_size), output, respect_handler_level=False)
+    _handler = NonBlockingQueueHandler(_listener.queue)
+    _handler.addFilter(ContextFilter())
+    _handler.addFilter(RepeatFilter(repeat_limit, repeat_window))
+    
+    root = logging.getLogger()
+    root.addHandler(_handler)
+    root.setLevel(numeric_level)
+    _listener.start()
+
+
+def shutdown_logging():
+    """Write out queued records and remove the handler installed by configure_logging."""
+    global _listener, _handler
+    if _handler:
+        logging.getLogger().removeHandler(_handler)
+        _handler = None
+    if _listener:
+        _listener.stop()
+        _listener = None
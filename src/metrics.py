@@ -0,0 +1,325 @@
+"""Lightweight metrics collection and an optional HTTP endpoint to serve them."""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+
+# Latency buckets (seconds) shared by every histogram
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, object]) -> LabelKey:
+    """Convert a label dict to a hashable, ordered key."""
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(key: LabelKey, extra: Optional[Dict[str, str]] = None) -> str:
+    """Format labels in Prometheus exposition syntax."""
+    pairs = list(key) + sorted((extra or {}).items())
+    if not pairs:
+        return ''
+    escaped = []
+    for name, value in pairs:
+        value = value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+        escaped.append(f'{name}="{value}"')
+    return '{' + ','.join(escaped) + '}'
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value without losing precision on large counts."""
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Histogram:
+    """Cumulative latency histogram for a single label set."""
+    
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+    
+    def observe(self, value: float):
+        """Record a single observation."""
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+
+class MetricsRegistry:
+    """Thread-safe store of counters, gauges and histograms."""
+    
+    def __init__(self, prefix: str = "rss"):
+        """
+        Initialize metrics registry.
+        
+        Args:
+            prefix: Prefix prepended to every metric name on export
+        """
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._gauges: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+        self._stage_listeners: List[Callable[[str, float], None]] = []
+        self._stage_start_listeners: List[Callable[[str], None]] = []
+    
+    def add_stage_listener(self, listener: Callable[[str, float], None]):
+        """
+        Register a callback invoked whenever a timed stage finishes.
+        
+        Args:
+            listener: Callable receiving the stage name and its duration
+        """
+        with self._lock:
+            self._stage_listeners.append(listener)
+    
+    def remove_stage_listener(self, listener: Callable[[str, float], None]):
+        """Unregister a callback added with add_stage_listener."""
+        with self._lock:
+            if listener in self._stage_listeners:
+                self._stage_listeners.remove(listener)
+    
+    def add_stage_start_listener(self, listener: Callable[[str], None]):
+        """
+        Register a callback invoked whenever a timed stage starts.
+        
+        Args:
+            listener: Callable receiving the stage name
+        """
+        with self._lock:
+            self._stage_start_listeners.append(listener)
+    
+    def remove_stage_start_listener(self, listener: Callable[[str], None]):
+        """Unregister a callback added with add_stage_start_listener."""
+        with self._lock:
+            if listener in self._stage_start_listeners:
+                self._stage_start_listeners.remove(listener)
+    
+    def inc(self, name: str, value: float = 1.0, **labels):
+        """
+        Increment a counter.
+        
+        Args:
+            name: Counter name
+            value: Amount to add
+            **labels: Label values for this series
+        """
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + value
+    
+    def set_gauge(self, name: str, value: float, **labels):
+        """
+        Set a gauge to a value.
+        
+        Args:
+            name: Gauge name
+            value: New value
+            **labels: Label values for this series
+        """
+        key = _label_key(labels)
+        with self._lock:
+            self._gauges.setdefault(name, {})[key] = value
+    
+    def observe(self, name: str, value: float, **labels):
+        """
+        Record an observation in a histogram.
+        
+        Args:
+            name: Histogram name
+            value: Observed value (seconds for latencies)
+            **labels: Label values for this series
+        """
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram()
+            histogram.observe(value)
+    
+    @contextmanager
+    def time(self, stage: str, **labels) -> Iterator[None]:
+        """
+        Time a block of code as a pipeline stage.
+        
+        The duration is recorded in the ``stage_duration_seconds`` histogram
+        and failures are counted in ``stage_errors_total``.
+        
+        Args:
+            stage: Stage name (e.g. 'feed_fetch', 'extract')
+            **labels: Additional label values
+        """
+        for listener in list(self._stage_start_listeners):
+            listener(stage)
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.inc('stage_errors_total', stage=stage, **labels)
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            self.observe('stage_duration_seconds', duration, stage=stage, **labels)
+            for listener in list(self._stage_listeners):
+                listener(stage, duration)
+    
+    def get_counter(self, name: str, **labels) -> float:
+        """Get the current value of a counter (0 if never incremented)."""
+        with self._lock:
+            return self._counters.get(name, {}).get(_label_key(labels), 0.0)
+    
+    def get_gauge(self, name: str, **labels) -> Optional[float]:
+        """Get the current value of a gauge, or None if never set."""
+        with self._lock:
+            return self._gauges.get(name, {}).get(_label_key(labels))
+    
+    def get_histogram(self, name: str, **labels) -> Optional[Histogram]:
+        """Get the histogram for a label set, or None if never observed."""
+        with self._lock:
+            return self._histograms.get(name, {}).get(_label_key(labels))
+    
+    def reset(self):
+        """Discard all recorded metrics."""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+    
+    def render(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+        
+        Returns:
+            Metrics as text
+        """
+        lines = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                full_name = f"{self.prefix}_{name}"
+                lines.append(f"# TYPE {full_name} counter")
+                for key, value in sorted(series.items()):
+                    lines.append(f"{full_name}{_format_labels(key)} {_format_value(value)}")
+            
+            for name, series in sorted(self._gauges.items()):
+                full_name = f"{self.prefix}_{name}"
+                lines.append(f"# TYPE {full_name} gauge")
+                for key, value in sorted(series.items()):
+                    lines.append(f"{full_name}{_format_labels(key)} {_format_value(value)}")
+            
+            for name, series in sorted(self._histograms.items()):
+                full_name = f"{self.prefix}_{name}"
+                lines.append(f"# TYPE {full_name} histogram")
+                for key, histogram in sorted(series.items()):
+                    for bound, count in zip(histogram.buckets, histogram.counts):
+                        labels = _format_labels(key, {'le': f"{bound:g}"})
+                        lines.append(f"{full_name}_bucket{labels} {count}")
+                    labels = _format_labels(key, {'le': '+Inf'})
+                    lines.append(f"{full_name}_bucket{labels} {histogram.count}")
+                    lines.append(f"{full_name}_sum{_format_labels(key)} {_format_value(histogram.sum)}")
+                    lines.append(f"{full_name}_count{_format_labels(key)} {histogram.count}")
+        
+        return '\n'.join(lines) + '\n'
+
+
+# Process-wide registry used by all application components
+REGISTRY = MetricsRegistry()
+
+
+class MetricsServer:
+    """Background HTTP server exposing /metrics and /healthz."""
+    
+    def __init__(self, registry: MetricsRegistry, port: int,
+                 host: str = "0.0.0.0", max_cycle_age: Optional[float] = None):
+        """
+        Initialize metrics server.
+        
+        Args:
+            registry: Registry whose metrics are served
+            port: TCP port to listen on (0 picks a free port)
+            host: Interface to bind to
+            max_cycle_age: Seconds since the last successful cycle after
+                which /healthz reports unhealthy (None disables the check)
+        """
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self.max_cycle_age = max_cycle_age
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    def health(self) -> Tuple[bool, dict]:
+        """
+        Compute the health status reported by /healthz.
+        
+        Returns:
+            Tuple of (healthy, details)
+        """
+        last_success = self.registry.get_gauge('cycle_last_success_timestamp_seconds')
+        last_duration = self.registry.get_gauge('cycle_duration_seconds')
+        age = time.time() - last_success if last_success is not None else None
+        
+        healthy = True
+        if self.max_cycle_age is not None and age is not None:
+            healthy = age <= self.max_cycle_age
+        
+        return healthy, {
+            'status': 'ok' if healthy else 'stale',
+            'last_successful_cycle': last_success,
+            'seconds_since_last_success': age,
+            'last_cycle_duration_seconds': last_duration,
+        }
+    
+    def start(self):
+        """Start serving in a daemon thread."""
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == '/metrics':
+                    body = server.registry.render().encode('utf-8')
+                    self._respond(200, 'text/plain; version=0.0.4', body)
+                elif self.path == '/healthz':
+                    healthy, details = server.health()
+                    body = json.dumps(details).encode('utf-8')
+                    self._respond(200 if healthy else 503, 'application/json', body)
+                else:
+                    self._respond(404, 'text/plain', b'Not found\n')
+            
+            def _respond(self, status: int, content_type: str, body: bytes):
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, format, *args):
+                # Keep scrapes out of the application output
+                pass
+        
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name='metrics-server', daemon=True
+        )
+        self._thread.start()
+    
+    def stop(self):
+        """Stop the server."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
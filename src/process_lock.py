@@ -0,0 +1,99 @@
+"""Inter-process lock preventing overlapping runs."""
+
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class ProcessLock:
+    """Exclusive advisory lock on a file, released automatically if the process dies."""
+    
+    def __init__(self, lock_file: str):
+        """
+        Initialize process lock.
+        
+        Args:
+            lock_file: Path to the lock file (created, with its directory, if missing)
+        """
+        self.lock_file = Path(lock_file)
+        self._fd: Optional[int] = None
+    
+    @property
+    def locked(self) -> bool:
+        """Whether this instance currently holds the lock."""
+        return self._fd is not None
+    
+    def acquire(self, wait: bool = False, timeout: Optional[float] = None,
+                poll_interval: float = 0.5) -> bool:
+        """
+        Acquire the lock.
+        
+        Args:
+            wait: Wait for the lock if another process holds it
+            timeout: Maximum seconds to wait (None = wait indefinitely)
+            poll_interval: Seconds between attempts while waiting
+        
+        Returns:
+            True if the lock was acquired, False otherwise
+        
+        Raises:
+            OSError: If the lock file cannot be created or opened
+        """
+        if self._fd is not None:
+            return True
+        
+        self.lock_file.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(str(self.lock_file), os.O_RDWR | os.O_CREAT, 0o644)
+        start = time.monotonic()
+        while True:
+            if self._try_lock(fd):
+                self._fd = fd
+                # Record the holder to help diagnose stuck runs
+                os.ftruncate(fd, 0)
+                os.write(fd, f"{os.getpid()}\n".encode('ascii'))
+                return True
+            if not wait or (timeout is not None and time.monotonic() - start >= timeout):
+                os.close(fd)
+                return False
+            time.sleep(poll_interval)
+    
+    def release(self):
+        """Release the lock if held."""
+        if self._fd is None:
+            return
+        try:
+            if fcntl:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+    
+    @staticmethod
+    def _try_lock(fd: int) -> bool:
+        """Try to lock a file descriptor without blocking."""
+        try:
+            if fcntl:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            return False
+    
+    def __enter__(self) -> 'ProcessLock':
+        self.acquire(wait=True)
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
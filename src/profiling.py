@@ -0,0 +1,242 @@
+"""CPU and memory profiling of application runs."""
+
+import cProfile
+import io
+import logging
+import pstats
+import signal
+import sys
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+from .metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+
+class RunProfiler:
+    """
+    Profile runs with cProfile and tracemalloc and write per-run reports.
+    
+    Threads started during a profiled run, such as extraction workers, are
+    profiled too; threads still running when the run ends are left out.
+    tracemalloc traces the whole process, so the peak of a stage is the
+    peak of all memory in use while it ran, including other threads' and
+    nested stages' allocations.
+    """
+    
+    def __init__(self, output_dir: str, every: int = 1, top_n: int = 30):
+        """
+        Initialize run profiler.
+        
+        Args:
+            output_dir: Directory reports are written to
+            every: Profile every Nth run (0 = only when armed via arm())
+            top_n: Number of functions and allocation sites to report
+        """
+        self.output_dir = Path(output_dir)
+        self.every = every
+        self.top_n = top_n
+        self.runs = 0
+        self._armed = threading.Event()
+        self._stage_peaks: Dict[str, int] = {}
+        self._stage_times: Dict[str, float] = {}
+        # Per-thread stacks of [stage, peak so far] for stages still running
+        self._open_stages: Dict[int, List[list]] = {}
+        self._run_peak = 0
+        self._thread_profilers: List[Tuple[threading.Thread, cProfile.Profile]] = []
+        self._lock = threading.Lock()
+    
+    def arm(self):
+        """Profile the next run regardless of the sampling interval."""
+        self._armed.set()
+    
+    def install_signal_handler(self, signum: int = getattr(signal, 'SIGUSR1', 0)) -> bool:
+        """
+        Arm the profiler whenever the process receives a signal.
+        
+        Args:
+            signum: Signal number (default: SIGUSR1)
+        
+        Returns:
+            True if the handler was installed, False if unsupported
+        """
+        if not signum:
+            return False
+        signal.signal(signum, lambda *_: self.arm())
+        return True
+    
+    def should_profile(self) -> bool:
+        """
+        Decide whether the next run should be profiled.
+        
+        Returns:
+            True if the run is sampled or the profiler was armed
+        """
+        self.runs += 1
+        if self._armed.is_set():
+            self._armed.clear()
+            return True
+        return self.every > 0 and self.runs % self.every == 0
+    
+    def maybe_profile(self, func: Callable, *args, **kwargs):
+        """
+        Call a function, profiling it if this run is selected.
+        
+        Args:
+            func: Function to call
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+        
+        Returns:
+            Return value of func
+        """
+        if self.should_profile():
+            return self.profile(func, *args, **kwargs)
+        return func(*args, **kwargs)
+    
+    def profile(self, func: Callable, *args, **kwargs):
+        """
+        Call a function under cProfile and tracemalloc and write a report.
+        
+        Args:
+            func: Function to call
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+        
+        Returns:
+            Return value of func
+        """
+        self._stage_peaks = {}
+        self._stage_times = {}
+        self._open_stages = {}
+        self._thread_profilers = []
+        
+        already_tracing = tracemalloc.is_tracing()
+        if not already_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        self._run_peak = tracemalloc.get_traced_memory()[1]
+        REGISTRY.add_stage_start_listener(self._on_stage_start)
+        REGISTRY.add_stage_listener(self._on_stage)
+        threading.setprofile(self._start_thread_profiler)
+        profiler = cProfile.Profile()
+        
+        start = time.perf_counter()
+        try:
+            profiler.enable()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profiler.disable()
+        finally:
+            duration = time.perf_counter() - start
+            threading.setprofile(None)
+            REGISTRY.remove_stage_start_listener(self._on_stage_start)
+            REGISTRY.remove_stage_listener(self._on_stage)
+            with self._lock:
+                self._fold_peak()
+            snapshot = tracemalloc.take_snapshot()
+            if not already_tracing:
+                tracemalloc.stop()
+            path = self._write_report(profiler, snapshot, duration, self._run_peak)
+            logger.info("Profile report written to %s", path)
+    
+    def _start_thread_profiler(self, frame, event, arg):
+        """Profile hook for new threads: replace itself with a cProfile profiler."""
+        sys.setprofile(None)
+        profiler = cProfile.Profile()
+        with self._lock:
+            self._thread_profilers.append((threading.current_thread(), profiler))
+        profiler.enable()
+    
+    def _fold_peak(self) -> int:
+        """
+        Fold the peak since the last reset into the run and running stages.
+        
+        Must be called with the lock held.
+        
+        Returns:
+            Currently traced memory in bytes
+        """
+        current, peak = tracemalloc.get_traced_memory()
+        self._run_peak = max(self._run_peak, peak)
+        for stack in self._open_stages.values():
+            for entry in stack:
+                entry[1] = max(entry[1], peak)
+        tracemalloc.reset_peak()
+        return current
+    
+    def _on_stage_start(self, stage: str):
+        """Start tracking the peak traced memory of a stage."""
+        with self._lock:
+            current = self._fold_peak()
+            self._open_stages.setdefault(threading.get_ident(), []).append([stage, current])
+    
+    def _on_stage(self, stage: str, duration: float):
+        """Record the time and peak traced memory of a finished stage."""
+        with self._lock:
+            self._fold_peak()
+            stack = self._open_stages.get(threading.get_ident())
+            # Stages that started before profiling are timed but have no peak
+            if stack and stack[-1][0] == stage:
+                peak = stack.pop()[1]
+                self._stage_peaks[stage] = max(self._stage_peaks.get(stage, 0), peak)
+            self._stage_times[stage] = self._stage_times.get(stage, 0.0) + duration
+    
+    def _write_report(self, profiler: cProfile.Profile, snapshot: tracemalloc.Snapshot,
+                      duration: float, peak: int) -> Path:
+        """
+        Write the text report and raw cProfile data for a run.
+        
+        Returns:
+            Path of the text report
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        name = f"profile-{datetime.now().strftime('%Y%m%d-%H%M%S')}-run{self.runs}"
+        report_path = self.output_dir / f"{name}.txt"
+        
+        stats_stream = io.StringIO()
+        stats = pstats.Stats(profiler, stream=stats_stream)
+        finished = [thread_profiler for thread, thread_profiler in self._thread_profilers
+                    if not thread.is_alive()]
+        for thread_profiler in finished:
+            stats.add(thread_profiler)
+        
+        # Raw data for pstats, snakeviz etc.
+        stats.dump_stats(str(self.output_dir / f"{name}.prof"))
+        stats.sort_stats('cumulative').print_stats(self.top_n)
+        
+        snapshot = snapshot.filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        ])
+        
+        with open(report_path, 'w') as f:
+            f.write(f"Run {self.runs} profiled at {datetime.now().isoformat()}\n")
+            f.write(f"Wall time: {duration:.3f}s\n")
+            f.write(f"Peak traced memory: {peak / 1024 / 1024:.2f} MiB\n")
+            f.write(f"Threads profiled: {1 + len(finished)}"
+                    f" ({len(self._thread_profilers) - len(finished)} still running, not included)\n\n")
+            
+            f.write("Stages (total time, peak traced memory)\n")
+            f.write("-" * 60 + "\n")
+            for stage in sorted(self._stage_times, key=self._stage_times.get, reverse=True):
+                f.write(f"{stage:<24} {self._stage_times[stage]:>10.3f}s "
+                        f"{self._stage_peaks.get(stage, 0) / 1024 / 1024:>10.2f} MiB\n")
+            f.write("\n")
+            
+            f.write(f"Top {self.top_n} allocation sites\n")
+            f.write("-" * 60 + "\n")
+            for stat in snapshot.statistics('lineno')[:self.top_n]:
+                f.write(f"{stat}\n")
+            f.write("\n")
+            
+            f.write(f"Top {self.top_n} functions by cumulative time\n")
+            f.write("-" * 60 + "\n")
+            f.write(stats_stream.getvalue())
+        
+        return report_path
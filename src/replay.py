@@ -0,0 +1,411 @@
+"""Recording of real runs and offline replay of recordings."""
+
+import base64
+import gzip
+import json
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import requests
+import yaml
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from .sinks import GoogleDocsSink
+from .snapshot import SnapshotStore
+
+ARCHIVE_FORMAT = 'rss-to-notebooklm-recording'
+ARCHIVE_VERSION = 1
+
+# Response headers kept in recordings; the rest do not affect the app
+RECORDED_HEADERS = ('Content-Type', 'Content-Length', 'ETag', 'Last-Modified', 'Location')
+
+# Bodies are recorded as the app reads them, up to this size
+MAX_RECORDED_BODY = 64 * 1024 * 1024
+
+
+def _encode_body(body: bytes) -> Dict[str, str]:
+    """Store a body as text when it is valid UTF-8, base64 otherwise."""
+    try:
+        return {'text': body.decode('utf-8')}
+    except UnicodeDecodeError:
+        return {'base64': base64.b64encode(body).decode('ascii')}
+
+
+def _decode_body(event: dict) -> bytes:
+    if 'base64' in event:
+        return base64.b64decode(event['base64'])
+    return event.get('text', '').encode('utf-8')
+
+
+class Recorder:
+    """
+    Records the HTTP and Docs traffic of a run into a gzipped JSON Lines archive.
+    
+    The first line holds the configuration, processed-item state,
+    boilerplate model and warm-start snapshot the run started with; each
+    further line is one feed or article response, or one Docs call, with
+    its duration.
+    """
+    
+    def __init__(self, archive: str):
+        """
+        Initialize recorder.
+        
+        Args:
+            archive: Path of the archive to write (overwritten)
+        """
+        self.archive = Path(archive)
+        self._file = None
+        self._lock = threading.Lock()
+        self._start = time.monotonic()
+        self._open_bodies: List['RecordingBody'] = []
+        self.events = 0
+    
+    def attach(self, app):
+        """
+        Start recording an application's traffic.
+        
+        Args:
+            app: RSSToNotebookLMApp to record
+        """
+        self._file = gzip.open(self.archive, 'wt', encoding='utf-8')
+        boilerplate = app.content_extractor.boilerplate
+        self._write({
+            'format': ARCHIVE_FORMAT,
+            'version': ARCHIVE_VERSION,
+            'recorded_at': datetime.now().isoformat(),
+            'config': app.config.config_path.read_text(),
+            'processed_items': sorted(app.state_manager.processed_items),
+            'boilerplate': boilerplate.domains if boilerplate else None,
+            'snapshot': app.snapshot_store.load() if app.snapshot_store else None,
+        })
+        
+        adapter = RecordingAdapter(self)
+        for session in (app.rss_parser.session, app.content_extractor.session):
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        
+        if app.drive_client:
+            app.drive_client = RecordingDocsClient(app.drive_client, self)
+            for sink in app.sinks:
+                if isinstance(sink, GoogleDocsSink):
+                    sink.drive_client = app.drive_client
+    
+    def record(self, kind: str, elapsed: float, **details):
+        """
+        Append an event to the archive.
+        
+        Args:
+            kind: 'http' or 'docs'
+            elapsed: Duration of the call in seconds
+            **details: Event fields
+        """
+        event = {'kind': kind, 't': round(time.monotonic() - self._start, 4),
+                 'elapsed': round(elapsed, 4), **details}
+        line = json.dumps(event, separators=(',', ':')) + '\n'
+        with self._lock:
+            # Responses still being read by a worker may finish after close()
+            if self._file:
+                self._file.write(line)
+                self.events += 1
+    
+    def _write(self, event: dict):
+        with self._lock:
+            self._file.write(json.dumps(event, separators=(',', ':')) + '\n')
+    
+    def track(self, body: 'RecordingBody'):
+        """Register a response body that is still being read."""
+        with self._lock:
+            self._open_bodies.append(body)
+    
+    def untrack(self, body: 'RecordingBody'):
+        """Unregister a response body once it has been recorded."""
+        with self._lock:
+            if body in self._open_bodies:
+                self._open_bodies.remove(body)
+    
+    def close(self):
+        """Record bodies that were never read to the end, and finish the archive."""
+        with self._lock:
+            bodies = list(self._open_bodies)
+        for body in bodies:
+            body.finish()
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+
+class RecordingAdapter(HTTPAdapter):
+    """HTTP adapter that records every response as the caller reads it."""
+    
+    def __init__(self, recorder: Recorder):
+        super().__init__()
+        self.recorder = recorder
+    
+    def send(self, request, **kwargs) -> requests.Response:
+        start = time.perf_counter()
+        response = super().send(request, **kwargs)
+        response.raw = RecordingBody(response.raw, self.recorder, start, {
+            'method': request.method,
+            'url': request.url,
+            'status': response.status_code,
+            'headers': {name: response.headers[name] for name in RECORDED_HEADERS
+                        if name in response.headers},
+        })
+        return response
+
+
+class RecordingBody:
+    """
+    Wraps a streamed response body, recording the bytes the caller reads.
+    
+    The event is written once the body is exhausted or closed, so a caller
+    that stops reading early is recorded with the part it read. The
+    recorded duration runs from sending the request to the last read.
+    """
+    
+    def __init__(self, raw, recorder: Recorder, start: float, details: dict):
+        self._raw = raw
+        self._recorder = recorder
+        self._start = start
+        self._details = details
+        self._chunks: List[bytes] = []
+        self._size = 0
+        self._finished = False
+        self._last_read = time.perf_counter()
+        recorder.track(self)
+    
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+    
+    def _keep(self, data: bytes) -> bytes:
+        self._last_read = time.perf_counter()
+        if data and self._size < MAX_RECORDED_BODY:
+            self._chunks.append(data[:MAX_RECORDED_BODY - self._size])
+            self._size += len(self._chunks[-1])
+        return data
+    
+    def stream(self, amt: int = 2 ** 16, decode_content: Optional[bool] = None) -> Iterator[bytes]:
+        for chunk in self._raw.stream(amt, decode_content=decode_content):
+            yield self._keep(chunk)
+        self.finish()
+    
+    def read(self, amt: Optional[int] = None, *args, **kwargs) -> bytes:
+        data = self._keep(self._raw.read(amt, *args, **kwargs))
+        if not data or amt is None:
+            self.finish()
+        return data
+    
+    def close(self):
+        self.finish()
+        self._raw.close()
+    
+    def finish(self):
+        """Record the body read so far (only the first call has an effect)."""
+        if self._finished:
+            return
+        self._finished = True
+        self._recorder.untrack(self)
+        self._recorder.record('http', self._last_read - self._start,
+                              **self._details, **_encode_body(b''.join(self._chunks)))
+
+
+class RecordingDocsClient:
+    """Wraps a Docs client, recording each call and its result."""
+    
+    def __init__(self, client, recorder: Recorder):
+        self.client = client
+        self.recorder = recorder
+    
+    @property
+    def document_id(self) -> str:
+        return self.client.document_id
+    
+    @document_id.setter
+    def document_id(self, value: str):
+        self.client.document_id = value
+    
+    def append_content(self, content: str) -> bool:
+        start = time.perf_counter()
+        result = self.client.append_content(content)
+        # Article text is already in the HTTP events; only its size is kept
+        self.recorder.record('docs', time.perf_counter() - start, method='append_content',
+                             bytes=len(content.encode('utf-8')), result=result)
+        return result
+    
+    def get_document_info(self) -> Optional[dict]:
+        start = time.perf_counter()
+        result = self.client.get_document_info()
+        self.recorder.record('docs', time.perf_counter() - start, method='get_document_info',
+                             result=result)
+        return result
+
+
+class Replayer:
+    """
+    Replays a recording without network access.
+    
+    Responses are served in recorded order per URL, after the recorded
+    duration divided by ``speed``. Requests that were not recorded fail
+    with a connection error.
+    """
+    
+    def __init__(self, archive: str, speed: float = 1.0):
+        """
+        Initialize replayer.
+        
+        Args:
+            archive: Path of the recording
+            speed: Playback speed (2 = twice as fast, 0 = no delays)
+        
+        Raises:
+            ValueError: If the file is not a recording
+        """
+        self.speed = speed
+        self.responses: Dict[Tuple[str, str], List[dict]] = {}
+        self.docs_calls: Dict[str, List[dict]] = {}
+        self._lock = threading.Lock()
+        
+        with gzip.open(archive, 'rt', encoding='utf-8') as f:
+            self.header = json.loads(f.readline())
+            if self.header.get('format') != ARCHIVE_FORMAT:
+                raise ValueError(f"Not a recording: {archive}")
+            if self.header.get('version') != ARCHIVE_VERSION:
+                raise ValueError(f"Unsupported recording version: {self.header.get('version')}")
+            for line in f:
+                event = json.loads(line)
+                if event['kind'] == 'http':
+                    self.responses.setdefault((event['method'], event['url']), []).append(event)
+                elif event['kind'] == 'docs':
+                    self.docs_calls.setdefault(event['method'], []).append(event)
+    
+    def prepare(self, workdir: str) -> Path:
+        """
+        Write the recorded configuration and starting state to a directory.
+        
+        State, lock, snapshot, boilerplate and file output paths are
+        redirected into the directory so replaying never touches production
+        files.
+        
+        Args:
+            workdir: Directory to write to (created if missing)
+        
+        Returns:
+            Path of the configuration file to run the app with
+        """
+        workdir = Path(workdir)
+        workdir.mkdir(parents=True, exist_ok=True)
+        config = yaml.safe_load(self.header['config'])
+        
+        settings = config.setdefault('settings', {})
+        settings['state_file'] = str(workdir / 'state.json')
+        settings['lock_file'] = str(workdir / 'state.json.lock')
+        settings['snapshot_file'] = str(workdir / 'snapshot.json.gz')
+        if self.speed:
+            settings['check_interval'] = settings.get('check_interval', 3600) / self.speed
+            settings['request_delay'] = settings.get('request_delay', 1) / self.speed
+        else:
+            settings['check_interval'] = 0
+            settings['request_delay'] = 0
+        config.setdefault('boilerplate', {})['file'] = str(workdir / 'boilerplate.json')
+        config['metrics'] = {'port': 0}
+        for index, output in enumerate(config.get('outputs') or []):
+            if output.get('type') == 'file':
+                output['directory'] = str(workdir / f"output-{index}")
+        
+        with open(workdir / 'state.json', 'w') as f:
+            json.dump({'processed_items': self.header['processed_items'],
+                       'last_updated': datetime.now().isoformat()}, f)
+        if self.header.get('boilerplate') is not None:
+            with open(workdir / 'boilerplate.json', 'w') as f:
+                json.dump({'domains': self.header['boilerplate']}, f)
+        
+        if self.header.get('snapshot') is not None:
+            SnapshotStore(str(workdir / 'snapshot.json.gz')).save(self.header['snapshot'])
+        
+        config_path = workdir / 'config.yaml'
+        with open(config_path, 'w') as f:
+            yaml.safe_dump(config, f)
+        return config_path
+    
+    def docs_client(self) -> 'ReplayDocsClient':
+        """Create a Docs client answering from the recording."""
+        document_id = yaml.safe_load(self.header['config']).get('google_drive', {}).get('document_id')
+        return ReplayDocsClient(self, document_id)
+    
+    def attach(self, app):
+        """
+        Serve an application's HTTP requests from the recording.
+        
+        Args:
+            app: RSSToNotebookLMApp to replay into
+        """
+        adapter = ReplayAdapter(self)
+        for session in (app.rss_parser.session, app.content_extractor.session):
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+    
+    def next_event(self, events: List[dict]) -> dict:
+        """Take the next recorded event from a list, repeating the last once exhausted."""
+        with self._lock:
+            return events.pop(0) if len(events) > 1 else events[0]
+    
+    def wait(self, event: dict):
+        """Sleep for an event's recorded duration at the replay speed."""
+        if self.speed:
+            time.sleep(event['elapsed'] / self.speed)
+
+
+class ReplayAdapter(BaseAdapter):
+    """Requests transport adapter serving recorded responses."""
+    
+    def __init__(self, replayer: Replayer):
+        super().__init__()
+        self.replayer = replayer
+    
+    def send(self, request, **kwargs) -> requests.Response:
+        events = self.replayer.responses.get((request.method, request.url))
+        if not events:
+            raise requests.ConnectionError(f"Not in recording: {request.method} {request.url}",
+                                           request=request)
+        event = self.replayer.next_event(events)
+        self.replayer.wait(event)
+        
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        response.status_code = event['status']
+        response.headers = CaseInsensitiveDict(event['headers'])
+        response._content = _decode_body(event)
+        response._content_consumed = True
+        return response
+    
+    def close(self):
+        pass
+
+
+class ReplayDocsClient:
+    """Docs client returning recorded results after their recorded durations."""
+    
+    def __init__(self, replayer: Replayer, document_id: Optional[str] = None):
+        self.replayer = replayer
+        self.document_id = document_id
+    
+    def _replay(self, method: str, default):
+        events = self.replayer.docs_calls.get(method)
+        if not events:
+            return default
+        event = self.replayer.next_event(events)
+        self.replayer.wait(event)
+        return event['result']
+    
+    def append_content(self, content: str) -> bool:
+        return self._replay('append_content', True)
+    
+    def get_document_info(self) -> Optional[dict]:
+        return self._replay('get_document_info', None)
@@ -1,15 +1,18 @@
 """RSS feed parsing and filtering."""
 
 import feedparser
+import requests
 from typing import List, Dict, Optional
 from datetime import datetime
 from dateutil import parser as date_parser
+from .metrics import REGISTRY
 
 
 class RSSItem:
     """Represents a single RSS feed item."""
     
-    def __init__(self, entry: Dict):
+    def __init__(self, entry: Dict, feed_url: Optional[str] = None):
+        self.feed_url = feed_url
         self.title = entry.get('title', 'Untitled')
         self.link = entry.get('link', '')
         self.published = self._parse_date(entry.get('published'))
@@ -34,6 +37,27 @@ class RSSItem:
         search_text = f"{self.title} {self.summary} {self.description}".lower()
         return filter_text.lower() in search_text
     
+    def to_dict(self) -> Dict:
+        """Convert to a JSON-serialisable dict (see from_dict)."""
+        return {
+            'id': self.id,
+            'title': self.title,
+            'link': self.link,
+            'published': self.published.isoformat() if self.published else None,
+            'summary': self.summary,
+            'description': self.description,
+            'feed_url': self.feed_url,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'RSSItem':
+        """Create an item from a dict produced by to_dict."""
+        item = cls({key: value for key, value in data.items() if key != 'published'},
+                   data.get('feed_url'))
+        published = data.get('published')
+        item.published = datetime.fromisoformat(published) if published else None
+        return item
+    
     def __repr__(self):
         return f"RSSItem(title='{self.title}', link='{self.link}')"
 
@@ -41,13 +65,85 @@ class RSSItem:
 class RSSParser:
     """Parser for RSS feeds."""
     
+    def __init__(self, timeout: int = 30):
+        """
+        Initialize RSS parser.
+        
+        Args:
+            timeout: Request timeout in seconds for HTTP feeds
+        """
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        })
+        # Per-feed HTTP validators ('etag', 'last_modified') and the items
+        # parsed from the last full response, reused on 304 Not Modified
+        self.validators: Dict[str, Dict[str, str]] = {}
+        self.cached_items: Dict[str, List[RSSItem]] = {}
+    
+    def fetch_feed(self, url: str, timeout: Optional[float] = None) -> List[RSSItem]:
+        """
+        Fetch and parse an RSS feed, using a conditional GET for HTTP feeds.
+        
+        When the server answers 304 Not Modified, the items parsed from the
+        previous response are returned without re-parsing.
+        
+        Args:
+            url: URL (or local path) of the RSS feed
+            timeout: Request timeout in seconds (default: the parser's timeout)
+            
+        Returns:
+            List of RSSItem objects
+            
+        Raises:
+            Exception: If feed cannot be parsed or retrieved
+        """
+        if not url.startswith(('http://', 'https://')):
+            return self.parse_feed(url)
+        
+        headers = {}
+        validators = self.validators.get(url, {})
+        if url in self.cached_items:
+            if 'etag' in validators:
+                headers['If-None-Match'] = validators['etag']
+            if 'last_modified' in validators:
+                headers['If-Modified-Since'] = validators['last_modified']
+        
+        with REGISTRY.time('feed_fetch', feed=url):
+            response = self.session.get(url, headers=headers, timeout=timeout or self.timeout)
+        REGISTRY.inc('feed_fetch_total', feed=url, status=response.status_code)
+        
+        if response.status_code == 304 and url in self.cached_items:
+            REGISTRY.inc('feed_not_modified_total', feed=url)
+            return self.cached_items[url]
+        
+        response.raise_for_status()
+        REGISTRY.inc('feed_bytes_total', len(response.content), feed=url)
+        
+        items = self.parse_feed(response.content, feed_url=url, response_headers=response.headers)
+        
+        validators = {}
+        if response.headers.get('ETag'):
+            validators['etag'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            validators['last_modified'] = response.headers['Last-Modified']
+        self.validators[url] = validators
+        self.cached_items[url] = items
+        
+        return items
+    
     @staticmethod
-    def parse_feed(url: str) -> List[RSSItem]:
+    def parse_feed(url, feed_url: Optional[str] = None,
+                   response_headers: Optional[Dict[str, str]] = None) -> List[RSSItem]:
         """
         Parse an RSS feed from a URL.
         
         Args:
-            url: URL of the RSS feed
+            url: URL of the RSS feed, local path, or raw feed content
+            feed_url: URL to record as the items' source feed (defaults to url)
+            response_headers: HTTP headers the raw content was served with,
+                so the charset in Content-Type is honoured
             
         Returns:
             List of RSSItem objects
@@ -55,14 +151,22 @@ class RSSParser:
         Raises:
             Exception: If feed cannot be parsed or retrieved
         """
-        feed = feedparser.parse(url)
+        if feed_url is None:
+            feed_url = url
+        
+        with REGISTRY.time('feed_parse', feed=feed_url):
+            # feedparser looks headers up by lower-case name, and reports
+            # headers without a Content-Type as an error
+            headers = {name.lower(): value for name, value in (response_headers or {}).items()}
+            feed = feedparser.parse(url, response_headers=headers if 'content-type' in headers else None)
         
         if feed.bozo and feed.bozo_exception:
-            raise Exception(f"Error parsing RSS feed {url}: {feed.bozo_exception}")
+            REGISTRY.inc('feed_parse_errors_total', feed=feed_url)
+            raise Exception(f"Error parsing RSS feed {feed_url}: {feed.bozo_exception}")
         
         items = []
         for entry in feed.entries:
-            items.append(RSSItem(entry))
+            items.append(RSSItem(entry, feed_url))
         
         return items
     
@@ -81,4 +185,5 @@ class RSSParser:
         if not filter_text:
             return items
         
-        return [item for item in items if item.matches_filter(filter_text)]
+        with REGISTRY.time('filter'):
+            return [item for item in items if item.matches_filter(filter_text)]
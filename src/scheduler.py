@@ -0,0 +1,98 @@
+"""Ordering of new items across feeds within a run's article budget."""
+
+import heapq
+from datetime import timezone
+from typing import List, Tuple
+from .config import FeedConfig
+from .rss_parser import RSSItem
+
+
+class ItemScheduler:
+    """Orders items from several feeds for processing."""
+    
+    STRATEGIES = ('fifo', 'round_robin', 'weighted')
+    
+    def __init__(self, strategy: str = 'fifo', newest_first: bool = False):
+        """
+        Initialize item scheduler.
+        
+        Args:
+            strategy: 'fifo' (feed by feed, in config order), 'round_robin'
+                (one item from each feed in turn) or 'weighted' (feeds get
+                turns in proportion to their weight)
+            newest_first: Order items by published date, newest first
+        """
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknown scheduling strategy: {strategy}")
+        self.strategy = strategy
+        self.newest_first = newest_first
+    
+    def order(self, feed_items: List[Tuple[FeedConfig, List[RSSItem]]]) -> List[RSSItem]:
+        """
+        Order the new items of each feed into a single queue.
+        
+        Per-feed ``max_items`` caps are applied before ordering.
+        
+        Args:
+            feed_items: (feed configuration, new items) pairs in config order
+        
+        Returns:
+            Items in processing order, without duplicate IDs
+        """
+        queues = []
+        for feed_config, items in feed_items:
+            if self.newest_first:
+                items = sorted(items, key=_published_key, reverse=True)
+            if feed_config.max_items > 0:
+                items = items[:feed_config.max_items]
+            queues.append((feed_config, items))
+        
+        if self.strategy == 'fifo':
+            ordered = [item for _, items in queues for item in items]
+            if self.newest_first:
+                ordered.sort(key=_published_key, reverse=True)
+        else:
+            ordered = self._interleave(queues)
+        
+        seen = set()
+        unique = []
+        for item in ordered:
+            if item.id not in seen:
+                seen.add(item.id)
+                unique.append(item)
+        return unique
+    
+    def _interleave(self, queues: List[Tuple[FeedConfig, List[RSSItem]]]) -> List[RSSItem]:
+        """
+        Interleave feed queues by weighted fair queueing.
+        
+        Each feed's next item gets the virtual finish time (served + 1) / weight;
+        the item with the smallest finish time goes next, ties broken by
+        config order. With equal weights this is plain round-robin.
+        """
+        weighted = self.strategy == 'weighted'
+        heap = []
+        for index, (feed_config, items) in enumerate(queues):
+            if items:
+                weight = feed_config.weight if weighted else 1.0
+                heap.append((1.0 / weight, index, 0, weight))
+        heapq.heapify(heap)
+        
+        ordered = []
+        while heap:
+            finish, index, position, weight = heapq.heappop(heap)
+            items = queues[index][1]
+            ordered.append(items[position])
+            if position + 1 < len(items):
+                heapq.heappush(heap, ((position + 2) / weight, index, position + 1, weight))
+        return ordered
+
+
+def _published_key(item: RSSItem) -> float:
+    """Sort key for an item's published date (undated items sort as oldest)."""
+    if item.published is None:
+        return float('-inf')
+    published = item.published
+    if published.tzinfo is None:
+        published = published.replace(tzinfo=timezone.utc)
+    return published.timestamp()
@@ -0,0 +1,284 @@
+"""Output sinks that extracted articles are written to."""
+
+import logging
+import os
+from abc import ABC, abstractmethod
+import re
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+from .config import OutputConfig
+from .google_drive_client import GoogleDriveClient
+from .metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+
+class Sink(ABC):
+    """
+    Base class for output sinks.
+    
+    Articles are passed to write() and may be buffered. write() and flush()
+    return the IDs of the articles that have been durably written, so callers
+    only record an article as processed once every sink has acknowledged it.
+    Articles that fail to be written are dropped from the buffer and never
+    acknowledged.
+    """
+    
+    name = 'sink'
+    
+    def __init__(self, max_bytes: int = 0, max_delay: float = 0):
+        """
+        Initialize sink.
+        
+        Args:
+            max_bytes: Flush once this many bytes are buffered (0 = flush every write)
+            max_delay: Flush once the oldest buffered article is this many
+                seconds old (0 = no time limit)
+        """
+        self.max_bytes = max_bytes
+        self.max_delay = max_delay
+        self._buffer: List[Tuple[str, str]] = []
+        self._buffered_bytes = 0
+        self._oldest: Optional[float] = None
+    
+    @property
+    def buffered(self) -> int:
+        """Number of articles waiting to be flushed."""
+        return len(self._buffer)
+    
+    def write(self, item_id: str, content: str) -> List[str]:
+        """
+        Buffer an article, flushing if the buffer is full.
+        
+        Args:
+            item_id: Unique ID of the article's RSS item
+            content: Formatted article content
+        
+        Returns:
+            IDs of articles written by this call
+        """
+        if self._oldest is None:
+            self._oldest = time.monotonic()
+        self._buffer.append((item_id, content))
+        self._buffered_bytes += len(content.encode('utf-8'))
+        if self._buffered_bytes >= self.max_bytes:
+            return self.flush()
+        return []
+    
+    def flush_if_due(self) -> List[str]:
+        """
+        Flush if the oldest buffered article has waited longer than max_delay.
+        
+        Returns:
+            IDs of articles written
+        """
+        if (self._buffer and self.max_delay and
+                time.monotonic() - self._oldest >= self.max_delay):
+            return self.flush()
+        return []
+    
+    def flush(self) -> List[str]:
+        """
+        Write all buffered articles.
+        
+        Returns:
+            IDs of articles written
+        """
+        if not self._buffer:
+            return []
+        entries = self._buffer
+        self._buffer = []
+        self._buffered_bytes = 0
+        self._oldest = None
+        
+        with REGISTRY.time('sink_flush', sink=self.name):
+            written = self._write_batch(entries)
+        REGISTRY.inc('sink_flushes_total', sink=self.name)
+        REGISTRY.inc('sink_items_total', len(written), sink=self.name, result='written')
+        if len(written) < len(entries):
+            REGISTRY.inc('sink_items_total', len(entries) - len(written), sink=self.name, result='failed')
+        return written
+    
+    def close(self) -> List[str]:
+        """
+        Flush remaining articles and release resources.
+        
+        Returns:
+            IDs of articles written
+        """
+        return self.flush()
+    
+    @abstractmethod
+    def _write_batch(self, entries: List[Tuple[str, str]]) -> List[str]:
+        """
+        Write a batch of articles.
+        
+        Args:
+            entries: (item ID, content) pairs in order
+        
+        Returns:
+            IDs of articles written
+        """
+
+
+class GoogleDocsSink(Sink):
+    """Appends articles to a Google Doc, one API call per batch."""
+    
+    name = 'google_docs'
+    
+    def __init__(self, drive_client: GoogleDriveClient, max_bytes: int = 500000,
+                 max_delay: float = 60, min_interval: float = 0):
+        """
+        Initialize Google Docs sink.
+        
+        Args:
+            drive_client: Client for the target document
+            max_bytes: Flush once this many bytes are buffered
+            max_delay: Flush once the oldest buffered article is this many seconds old
+            min_interval: Minimum seconds between appends, to stay under API rate limits
+        """
+        super().__init__(max_bytes, max_delay)
+        self.drive_client = drive_client
+        self.min_interval = min_interval
+        self._last_append: Optional[float] = None
+    
+    def _write_batch(self, entries: List[Tuple[str, str]]) -> List[str]:
+        if self.min_interval and self._last_append is not None:
+            wait = self._last_append + self.min_interval - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+        
+        # Same layout as appending the articles one at a time
+        content = '\n\n'.join(content for _, content in entries)
+        success = self.drive_client.append_content(content)
+        self._last_append = time.monotonic()
+        
+        if not success:
+            logger.error("Failed to add %d articles to Google Doc", len(entries), extra={'stage': 'sink_flush'})
+            return []
+        logger.info("Added %d articles to Google Doc", len(entries), extra={'stage': 'sink_flush'})
+        return [item_id for item_id, _ in entries]
+
+
+class RotatingFileSink(Sink):
+    """
+    Writes articles to local Markdown or text files for bulk upload.
+    
+    A new file is started whenever the current one would exceed
+    max_file_bytes, keeping every file under NotebookLM's source size limit.
+    """
+    
+    name = 'file'
+    
+    EXTENSIONS = {'markdown': 'md', 'text': 'txt'}
+    
+    def __init__(self, directory: str, prefix: str = "articles", file_format: str = "markdown",
+                 max_file_bytes: int = 2000000, max_bytes: int = 1000000, max_delay: float = 60):
+        """
+        Initialize rotating file sink.
+        
+        Args:
+            directory: Directory files are written to (created if missing)
+            prefix: File name prefix; files are named <prefix>-NNNN.<ext>
+            file_format: 'markdown' or 'text'
+            max_file_bytes: Size at which a new file is started
+            max_bytes: Flush once this many bytes are buffered
+            max_delay: Flush once the oldest buffered article is this many seconds old
+        """
+        super().__init__(max_bytes, max_delay)
+        if file_format not in self.EXTENSIONS:
+            raise ValueError(f"Unknown file format: {file_format}")
+        self.directory = Path(directory)
+        self.prefix = prefix
+        self.extension = self.EXTENSIONS[file_format]
+        self.max_file_bytes = max_file_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.index = self._last_index()
+    
+    def _last_index(self) -> int:
+        """Find the index of the newest existing file, to continue appending to it."""
+        pattern = re.compile(rf'^{re.escape(self.prefix)}-(\d+)\.{self.extension}$')
+        indexes = [int(match.group(1)) for match in
+                   (pattern.match(path.name) for path in self.directory.iterdir()) if match]
+        return max(indexes, default=1)
+    
+    @property
+    def current_file(self) -> Path:
+        """Path of the file currently being written."""
+        return self.directory / f"{self.prefix}-{self.index:04d}.{self.extension}"
+    
+    def _write_batch(self, entries: List[Tuple[str, str]]) -> List[str]:
+        written = []
+        synced = 0
+        handle = None
+        try:
+            size = self.current_file.stat().st_size if self.current_file.exists() else 0
+            handle = open(self.current_file, 'ab')
+            for item_id, content in entries:
+                data = (content + '\n\n').encode('utf-8')
+                if size and size + len(data) > self.max_file_bytes:
+                    handle.flush()
+                    os.fsync(handle.fileno())
+                    synced = len(written)
+                    handle.close()
+                    self.index += 1
+                    size = 0
+                    handle = open(self.current_file, 'ab')
+                handle.write(data)
+                size += len(data)
+                written.append(item_id)
+            handle.flush()
+            os.fsync(handle.fileno())
+        except OSError as e:
+            logger.error("Error writing to %s: %s", self.current_file, e, extra={'stage': 'sink_flush'})
+            # Only articles known to be on disk are acknowledged
+            return written[:synced]
+        finally:
+            if handle:
+                handle.close()
+        return written
+
+
+class NullSink(Sink):
+    """Discards articles, acknowledging them immediately. Useful for benchmarking."""
+    
+    name = 'null'
+    
+    def _write_batch(self, entries: List[Tuple[str, str]]) -> List[str]:
+        return [item_id for item_id, _ in entries]
+
+
+def create_sink(output: OutputConfig, drive_client: Optional[GoogleDriveClient] = None,
+                min_interval: float = 0) -> Sink:
+    """
+    Create the sink described by an output configuration.
+    
+    Args:
+        output: Output configuration
+        drive_client: Docs client, required for 'google_docs' outputs
+        min_interval: Minimum seconds between Google Docs appends
+    
+    Returns:
+        Configured sink
+    """
+    options = output.options
+    if output.type == 'google_docs':
+        return GoogleDocsSink(
+            drive_client,
+            max_bytes=options.get('max_batch_bytes', 500000),
+            max_delay=options.get('max_delay', 60),
+            min_interval=min_interval
+        )
+    if output.type == 'file':
+        return RotatingFileSink(
+            options['directory'],
+            prefix=options.get('prefix', 'articles'),
+            file_format=options.get('format', 'markdown'),
+            max_file_bytes=options.get('max_file_bytes', 2000000),
+            max_bytes=options.get('max_batch_bytes', 1000000),
+            max_delay=options.get('max_delay', 60)
+        )
+    if output.type == 'null':
+        return NullSink()
+    raise ValueError(f"Unknown output type: {output.type}")
@@ -0,0 +1,72 @@
+"""Warm-start snapshots of the runner's working state."""
+
+import gzip
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Optional
+from .metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+
+class SnapshotStore:
+    """
+    Persists a snapshot of working state that is not part of the state file.
+    
+    The snapshot is a gzipped JSON document, written atomically. It is a
+    cache: a missing, corrupt or incompatible snapshot only means a cold
+    start.
+    """
+    
+    def __init__(self, snapshot_file: str):
+        """
+        Initialize snapshot store.
+        
+        Args:
+            snapshot_file: Path of the snapshot file
+        """
+        self.snapshot_file = Path(snapshot_file)
+    
+    def save(self, data: dict):
+        """
+        Write a snapshot.
+        
+        Args:
+            data: JSON-serialisable snapshot contents
+        """
+        try:
+            temp_file = self.snapshot_file.with_name(self.snapshot_file.name + '.tmp')
+            with REGISTRY.time('snapshot_save'):
+                with gzip.open(temp_file, 'wt', encoding='utf-8') as f:
+                    json.dump({'version': SNAPSHOT_VERSION, **data}, f, separators=(',', ':'))
+                os.replace(temp_file, self.snapshot_file)
+        except IOError as e:
+            REGISTRY.inc('snapshot_errors_total', operation='save')
+            logger.warning("Could not save snapshot: %s", e)
+    
+    def load(self) -> Optional[dict]:
+        """
+        Read the snapshot.
+        
+        Returns:
+            Snapshot contents, or None if there is no usable snapshot
+        """
+        if not self.snapshot_file.exists():
+            return None
+        try:
+            with REGISTRY.time('snapshot_load'):
+                with gzip.open(self.snapshot_file, 'rt', encoding='utf-8') as f:
+                    data = json.load(f)
+        except (OSError, EOFError, ValueError) as e:
+            REGISTRY.inc('snapshot_errors_total', operation='load')
+            logger.warning("Could not load snapshot: %s", e)
+            return None
+        if not isinstance(data, dict) or data.get('version') != SNAPSHOT_VERSION:
+            logger.warning("Ignoring snapshot with unsupported version %s",
+                           data.get('version') if isinstance(data, dict) else None)
+            return None
+        return data
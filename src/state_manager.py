@@ -1,9 +1,14 @@
 """State management to track processed articles."""
 
 import json
+import logging
+import os
 from pathlib import Path
-from typing import Set, Optional
+from typing import Dict, Iterable, Set, Optional, Tuple
 from datetime import datetime
+from .metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
 
 
 class StateManager:
@@ -18,32 +23,82 @@ class StateManager:
         """
         self.state_file = Path(state_file)
         self.processed_items: Set[str] = set()
+        # Items written to some outputs but not all, with the outputs written
+        self.partially_written: Dict[str, Set[str]] = {}
+        # (mtime, size) of the state file as last read or written by us
+        self._file_signature: Optional[Tuple[int, int]] = None
         self._load_state()
     
     def _load_state(self):
         """Load state from file."""
+        with REGISTRY.time('state_load'):
+            self._read_state_file()
+        self._file_signature = self._current_signature()
+        REGISTRY.set_gauge('state_processed_items', len(self.processed_items))
+    
+    def _current_signature(self) -> Optional[Tuple[int, int]]:
+        """Get the state file's (mtime, size), or None if it does not exist."""
+        try:
+            stat = self.state_file.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    def refresh(self):
+        """
+        Merge in items processed by other processes since the file was last read.
+        
+        The file is only re-read if it changed since we last read or wrote it.
+        """
+        if self._current_signature() == self._file_signature:
+            return
+        processed = self.processed_items
+        partially_written = self.partially_written
+        self._load_state()
+        self.processed_items |= processed
+        for item_id, outputs in partially_written.items():
+            self.partially_written.setdefault(item_id, set()).update(outputs)
+        for item_id in self.processed_items & set(self.partially_written):
+            del self.partially_written[item_id]
+    
+    def _read_state_file(self):
+        """Read processed items from the state file."""
         if self.state_file.exists():
             try:
                 with open(self.state_file, 'r') as f:
                     data = json.load(f)
                     self.processed_items = set(data.get('processed_items', []))
+                    self.partially_written = {item_id: set(outputs) for item_id, outputs
+                                              in data.get('partially_written', {}).items()}
             except (json.JSONDecodeError, IOError) as e:
-                print(f"Warning: Could not load state file: {e}")
+                logger.warning("Could not load state file: %s", e, extra={'stage': 'state_load'})
                 self.processed_items = set()
+                self.partially_written = {}
         else:
             self.processed_items = set()
+            self.partially_written = {}
     
     def _save_state(self):
         """Save state to file."""
         try:
             data = {
                 'processed_items': list(self.processed_items),
+                'partially_written': {item_id: sorted(outputs)
+                                      for item_id, outputs in self.partially_written.items()},
                 'last_updated': datetime.now().isoformat()
             }
-            with open(self.state_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Write to a temporary file and rename it into place, so a crash
+            # or a concurrent reader never sees a partially written file
+            temp_file = self.state_file.with_name(self.state_file.name + '.tmp')
+            with REGISTRY.time('state_save'):
+                with open(temp_file, 'w') as f:
+                    json.dump(data, f, indent=2)
+                os.replace(temp_file, self.state_file)
+            self._file_signature = self._current_signature()
+            REGISTRY.set_gauge('state_processed_items', len(self.processed_items))
         except IOError as e:
-            print(f"Warning: Could not save state file: {e}")
+            REGISTRY.inc('state_save_errors_total')
+            logger.warning("Could not save state file: %s", e, extra={'stage': 'state_save'})
     
     def is_processed(self, item_id: str) -> bool:
         """
@@ -64,7 +119,43 @@ class StateManager:
         Args:
             item_id: Unique identifier for the RSS item
         """
-        self.processed_items.add(item_id)
+        self.record_writes(None, [], [item_id])
+    
+    def mark_processed_many(self, item_ids: Iterable[str]):
+        """
+        Mark several items as processed, saving the state file once.
+        
+        Args:
+            item_ids: Unique identifiers for the RSS items
+        """
+        self.record_writes(None, [], item_ids)
+    
+    def written_outputs(self, item_id: str) -> Set[str]:
+        """
+        Get the outputs an unprocessed item has already been written to.
+        
+        Args:
+            item_id: Unique identifier for the RSS item
+            
+        Returns:
+            Keys of the outputs that acknowledged the item
+        """
+        return set(self.partially_written.get(item_id, ()))
+    
+    def record_writes(self, output: Optional[str], written: Iterable[str], completed: Iterable[str]):
+        """
+        Record items written to an output, saving the state file once.
+        
+        Args:
+            output: Key of the output that wrote the items in ``written``
+            written: Items the output wrote that other outputs still have to write
+            completed: Items now written to every output, marked processed
+        """
+        for item_id in written:
+            self.partially_written.setdefault(item_id, set()).add(output)
+        for item_id in completed:
+            self.processed_items.add(item_id)
+            self.partially_written.pop(item_id, None)
         self._save_state()
     
     def get_unprocessed_items(self, items, id_key: str = 'id') -> list:
@@ -78,6 +169,11 @@ class StateManager:
         Returns:
             List of unprocessed items
         """
+        with REGISTRY.time('dedup'):
+            return self._filter_unprocessed(items, id_key)
+    
+    def _filter_unprocessed(self, items, id_key: str) -> list:
+        """Return the items whose ID has not been processed yet."""
         unprocessed = []
         for item in items:
             # Try to get ID as attribute first, then as dict key
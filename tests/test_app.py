@@ -0,0 +1,262 @@
+"""Tests for the main application loop."""
+
+import unittest
+import os
+import tempfile
+import time
+import yaml
+from unittest import mock
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.app import RSSToNotebookLMApp
+from src.process_lock import ProcessLock
+from src.rss_parser import RSSItem
+
+
+def make_items(feed_url, count):
+    """Create RSS items for a feed."""
+    return [
+        RSSItem({'title': f'Article {i}', 'link': f'{feed_url}/{i}', 'id': f'{feed_url}#{i}'}, feed_url)
+        for i in range(count)
+    ]
+
+
+class TestRSSToNotebookLMApp(unittest.TestCase):
+    """Tests for RSSToNotebookLMApp class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.config_path = Path(self.temp_dir) / "config.yaml"
+        self.feeds = {
+            'https://a.example.com/feed': make_items('https://a.example.com', 3),
+            'https://b.example.com/feed': make_items('https://b.example.com', 3),
+        }
+    
+    def write_config(self, feeds=None, outputs=None, **settings):
+        """Write the config file, bumping its mtime so changes are detected."""
+        config_data = {
+            'google_drive': {'document_id': 'doc123'},
+            'feeds': feeds if feeds is not None else [{'url': url} for url in self.feeds],
+            'settings': {
+                'state_file': str(Path(self.temp_dir) / 'state.json'),
+                'request_delay': 0,
+                **settings
+            }
+        }
+        if outputs is not None:
+            config_data['outputs'] = outputs
+        with open(self.config_path, 'w') as f:
+            yaml.dump(config_data, f)
+        self.mtime = getattr(self, 'mtime', time.time()) + 10
+        os.utime(self.config_path, (self.mtime, self.mtime))
+    
+    def create_app(self, **settings):
+        """Create an app with mocked feeds, extraction and Docs client."""
+        self.write_config(**settings)
+        
+        drive_client = mock.Mock()
+        drive_client.append_content.return_value = True
+        drive_client.get_document_info.return_value = {'title': 'Doc', 'document_id': 'doc123'}
+        app = RSSToNotebookLMApp(str(self.config_path), drive_client=drive_client)
+        app.rss_parser.fetch_feed = lambda url, timeout=None: self.feeds[url]
+        return app
+    
+    def test_run_once_processes_all_items(self):
+        """Test a run appends every new item once."""
+        app = self.create_app()
+        app.content_extractor.extract_with_metadata = lambda url, title, timeout=None: f"# {title}"
+        
+        self.assertEqual(app.run_once(), 6)
+        # Buffered articles go to the Google Doc in a single append
+        app.drive_client.append_content.assert_called_once_with(
+            '\n\n'.join(f"# Article {i}" for i in [0, 1, 2, 0, 1, 2])
+        )
+        self.assertEqual(app.run_once(), 0)
+    
+    def test_failed_write_is_not_committed(self):
+        """Test items are only marked processed once the output acknowledges them."""
+        app = self.create_app()
+        app.content_extractor.extract_with_metadata = lambda url, title, timeout=None: f"# {title}"
+        app.drive_client.append_content.return_value = False
+        
+        self.assertEqual(app.run_once(), 0)
+        self.assertEqual(app.state_manager.processed_items, set())
+        
+        app.drive_client.append_content.return_value = True
+        self.assertEqual(app.run_once(), 6)
+        self.assertEqual(len(app.state_manager.processed_items), 6)
+    
+    def test_partial_write_only_retries_failed_sink(self):
+        """Test an item written by one output is retried only on the output that failed."""
+        directory = Path(self.temp_dir) / 'sources'
+        outputs = [{'type': 'google_docs'}, {'type': 'file', 'directory': str(directory)}]
+        app = self.create_app(outputs=outputs)
+        app.content_extractor.extract_with_metadata = lambda url, title, timeout=None: f"# {title}"
+        app.drive_client.append_content.return_value = False
+        
+        self.assertEqual(app.run_once(), 0)
+        self.assertEqual(app.state_manager.processed_items, set())
+        
+        # The file output's acknowledgements survive a restart
+        drive_client = app.drive_client
+        app = RSSToNotebookLMApp(str(self.config_path), drive_client=drive_client)
+        app.rss_parser.fetch_feed = lambda url, timeout=None: self.feeds[url]
+        app.content_extractor.extract_with_metadata = lambda url, title, timeout=None: f"# {title}"
+        self.assertEqual(app.run_once(), 0)
+        
+        drive_client.append_content.return_value = True
+        self.assertEqual(app.run_once(), 6)
+        self.assertEqual(len(app.state_manager.processed_items), 6)
+        self.assertEqual(app.state_manager.partially_written, {})
+        
+        written = ''.join(path.read_text() for path in directory.iterdir())
+        self.assertEqual(written.count('# Article 0'), 2)
+        self.assertEqual(written.count('# Article 1'), 2)
+        self.assertEqual(drive_client.append_content.call_args.args[0].count('# Article 0'), 2)
+    
+    def test_deadline_carries_unfinished_items(self):
+        """Test that a cycle deadline stops work and carries items over."""
+        app = self.create_app(cycle_deadline=0.3, workers=2)
+        
+        def slow_extract(url, title, timeout=None):
+            time.sleep(0.2)
+            return f"# {title}"
+        app.content_extractor.extract_with_metadata = slow_extract
+        
+        processed = app.run_once()
+        self.assertLess(processed, 6)
+        self.assertEqual(processed + len(app.pending_items), 6)
+        
+        # Carried items are processed first in the next cycle
+        carried = [item.id for item in app.pending_items]
+        app.config.cycle_deadline = 0
+        app.content_extractor.extract_with_metadata = lambda url, title, timeout=None: f"# {title}"
+        self.assertEqual(app.run_once(), len(carried))
+        appended = app.drive_client.append_content.call_args.args[0]
+        self.assertTrue(appended.startswith(f"# Article {carried[0].rsplit('#')[1]}"))
+        self.assertEqual(app.pending_items, [])
+    
+    def test_deadline_caps_feed_timeout(self):
+        """Test feed requests are given no more time than is left in the cycle."""
+        app = self.create_app(cycle_deadline=5)
+        app.content_extractor.extract_with_metadata = lambda url, title, timeout=None: f"# {title}"
+        timeouts = []
+        
+        def fetch_feed(url, timeout=None):
+            timeouts.append(timeout)
+            return self.feeds[url]
+        app.rss_parser.fetch_feed = fetch_feed
+        
+        app.run_once()
+        self.assertEqual(len(timeouts), 2)
+        self.assertTrue(all(0 < timeout <= 5 for timeout in timeouts))
+    
+    def test_overlapping_run_is_skipped(self):
+        """Test that a run is skipped while another process holds the lock."""
+        app = self.create_app()
+        app.content_extractor.extract_with_metadata = lambda url, title, timeout=None: f"# {title}"
+        
+        other = ProcessLock(str(app.config.lock_file))
+        self.assertTrue(other.acquire())
+        try:
+            self.assertEqual(app.run_once(), 0)
+            app.drive_client.append_content.assert_not_called()
+        finally:
+            other.release()
+        
+        self.assertEqual(app.run_once(), 6)
+    
+    def test_lock_file_directory(self):
+        """Test a missing state directory is created and an unusable lock file skips the run."""
+        app = self.create_app(state_file=str(Path(self.temp_dir) / 'missing' / 'state.json'))
+        app.content_extractor.extract_with_metadata = lambda url, title, timeout=None: f"# {title}"
+        self.assertEqual(app.run_once(), 6)
+        
+        app = self.create_app(lock_file=self.temp_dir)
+        self.assertEqual(app.run_once(), 0)
+        app.drive_client.append_content.assert_not_called()
+    
+    def test_reload_config_applies_changes(self):
+        """Test feeds and settings are swapped in without rebuilding clients."""
+        app = self.create_app()
+        drive_client = app.drive_client
+        session = app.rss_parser.session
+        app.rss_parser.validators['https://b.example.com/feed'] = {'etag': '"1"'}
+        self.assertFalse(app.reload_config())
+        
+        self.feeds['https://c.example.com/feed'] = make_items('https://c.example.com', 1)
+        self.write_config(
+            feeds=[{'url': 'https://a.example.com/feed', 'filter': 'Article 1'},
+                   {'url': 'https://c.example.com/feed'}],
+            check_interval=60,
+            state_file=str(Path(self.temp_dir) / 'other.json')
+        )
+        self.assertTrue(app.reload_config())
+        
+        self.assertEqual([feed.url for feed in app.config.feeds],
+                         ['https://a.example.com/feed', 'https://c.example.com/feed'])
+        self.assertEqual(app.config.feeds[0].filter_text, 'Article 1')
+        self.assertEqual(app.config.check_interval, 60)
+        # Restart-only settings keep their values
+        self.assertEqual(app.config.state_file, Path(self.temp_dir) / 'state.json')
+        self.assertIs(app.drive_client, drive_client)
+        self.assertIs(app.rss_parser.session, session)
+        self.assertNotIn('https://b.example.com/feed', app.rss_parser.validators)
+        
+        app.content_extractor.extract_with_metadata = lambda url, title, timeout=None: f"# {title}"
+        self.assertEqual(app.run_once(), 2)
+    
+    def test_snapshot_warm_start(self):
+        """Test a new app resumes feed caches, carried items and schedule from a snapshot."""
+        app = self.create_app()
+        feed_a, feed_b = 'https://a.example.com/feed', 'https://b.example.com/feed'
+        app.rss_parser.validators[feed_a] = {'etag': '"1"'}
+        app.rss_parser.cached_items[feed_a] = self.feeds[feed_a]
+        app.rss_parser.cached_items[feed_b] = self.feeds[feed_b]
+        app.pending_items = self.feeds[feed_b][:1]
+        app.last_cycle_time = time.time() - 10
+        app.save_snapshot()
+        
+        # Feed b has been removed from the configuration since
+        restarted = self.create_app(feeds=[{'url': feed_a}])
+        restarted.run_once = mock.Mock(return_value=0)
+        with mock.patch.object(restarted, '_wait_for_next_cycle') as wait:
+            restarted.run_continuous(max_cycles=1)
+        
+        # The first cycle waits out the rest of the previous interval
+        cycle_end = wait.call_args.args[0]
+        self.assertAlmostEqual(time.monotonic() - cycle_end, 10, delta=1)
+        self.assertEqual(restarted.rss_parser.validators, {feed_a: {'etag': '"1"'}})
+        self.assertEqual([item.id for item in restarted.rss_parser.cached_items[feed_a]],
+                         [item.id for item in self.feeds[feed_a]])
+        self.assertEqual(restarted.pending_items, [])
+    
+    def test_malformed_snapshot_means_cold_start(self):
+        """Test a snapshot that loads but has the wrong shape is ignored as a whole."""
+        app = self.create_app()
+        feed_a = 'https://a.example.com/feed'
+        for data in ({'feeds': {feed_a: {'validators': {'etag': '"1"'}}}},
+                     {'feeds': {feed_a: {'validators': {}, 'items': ['not an item']}}},
+                     {'feeds': {}, 'pending_items': [{'id': 'x', 'published': 'yesterday'}]},
+                     {'feeds': {}, 'last_cycle_time': 'noon'}):
+            app.snapshot_store.save(data)
+            restarted = self.create_app()
+            self.assertFalse(restarted.restore_snapshot())
+            self.assertEqual(restarted.rss_parser.validators, {})
+            self.assertIsNone(restarted.last_cycle_time)
+    
+    def test_reload_config_rejects_invalid(self):
+        """Test an invalid config file leaves the current configuration in place."""
+        app = self.create_app()
+        config = app.config
+        self.write_config(feeds=[])
+        self.assertFalse(app.reload_config())
+        self.assertIs(app.config, config)
+
+
+if __name__ == '__main__':
+    unittest.main()
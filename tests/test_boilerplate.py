@@ -0,0 +1,84 @@
+"""Tests for site boilerplate detection."""
+
+import unittest
+import tempfile
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.boilerplate import BoilerplateModel
+
+
+class TestBoilerplateModel(unittest.TestCase):
+    """Tests for BoilerplateModel class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.model_file = str(Path(self.temp_dir) / "boilerplate.json")
+    
+    def article(self, i):
+        """Blocks of an article with a shared cookie banner and footer."""
+        return ["We use cookies.", f"Unique paragraph {i}.", f"Another line {i}.", "Subscribe now!"]
+    
+    def test_learns_repeated_blocks_per_domain(self):
+        """Test repeated blocks are dropped once enough articles were seen."""
+        model = BoilerplateModel(self.model_file, min_articles=3, threshold=0.5)
+        
+        for i in range(3):
+            self.assertEqual(model.filter_blocks(f"https://news.example.com/{i}", self.article(i)),
+                             self.article(i))
+        
+        kept = model.filter_blocks("https://news.example.com/3", self.article(3))
+        self.assertEqual(kept, ["Unique paragraph 3.", "Another line 3."])
+        
+        # Other sites are unaffected
+        other = model.filter_blocks("https://blog.example.org/1", self.article(4))
+        self.assertEqual(other, self.article(4))
+    
+    def test_matching_ignores_case_and_whitespace(self):
+        """Test blocks are matched after normalisation."""
+        self.assertEqual(BoilerplateModel.fingerprint("We  use\nCookies."),
+                         BoilerplateModel.fingerprint("we use cookies."))
+    
+    def test_never_drops_everything(self):
+        """Test an article made only of boilerplate is kept intact."""
+        blocks = ["Site navigation menu", "Copyright footer text"]
+        model = BoilerplateModel(self.model_file, min_articles=1)
+        model.filter_blocks("https://example.com/1", blocks)
+        self.assertEqual(model.filter_blocks("https://example.com/2", blocks), blocks)
+    
+    def test_short_blocks_kept(self):
+        """Test blocks below the minimum length are never dropped."""
+        model = BoilerplateModel(self.model_file, min_articles=1)
+        model.filter_blocks("https://example.com/1", ["Share", "We use cookies."])
+        self.assertEqual(model.filter_blocks("https://example.com/2", ["Share", "We use cookies.", "Text 2."]),
+                         ["Share", "Text 2."])
+    
+    def test_persistence(self):
+        """Test the model is saved and reloaded."""
+        model = BoilerplateModel(self.model_file, min_articles=2)
+        for i in range(2):
+            model.filter_blocks(f"https://example.com/{i}", self.article(i))
+        model.save()
+        
+        reloaded = BoilerplateModel(self.model_file, min_articles=2)
+        kept = reloaded.filter_blocks("https://example.com/9", self.article(9))
+        self.assertEqual(kept, ["Unique paragraph 9.", "Another line 9."])
+    
+    def test_bounded_size(self):
+        """Test block and domain counts stay within bounds."""
+        model = BoilerplateModel(self.model_file, max_blocks_per_domain=20, max_domains=3)
+        for i in range(50):
+            model.filter_blocks("https://example.com/a", [f"text block {i}-{j}" for j in range(5)])
+        self.assertLessEqual(len(model.domains["example.com"]["blocks"]), 20)
+        
+        for i in range(5):
+            model.filter_blocks(f"https://site{i}.example.com/a", ["some article text"])
+        self.assertLessEqual(len(model.domains), 3)
+        self.assertIn("site4.example.com", model.domains)
+
+
+if __name__ == '__main__':
+    unittest.main()
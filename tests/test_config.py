@@ -103,6 +103,71 @@ class TestAppConfig(unittest.TestCase):
         with self.assertRaises(ValueError):
             AppConfig(str(self.config_path))
     
+    def test_feed_scheduling_options(self):
+        """Test feed weights, caps and scheduling settings."""
+        config_data = {
+            'google_drive': {
+                'document_id': 'doc123'
+            },
+            'feeds': [
+                {'url': 'https://example.com/feed.xml', 'weight': 3, 'max_items': 5},
+                {'url': 'https://example.com/feed2.xml'}
+            ],
+            'settings': {
+                'scheduling': 'weighted',
+                'newest_first': True
+            }
+        }
+        self.create_config_file(config_data)
+        
+        config = AppConfig(str(self.config_path))
+        self.assertEqual(config.feeds[0].weight, 3)
+        self.assertEqual(config.feeds[0].max_items, 5)
+        self.assertEqual(config.feeds[1].weight, 1.0)
+        self.assertEqual(config.feeds[1].max_items, 0)
+        self.assertEqual(config.scheduling, 'weighted')
+        self.assertTrue(config.newest_first)
+        
+        config_data['feeds'][0]['weight'] = 0
+        self.create_config_file(config_data)
+        with self.assertRaises(ValueError):
+            AppConfig(str(self.config_path))
+        
+        config_data['feeds'][0]['weight'] = 1
+        for max_items in ('5', -1, 2.5):
+            config_data['feeds'][0]['max_items'] = max_items
+            self.create_config_file(config_data)
+            with self.assertRaises(ValueError):
+                AppConfig(str(self.config_path))
+    
+    def test_outputs(self):
+        """Test output configuration and when a document ID is required."""
+        config_data = {
+            'feeds': [
+                {'url': 'https://example.com/feed.xml'}
+            ],
+            'outputs': [
+                {'type': 'file', 'directory': 'out', 'max_file_bytes': 1000},
+                {'type': 'null'}
+            ]
+        }
+        self.create_config_file(config_data)
+        
+        config = AppConfig(str(self.config_path))
+        self.assertIsNone(config.document_id)
+        self.assertEqual([output.type for output in config.outputs], ['file', 'null'])
+        self.assertEqual(config.outputs[0].options, {'directory': 'out', 'max_file_bytes': 1000})
+        
+        config_data['outputs'].append({'type': 'google_docs'})
+        self.create_config_file(config_data)
+        with self.assertRaises(ValueError):
+            AppConfig(str(self.config_path))
+        
+        config_data['outputs'] = [{'type': 'file'}]
+        self.create_config_file(config_data)
+        with self.assertRaises(ValueError):
+            AppConfig(str(self.config_path))
+    
     def test_default_settings(self):
         """Test default settings are applied."""
         config_data = {
@@ -119,6 +184,29 @@ class TestAppConfig(unittest.TestCase):
         config = AppConfig(str(self.config_path))
         self.assertEqual(config.check_interval, 3600)  # Default
         self.assertEqual(config.max_articles_per_run, 0)  # Default
+        self.assertEqual([output.type for output in config.outputs], ['google_docs'])
+        self.assertEqual(config.log_level, 'INFO')
+        self.assertEqual(config.boilerplate_file, Path(f"{config.state_file}.boilerplate.json"))
+        self.assertEqual(config.log_format, 'text')
+    
+    def test_logging_options(self):
+        """Test logging level and format validation."""
+        config_data = {
+            'google_drive': {'document_id': 'doc123'},
+            'feeds': [{'url': 'https://example.com/feed.xml'}],
+            'logging': {'level': 'debug', 'format': 'json', 'repeat_limit': 0}
+        }
+        self.create_config_file(config_data)
+        
+        config = AppConfig(str(self.config_path))
+        self.assertEqual(config.log_level, 'DEBUG')
+        self.assertEqual(config.log_format, 'json')
+        self.assertEqual(config.log_repeat_limit, 0)
+        
+        config_data['logging'] = {'format': 'xml'}
+        self.create_config_file(config_data)
+        with self.assertRaises(ValueError):
+            AppConfig(str(self.config_path))
 
 
 if __name__ == '__main__':
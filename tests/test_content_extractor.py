@@ -0,0 +1,178 @@
+"""Tests for content extraction."""
+
+import unittest
+import io
+import tempfile
+from pathlib import Path
+import sys
+
+import requests
+from requests.adapters import BaseAdapter
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import content_extractor
+from src.boilerplate import BoilerplateModel
+from src.content_extractor import ContentExtractor
+
+
+def make_pdf(pages):
+    """Build a minimal PDF with one line of text per page."""
+    objects = ['<</Type/Catalog/Pages 2 0 R>>',
+               '<</Type/Pages/Kids[%s]/Count %d>>' % (
+                   ' '.join(f'{4 + 2 * i} 0 R' for i in range(len(pages))), len(pages)),
+               '<</Type/Font/Subtype/Type1/BaseFont/Helvetica>>']
+    for i, text in enumerate(pages):
+        stream = f'BT /F1 24 Tf 72 700 Td ({text}) Tj ET'
+        objects.append(f'<</Type/Page/Parent 2 0 R/MediaBox[0 0 612 792]/Contents {5 + 2 * i} 0 R'
+                       '/Resources<</Font<</F1 3 0 R>>>>>>')
+        objects.append(f'<</Length {len(stream)}>>stream\n{stream}\nendstream')
+    
+    pdf = b'%PDF-1.4\n'
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += f'{number} 0 obj{body}endobj\n'.encode('latin-1')
+    xref = len(pdf)
+    pdf += f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode('latin-1')
+    pdf += ''.join(f'{offset:010d} 00000 n \n' for offset in offsets).encode('latin-1')
+    pdf += f'trailer<</Size {len(objects) + 1}/Root 1 0 R>>\nstartxref\n{xref}\n%%EOF'.encode('latin-1')
+    return pdf
+
+
+class CountingRaw(io.BytesIO):
+    """Response body that records how many bytes were read."""
+    
+    bytes_read = 0
+    
+    def read(self, size=-1, **kwargs):
+        data = super().read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+class StreamingAdapter(BaseAdapter):
+    """Serves one body as a streamed (unread) response."""
+    
+    def __init__(self, body, content_type, headers=None):
+        super().__init__()
+        self.raw = CountingRaw(body)
+        self.content_type = content_type
+        self.headers = headers or {}
+    
+    def send(self, request, **kwargs):
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        response.status_code = 200
+        response.raw = self.raw
+        response.headers['Content-Type'] = self.content_type
+        response.headers.update(self.headers)
+        return response
+    
+    def close(self):
+        pass
+
+
+class TestContentExtractor(unittest.TestCase):
+    """Tests for ContentExtractor class."""
+    
+    def extract(self, extractor, body, content_type, headers=None):
+        """Extract a body served with the given content type."""
+        adapter = StreamingAdapter(body, content_type, headers)
+        extractor.session.mount('https://', adapter)
+        return extractor.extract_content('https://example.com/article'), adapter.raw.bytes_read
+    
+    def test_stops_after_main_content(self):
+        """Test HTML download stops once the main element is closed."""
+        body = (b'<html><body><main><p>Hello</p><article><p>World</p></article></main>'
+                + b'<p>comment</p>' * 100000 + b'</body></html>')
+        content, read = self.extract(ContentExtractor(), body, 'text/html; charset=utf-8')
+        self.assertEqual(content, 'Hello\n\nWorld')
+        self.assertLess(read, len(body))
+    
+    def test_ignores_main_content_in_removed_elements(self):
+        """Test articles in headers and sidebars do not end the download early."""
+        padding = b'<p>' + b'x' * 70000 + b'</p>'
+        body = (b'<html><body><header><article>Teaser</article></header>' + padding
+                + b'<div class="content"><p>Real body</p></div></body></html>')
+        content, read = self.extract(ContentExtractor(), body, 'text/html')
+        self.assertEqual(content, 'Real body')
+        self.assertEqual(read, len(body))
+        
+        body = (b'<html><body><aside><article>Related</article></aside>' + padding
+                + b'<main><p>Body</p></main>' + b'<p>comment</p>' * 100000 + b'</body></html>')
+        content, read = self.extract(ContentExtractor(), body, 'text/html')
+        self.assertEqual(content, 'Body')
+        self.assertLess(read, len(body))
+        
+        # A teaser <article> before the <main> is not the article extracted
+        body = (b'<html><body><div class="promo"><article>teaser</article></div>' + padding
+                + b'<main>real body</main></body></html>')
+        content, read = self.extract(ContentExtractor(), body, 'text/html')
+        self.assertEqual(content, 'real body')
+        self.assertEqual(read, len(body))
+    
+    def test_boilerplate_keeps_inline_text(self):
+        """Test links and bold words repeated across articles stay in their paragraphs."""
+        model = BoilerplateModel(str(Path(tempfile.mkdtemp()) / 'boilerplate.json'), min_articles=5)
+        extractor = ContentExtractor(boilerplate=model)
+        for i in range(7):
+            body = (f'<html><body><article><p>Sign up for our daily newsletter.</p>'
+                    f'<p>Story {i} according to <a href="/r">Reuters</a>, the <b>Fed</b> said.</p>'
+                    f'</article></body></html>').encode()
+            content, _ = self.extract(extractor, body, 'text/html')
+        self.assertEqual(content, 'Story 6 according to\n\nReuters\n\n, the\n\nFed\n\nsaid.')
+    
+    def test_truncates_at_byte_budget(self):
+        """Test HTML without a main element is read up to max_bytes."""
+        body = b'<html><body>' + b'<p>text</p>' * 1000000
+        content, read = self.extract(ContentExtractor(max_bytes=100000), body, 'text/html')
+        self.assertTrue(content.startswith('text'))
+        self.assertLessEqual(read, 100000 + content_extractor.CHUNK_SIZE)
+    
+    def test_sniffs_and_skips_other_types(self):
+        """Test untyped HTML is recognised and other media is skipped after one chunk."""
+        content, _ = self.extract(ContentExtractor(), b'<!DOCTYPE html><html><body><p>Hi</p>', '')
+        self.assertEqual(content, 'Hi')
+        
+        content, read = self.extract(ContentExtractor(), b'\x00' * 10000000, 'video/mp4')
+        self.assertIsNone(content)
+        self.assertEqual(read, content_extractor.CHUNK_SIZE)
+    
+    def test_extracts_plain_text_and_xml(self):
+        """Test plain text and XML are extracted whole, up to max_bytes."""
+        body = b'First line\n\nSecond line\n' + b'more text\n' * 20000
+        content, read = self.extract(ContentExtractor(), body, 'text/plain; charset=utf-8')
+        self.assertTrue(content.startswith('First line\n\nSecond line\n\nmore text'))
+        self.assertEqual(read, len(body))
+        
+        content, read = self.extract(ContentExtractor(max_bytes=100000), body * 10, 'text/plain')
+        self.assertLessEqual(read, 100000 + content_extractor.CHUNK_SIZE)
+        
+        body = (b'<?xml version="1.0"?><html xmlns="http://www.w3.org/1999/xhtml"><body>'
+                b'<nav>Menu</nav><main><p>XHTML body</p></main></body></html>')
+        content, _ = self.extract(ContentExtractor(), body, 'text/xml')
+        self.assertEqual(content, 'XHTML body')
+    
+    @unittest.skipIf(content_extractor.PdfReader is None, "pypdf not installed")
+    def test_pdf_page_limit(self):
+        """Test PDF text is extracted up to max_pdf_pages."""
+        pdf = make_pdf(['First page', 'Second page', 'Third page'])
+        content, _ = self.extract(ContentExtractor(max_pdf_pages=2), pdf, 'application/octet-stream')
+        self.assertEqual(content, 'First page\n\nSecond page')
+    
+    @unittest.skipIf(content_extractor.PdfReader is None, "pypdf not installed")
+    def test_pdf_size_limit(self):
+        """Test PDFs over max_pdf_bytes are skipped, with or without Content-Length."""
+        pdf = make_pdf(['Page'])
+        extractor = ContentExtractor(max_pdf_bytes=100)
+        content, _ = self.extract(extractor, pdf, 'application/pdf',
+                                  {'Content-Length': str(len(pdf))})
+        self.assertIsNone(content)
+        content, _ = self.extract(extractor, pdf, 'application/pdf')
+        self.assertIsNone(content)
+
+
+if __name__ == '__main__':
+    unittest.main()
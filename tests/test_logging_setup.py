@@ -0,0 +1,108 @@
+"""Tests for logging setup."""
+
+import unittest
+import io
+import json
+import logging
+import queue
+import threading
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.logging_setup import (
+    NonBlockingQueueHandler, RepeatFilter, configure_logging, log_context, shutdown_logging
+)
+from src.metrics import REGISTRY
+
+
+class TestLoggingSetup(unittest.TestCase):
+    """Tests for configure_logging and its filters."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.stream = io.StringIO()
+        self.logger = logging.getLogger('test_logging_setup')
+        self.old_level = logging.getLogger().level
+    
+    def tearDown(self):
+        """Remove the logging configuration."""
+        shutdown_logging()
+        logging.getLogger().setLevel(self.old_level)
+    
+    def lines(self):
+        """Stop the writer thread and return what it wrote."""
+        shutdown_logging()
+        return self.stream.getvalue().splitlines()
+    
+    def test_json_fields_from_context(self):
+        """Test JSON records carry context fields, with explicit extras taking precedence."""
+        configure_logging(fmt='json', stream=self.stream)
+        with log_context(feed='https://example.com/feed', item='item-1'):
+            self.logger.warning("Failed %s", 'fetch', extra={'stage': 'article_fetch'})
+            with log_context(item='item-2'):
+                self.logger.info("Inner")
+        self.logger.info("Outside")
+        
+        first, inner, outside = [json.loads(line) for line in self.lines()]
+        self.assertEqual(first['level'], 'WARNING')
+        self.assertEqual(first['logger'], 'test_logging_setup')
+        self.assertEqual(first['message'], 'Failed fetch')
+        self.assertEqual(first['feed'], 'https://example.com/feed')
+        self.assertEqual(first['item'], 'item-1')
+        self.assertEqual(first['stage'], 'article_fetch')
+        self.assertEqual(inner['item'], 'item-2')
+        self.assertNotIn('feed', outside)
+    
+    def test_context_is_per_thread(self):
+        """Test fields set in one thread do not leak into another."""
+        configure_logging(fmt='json', stream=self.stream)
+        with log_context(feed='main'):
+            thread = threading.Thread(target=self.logger.info, args=("From thread",))
+            thread.start()
+            thread.join()
+        
+        record = json.loads(self.lines()[0])
+        self.assertNotIn('feed', record)
+    
+    def test_level_and_text_format(self):
+        """Test records below the level are skipped and warnings show their level."""
+        configure_logging(level='warning', stream=self.stream)
+        self.logger.info("Hidden")
+        self.logger.error("Shown")
+        self.assertEqual(self.lines(), ['ERROR: Shown'])
+        
+        with self.assertRaises(ValueError):
+            configure_logging(level='LOUD')
+        with self.assertRaises(ValueError):
+            configure_logging(fmt='xml')
+    
+    def test_repeated_warnings_suppressed(self):
+        """Test repeats of one message template are limited and counted."""
+        repeat_filter = RepeatFilter(limit=2, window=60)
+        records = [logging.LogRecord('app', logging.WARNING, __file__, 1, "Error fetching %s",
+                                     (f"https://example.com/{i}",), None) for i in range(5)]
+        before = REGISTRY.get_counter('log_records_suppressed_total')
+        self.assertEqual([repeat_filter.filter(record) for record in records],
+                         [True, True, False, False, False])
+        info = logging.LogRecord('app', logging.INFO, __file__, 1, "Error fetching %s", ('x',), None)
+        self.assertTrue(repeat_filter.filter(info))
+        
+        # The first record of the next window reports the suppressed count
+        repeat_filter.window = 0
+        self.assertTrue(repeat_filter.filter(records[0]))
+        self.assertEqual(records[0].suppressed, 3)
+        self.assertEqual(REGISTRY.get_counter('log_records_suppressed_total') - before, 3)
+    
+    def test_full_queue_drops_records(self):
+        """Test logging never blocks when the writer thread falls behind."""
+        handler = NonBlockingQueueHandler(queue.Queue(1))
+        record = logging.LogRecord('app', logging.INFO, __file__, 1, "Message", (), None)
+        handler.handle(record)
+        handler.handle(record)
+        self.assertEqual(handler.queue.qsize(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
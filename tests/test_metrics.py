@@ -0,0 +1,96 @@
+"""Tests for metrics collection."""
+
+import unittest
+import json
+import urllib.request
+import urllib.error
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.metrics import MetricsRegistry, MetricsServer
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    """Tests for MetricsRegistry class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.registry = MetricsRegistry()
+    
+    def test_counters_by_label(self):
+        """Test counters are tracked per label set."""
+        self.registry.inc('fetch_total', feed='a')
+        self.registry.inc('fetch_total', feed='a')
+        self.registry.inc('fetch_total', 5, feed='b')
+        self.assertEqual(self.registry.get_counter('fetch_total', feed='a'), 2)
+        self.assertEqual(self.registry.get_counter('fetch_total', feed='b'), 5)
+        self.assertEqual(self.registry.get_counter('fetch_total', feed='c'), 0)
+    
+    def test_time_records_duration_and_errors(self):
+        """Test timing a stage records a histogram and counts errors."""
+        with self.registry.time('parse', feed='a'):
+            pass
+        with self.assertRaises(ValueError):
+            with self.registry.time('parse', feed='a'):
+                raise ValueError("boom")
+        
+        histogram = self.registry.get_histogram('stage_duration_seconds', stage='parse', feed='a')
+        self.assertEqual(histogram.count, 2)
+        self.assertEqual(self.registry.get_counter('stage_errors_total', stage='parse', feed='a'), 1)
+    
+    def test_render_prometheus_format(self):
+        """Test rendering in the Prometheus text format."""
+        self.registry.inc('fetch_total', feed='a "quoted"')
+        self.registry.set_gauge('cycle_duration_seconds', 1.5)
+        self.registry.observe('stage_duration_seconds', 0.2, stage='extract')
+        
+        text = self.registry.render()
+        self.assertIn('# TYPE rss_fetch_total counter', text)
+        self.assertIn('rss_fetch_total{feed="a \\"quoted\\""} 1', text)
+        self.assertIn('rss_cycle_duration_seconds 1.5', text)
+        self.assertIn('rss_stage_duration_seconds_bucket{stage="extract",le="0.25"} 1', text)
+        self.assertIn('rss_stage_duration_seconds_bucket{stage="extract",le="0.1"} 0', text)
+        self.assertIn('rss_stage_duration_seconds_count{stage="extract"} 1', text)
+    
+    def test_render_large_counter_exactly(self):
+        """Test large counters are not rounded on export."""
+        self.registry.inc('bytes_total', 123456789)
+        self.assertIn('rss_bytes_total 123456789\n', self.registry.render())
+
+
+class TestMetricsServer(unittest.TestCase):
+    """Tests for MetricsServer class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.registry = MetricsRegistry()
+        self.server = MetricsServer(self.registry, 0, '127.0.0.1', max_cycle_age=60)
+        self.server.start()
+        self.base_url = f"http://127.0.0.1:{self.server.port}"
+    
+    def tearDown(self):
+        """Stop the server."""
+        self.server.stop()
+    
+    def test_metrics_endpoint(self):
+        """Test /metrics serves the registry contents."""
+        self.registry.inc('cycles_total')
+        with urllib.request.urlopen(f"{self.base_url}/metrics") as response:
+            body = response.read().decode('utf-8')
+        self.assertIn('rss_cycles_total 1', body)
+    
+    def test_healthz_reports_stale_cycle(self):
+        """Test /healthz reports the last successful cycle."""
+        self.registry.set_gauge('cycle_last_success_timestamp_seconds', 0)
+        with self.assertRaises(urllib.error.HTTPError) as context:
+            urllib.request.urlopen(f"{self.base_url}/healthz")
+        self.assertEqual(context.exception.code, 503)
+        details = json.loads(context.exception.read())
+        self.assertEqual(details['status'], 'stale')
+        self.assertEqual(details['last_successful_cycle'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+"""Tests for the inter-process lock."""
+
+import unittest
+import tempfile
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.process_lock import ProcessLock
+
+
+class TestProcessLock(unittest.TestCase):
+    """Tests for ProcessLock class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.lock_file = str(Path(self.temp_dir) / "run.lock")
+    
+    def test_second_holder_is_refused(self):
+        """Test that a held lock cannot be acquired again until released."""
+        first = ProcessLock(self.lock_file)
+        second = ProcessLock(self.lock_file)
+        
+        self.assertTrue(first.acquire())
+        self.assertFalse(second.acquire())
+        self.assertFalse(second.acquire(wait=True, timeout=0.2, poll_interval=0.05))
+        
+        first.release()
+        self.assertTrue(second.acquire())
+        self.assertTrue(second.locked)
+        second.release()
+        self.assertFalse(second.locked)
+    
+    def test_context_manager(self):
+        """Test the lock is held inside a with block."""
+        with ProcessLock(self.lock_file) as lock:
+            self.assertTrue(lock.locked)
+            self.assertFalse(ProcessLock(self.lock_file).acquire())
+        self.assertTrue(ProcessLock(self.lock_file).acquire())
+
+
+if __name__ == '__main__':
+    unittest.main()
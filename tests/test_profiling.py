@@ -0,0 +1,100 @@
+"""Tests for run profiling."""
+
+import unittest
+import pstats
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.metrics import REGISTRY
+from src.profiling import RunProfiler
+
+
+class TestRunProfiler(unittest.TestCase):
+    """Tests for RunProfiler class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+    
+    def test_sampling(self):
+        """Test that only every Nth run or an armed run is profiled."""
+        profiler = RunProfiler(self.temp_dir, every=3)
+        selected = [profiler.should_profile() for _ in range(6)]
+        self.assertEqual(selected, [False, False, True, False, False, True])
+        
+        profiler.arm()
+        self.assertTrue(profiler.should_profile())
+        self.assertFalse(profiler.should_profile())
+    
+    def test_never_sample_without_arming(self):
+        """Test every=0 only profiles when armed."""
+        profiler = RunProfiler(self.temp_dir, every=0)
+        self.assertFalse(any(profiler.should_profile() for _ in range(5)))
+    
+    def test_profile_writes_report(self):
+        """Test profiling a run writes a report including stages."""
+        profiler = RunProfiler(self.temp_dir, every=1)
+        
+        def work():
+            with REGISTRY.time('parse'):
+                data = [str(i) * 10 for i in range(10000)]
+            return len(data)
+        
+        result = profiler.maybe_profile(work)
+        self.assertEqual(result, 10000)
+        
+        reports = list(Path(self.temp_dir).glob('*.txt'))
+        self.assertEqual(len(reports), 1)
+        self.assertEqual(len(list(Path(self.temp_dir).glob('*.prof'))), 1)
+        text = reports[0].read_text()
+        self.assertIn('Peak traced memory', text)
+        self.assertIn('parse', text)
+        self.assertIn('allocation sites', text)
+    
+    def profile_report(self, work):
+        """Profile a function and return its report text and raw stats."""
+        RunProfiler(self.temp_dir).profile(work)
+        name = next(Path(self.temp_dir).glob('*.txt')).stem
+        stats = pstats.Stats(str(Path(self.temp_dir) / f"{name}.prof"))
+        return (Path(self.temp_dir) / f"{name}.txt").read_text(), stats
+    
+    def test_peaks_of_run_and_nested_stages(self):
+        """Test the run peak covers the whole run and stage peaks cover only their stage."""
+        def work():
+            with REGISTRY.time('cycle'):
+                with REGISTRY.time('large'):
+                    data = bytearray(20 * 1024 * 1024)
+                del data
+                with REGISTRY.time('small'):
+                    pass
+        
+        text, _ = self.profile_report(work)
+        peaks = {name: float(value) for name, value in
+                 re.findall(r'^(\w+)\s+[\d.]+s\s+([\d.]+) MiB$', text, re.MULTILINE)}
+        run_peak = float(re.search(r'Peak traced memory: ([\d.]+) MiB', text).group(1))
+        self.assertGreaterEqual(run_peak, 20)
+        self.assertGreaterEqual(peaks['large'], 20)
+        self.assertGreaterEqual(peaks['cycle'], 20)
+        self.assertLess(peaks['small'], 1)
+    
+    def test_worker_threads_profiled(self):
+        """Test functions run in threads started during the run are in the profile."""
+        def worker_task():
+            return sum(range(1000))
+        
+        def work():
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                return list(executor.map(lambda _: worker_task(), range(4)))
+        
+        text, stats = self.profile_report(work)
+        self.assertIn('worker_task', {function for _, _, function in stats.stats})
+        self.assertIn('(0 still running, not included)', text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+"""Tests for recording and replaying runs."""
+
+import unittest
+import tempfile
+import threading
+import time
+import yaml
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.app import RSSToNotebookLMApp
+from src.replay import Recorder, Replayer
+
+FEED = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Test</title>
+<item><title>First</title><link>{base}/articles/1</link><guid>item-1</guid></item>
+<item><title>Second</title><link>{base}/articles/2</link><guid>item-2</guid></item>
+</channel></rss>"""
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Serves a feed and two article pages."""
+    
+    def do_GET(self):
+        if self.path == '/feed.xml':
+            body = FEED.replace(b'{base}', self.server.base_url.encode())
+            content_type = 'application/rss+xml'
+        elif self.path == '/long':
+            body = b'<html><body><main><p>Lead</p></main>' + b'<p>comment</p>' * 200000 + b'</body></html>'
+            content_type = 'text/html'
+        else:
+            body = f"<html><body><article><p>Body of {self.path}</p></article></body></html>".encode()
+            content_type = 'text/html'
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class TestRecordReplay(unittest.TestCase):
+    """Tests for Recorder and Replayer."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.base_url = f"http://127.0.0.1:{self.server.server_port}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        
+        self.config_path = self.temp_dir / 'config.yaml'
+        with open(self.config_path, 'w') as f:
+            yaml.dump({
+                'google_drive': {'document_id': 'doc123'},
+                'feeds': [{'url': f"{self.server.base_url}/feed.xml"}],
+                'settings': {'state_file': str(self.temp_dir / 'state.json'), 'request_delay': 0},
+                'boilerplate': {'enabled': False},
+            }, f)
+    
+    def tearDown(self):
+        """Stop the server if still running."""
+        self.server.shutdown()
+        self.server.server_close()
+    
+    def test_replay_matches_recording_without_network(self):
+        """Test a replayed run makes the same Docs appends as the recorded run."""
+        drive_client = mock.Mock()
+        drive_client.append_content.return_value = True
+        drive_client.get_document_info.return_value = {'title': 'Doc', 'document_id': 'doc123'}
+        app = RSSToNotebookLMApp(str(self.config_path), drive_client=drive_client)
+        
+        archive = self.temp_dir / 'run.jsonl.gz'
+        recorder = Recorder(str(archive))
+        recorder.attach(app)
+        self.assertEqual(app.run_once(), 2)
+        recorder.close()
+        # Feed, two articles, document info and one batched append
+        self.assertEqual(recorder.events, 5)
+        recorded = drive_client.append_content.call_args.args[0]
+        
+        self.server.shutdown()
+        
+        replayer = Replayer(str(archive), speed=0)
+        config_path = replayer.prepare(str(self.temp_dir / 'replay'))
+        docs_client = replayer.docs_client()
+        docs_client.append_content = mock.Mock(wraps=docs_client.append_content)
+        replayed = RSSToNotebookLMApp(str(config_path), drive_client=docs_client)
+        replayer.attach(replayed)
+        
+        self.assertEqual(replayed.run_once(), 2)
+        docs_client.append_content.assert_called_once_with(recorded)
+        # Production state is untouched
+        self.assertEqual(replayed.config.state_file, self.temp_dir / 'replay' / 'state.json')
+    
+    def test_records_only_what_was_read(self):
+        """Test an article download stopped early is recorded up to where it stopped."""
+        app = RSSToNotebookLMApp(str(self.config_path), drive_client=mock.Mock())
+        archive = self.temp_dir / 'run.jsonl.gz'
+        recorder = Recorder(str(archive))
+        recorder.attach(app)
+        url = f"{self.server.base_url}/long"
+        self.assertEqual(app.content_extractor.extract_content(url), 'Lead')
+        recorder.close()
+        
+        replayer = Replayer(str(archive), speed=0)
+        body = replayer.responses[('GET', url)][0]['text']
+        self.assertIn('</main>', body)
+        self.assertLess(len(body), 1000000)
+        
+        replayer.attach(app)
+        self.assertEqual(app.content_extractor.extract_content(url), 'Lead')
+    
+    def test_replay_speed(self):
+        """Test recorded durations are replayed scaled by the speed."""
+        archive = self.temp_dir / 'run.jsonl.gz'
+        recorder = Recorder(str(archive))
+        app = RSSToNotebookLMApp(str(self.config_path), drive_client=mock.Mock())
+        recorder.attach(app)
+        recorder.record('http', 0.2, method='GET', url='http://example.com/', status=200,
+                        headers={}, text='ok')
+        recorder.close()
+        
+        replayer = Replayer(str(archive), speed=4)
+        replayer.attach(app)
+        start = time.perf_counter()
+        response = app.rss_parser.session.get('http://example.com/')
+        self.assertGreaterEqual(time.perf_counter() - start, 0.05)
+        self.assertEqual(response.text, 'ok')
+
+
+if __name__ == '__main__':
+    unittest.main()
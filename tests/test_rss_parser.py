@@ -1,6 +1,7 @@
 """Tests for RSS parser."""
 
 import unittest
+from unittest import mock
 from pathlib import Path
 import sys
 
@@ -47,6 +48,21 @@ class TestRSSItem(unittest.TestCase):
         self.assertFalse(item.matches_filter('JavaScript'))
         # Should match everything when no filter
         self.assertTrue(item.matches_filter(None))
+    
+    def test_rss_item_dict_round_trip(self):
+        """Test RSSItem survives conversion to and from a dict."""
+        entry = {
+            'title': 'Test Article',
+            'link': 'https://example.com/article',
+            'published': 'Mon, 01 Jan 2024 12:00:00 GMT',
+            'summary': 'Summary',
+            'id': 'article-123'
+        }
+        item = RSSItem(entry, 'https://example.com/feed.xml')
+        restored = RSSItem.from_dict(item.to_dict())
+        self.assertEqual(restored.to_dict(), item.to_dict())
+        self.assertEqual(restored.published, item.published)
+        self.assertEqual(restored.feed_url, 'https://example.com/feed.xml')
 
 
 class TestRSSParser(unittest.TestCase):
@@ -93,6 +109,41 @@ class TestRSSParser(unittest.TestCase):
         
         self.assertEqual(len(python_items_lower), len(python_items_upper))
         self.assertEqual(len(python_items_upper), len(python_items_mixed))
+    
+    def test_fetch_feed_conditional_get(self):
+        """Test that HTTP feeds are re-fetched with validators and 304 reuses items."""
+        feed_path = Path(__file__).parent / 'test_data' / 'sample_feed.xml'
+        url = 'https://example.com/feed.xml'
+        parser = RSSParser()
+        
+        full = mock.Mock(status_code=200, content=feed_path.read_bytes(),
+                         headers={'ETag': '"v1"', 'Last-Modified': 'Mon, 01 Jan 2024 12:00:00 GMT'})
+        not_modified = mock.Mock(status_code=304, content=b'', headers={})
+        
+        with mock.patch.object(parser.session, 'get', side_effect=[full, not_modified]) as get:
+            items = parser.fetch_feed(url)
+            cached = parser.fetch_feed(url)
+        
+        self.assertEqual(len(items), 4)
+        self.assertIs(cached, items)
+        self.assertEqual(items[0].feed_url, url)
+        second_headers = get.call_args_list[1].kwargs['headers']
+        self.assertEqual(second_headers['If-None-Match'], '"v1"')
+        self.assertEqual(second_headers['If-Modified-Since'], 'Mon, 01 Jan 2024 12:00:00 GMT')
+    
+    def test_fetch_feed_charset_from_headers(self):
+        """Test a feed declaring its encoding only in Content-Type is decoded with it."""
+        content = ('<?xml version="1.0"?><rss version="2.0"><channel><title>Caf\u00e9</title>'
+                   '<item><title>Cr\u00e8me br\u00fbl\u00e9e</title><link>https://example.com/1</link></item>'
+                   '</channel></rss>').encode('latin-1')
+        response = mock.Mock(status_code=200, content=content,
+                             headers={'Content-Type': 'application/rss+xml; charset=ISO-8859-1'})
+        parser = RSSParser()
+        
+        with mock.patch.object(parser.session, 'get', return_value=response):
+            items = parser.fetch_feed('https://example.com/feed.xml')
+        
+        self.assertEqual(items[0].title, 'Cr\u00e8me br\u00fbl\u00e9e')
 
 
 if __name__ == '__main__':
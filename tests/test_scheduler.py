@@ -0,0 +1,80 @@
+"""Tests for item scheduling across feeds."""
+
+import unittest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import FeedConfig
+from src.rss_parser import RSSItem
+from src.scheduler import ItemScheduler
+
+
+def make_items(name, count, day_offset=0):
+    """Create items published on consecutive days."""
+    return [
+        RSSItem({
+            'title': f'{name}{i}',
+            'link': f'https://example.com/{name}/{i}',
+            'id': f'{name}{i}',
+            'published': f'2024-01-{i + 1 + day_offset:02d}T12:00:00Z'
+        })
+        for i in range(count)
+    ]
+
+
+class TestItemScheduler(unittest.TestCase):
+    """Tests for ItemScheduler class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.feed_a = FeedConfig('https://example.com/a')
+        self.feed_b = FeedConfig('https://example.com/b')
+        self.feed_items = [
+            (self.feed_a, make_items('a', 4)),
+            (self.feed_b, make_items('b', 2, day_offset=10)),
+        ]
+    
+    def titles(self, items):
+        return [item.title for item in items]
+    
+    def test_fifo_keeps_feed_order(self):
+        """Test the default strategy keeps feeds in config order."""
+        ordered = ItemScheduler().order(self.feed_items)
+        self.assertEqual(self.titles(ordered), ['a0', 'a1', 'a2', 'a3', 'b0', 'b1'])
+    
+    def test_round_robin(self):
+        """Test round-robin alternates between feeds."""
+        ordered = ItemScheduler('round_robin').order(self.feed_items)
+        self.assertEqual(self.titles(ordered), ['a0', 'b0', 'a1', 'b1', 'a2', 'a3'])
+    
+    def test_weighted(self):
+        """Test weighted scheduling gives feeds turns in proportion to weight."""
+        self.feed_b.weight = 2
+        self.feed_items[1] = (self.feed_b, make_items('b', 4))
+        ordered = ItemScheduler('weighted').order(self.feed_items)
+        self.assertEqual(self.titles(ordered)[:6], ['b0', 'a0', 'b1', 'b2', 'a1', 'b3'])
+    
+    def test_newest_first(self):
+        """Test ordering by published date."""
+        ordered = ItemScheduler('fifo', newest_first=True).order(self.feed_items)
+        self.assertEqual(self.titles(ordered), ['b1', 'b0', 'a3', 'a2', 'a1', 'a0'])
+        
+        ordered = ItemScheduler('round_robin', newest_first=True).order(self.feed_items)
+        self.assertEqual(self.titles(ordered), ['a3', 'b1', 'a2', 'b0', 'a1', 'a0'])
+    
+    def test_feed_cap(self):
+        """Test per-feed max_items caps are applied."""
+        self.feed_a.max_items = 2
+        ordered = ItemScheduler('fifo', newest_first=True).order(self.feed_items)
+        self.assertEqual(self.titles(ordered), ['b1', 'b0', 'a3', 'a2'])
+    
+    def test_unknown_strategy(self):
+        """Test that an unknown strategy is rejected."""
+        with self.assertRaises(ValueError):
+            ItemScheduler('random')
+
+
+if __name__ == '__main__':
+    unittest.main()
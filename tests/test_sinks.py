@@ -0,0 +1,100 @@
+"""Tests for output sinks."""
+
+import unittest
+import tempfile
+import time
+from unittest import mock
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import OutputConfig
+from src.sinks import GoogleDocsSink, NullSink, RotatingFileSink, create_sink
+
+
+class TestGoogleDocsSink(unittest.TestCase):
+    """Tests for GoogleDocsSink class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.drive_client = mock.Mock()
+        self.drive_client.append_content.return_value = True
+    
+    def test_size_flush(self):
+        """Test the buffer is written in one append once full."""
+        sink = GoogleDocsSink(self.drive_client, max_bytes=10, max_delay=0)
+        self.assertEqual(sink.write('a', 'first'), [])
+        self.assertEqual(sink.write('b', 'second'), ['a', 'b'])
+        self.drive_client.append_content.assert_called_once_with('first\n\nsecond')
+        self.assertEqual(sink.buffered, 0)
+    
+    def test_time_flush(self):
+        """Test buffered articles are flushed after max_delay."""
+        sink = GoogleDocsSink(self.drive_client, max_bytes=1000, max_delay=0.05)
+        sink.write('a', 'first')
+        self.assertEqual(sink.flush_if_due(), [])
+        time.sleep(0.06)
+        self.assertEqual(sink.flush_if_due(), ['a'])
+    
+    def test_failed_flush_acknowledges_nothing(self):
+        """Test a failed append acknowledges no articles and empties the buffer."""
+        self.drive_client.append_content.return_value = False
+        sink = GoogleDocsSink(self.drive_client)
+        sink.write('a', 'first')
+        self.assertEqual(sink.flush(), [])
+        self.assertEqual(sink.buffered, 0)
+
+
+class TestRotatingFileSink(unittest.TestCase):
+    """Tests for RotatingFileSink class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+    
+    def test_rotates_at_size_limit(self):
+        """Test a new file is started when the current one would exceed the limit."""
+        sink = RotatingFileSink(str(self.temp_dir), max_file_bytes=100, max_bytes=1000)
+        for i in range(5):
+            sink.write(str(i), 'x' * 40)
+        self.assertEqual(sink.flush(), ['0', '1', '2', '3', '4'])
+        
+        files = sorted(path.name for path in self.temp_dir.iterdir())
+        self.assertEqual(files, ['articles-0001.md', 'articles-0002.md', 'articles-0003.md'])
+        for path in self.temp_dir.iterdir():
+            self.assertLessEqual(path.stat().st_size, 100)
+    
+    def test_continues_newest_file(self):
+        """Test a new sink appends to the newest existing file."""
+        first = RotatingFileSink(str(self.temp_dir), max_file_bytes=100, file_format='text')
+        first.write('a', 'x' * 80)
+        first.close()
+        sink = RotatingFileSink(str(self.temp_dir), max_file_bytes=100, file_format='text', max_bytes=0)
+        self.assertEqual(sink.index, 1)
+        sink.write('b', 'y' * 80)
+        self.assertEqual(sink.index, 2)
+        self.assertEqual((self.temp_dir / 'articles-0002.txt').read_text(), 'y' * 80 + '\n\n')
+
+
+class TestCreateSink(unittest.TestCase):
+    """Tests for create_sink."""
+    
+    def test_creates_configured_sinks(self):
+        """Test sinks are built from output configurations."""
+        temp_dir = tempfile.mkdtemp()
+        sink = create_sink(OutputConfig('file', {'directory': temp_dir, 'max_file_bytes': 500}))
+        self.assertIsInstance(sink, RotatingFileSink)
+        self.assertEqual(sink.max_file_bytes, 500)
+        
+        sink = create_sink(OutputConfig('google_docs', {'max_batch_bytes': 0}), mock.Mock(), 2)
+        self.assertIsInstance(sink, GoogleDocsSink)
+        self.assertEqual((sink.max_bytes, sink.min_interval), (0, 2))
+        
+        null = create_sink(OutputConfig('null'))
+        self.assertIsInstance(null, NullSink)
+        self.assertEqual(null.write('a', 'text'), ['a'])
+
+
+if __name__ == '__main__':
+    unittest.main()
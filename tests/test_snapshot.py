@@ -0,0 +1,45 @@
+"""Tests for warm-start snapshots."""
+
+import unittest
+import gzip
+import tempfile
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.snapshot import SnapshotStore
+
+
+class TestSnapshotStore(unittest.TestCase):
+    """Tests for SnapshotStore class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.snapshot_file = Path(self.temp_dir) / "snapshot.json.gz"
+    
+    def test_round_trip(self):
+        """Test a saved snapshot is loaded back."""
+        store = SnapshotStore(str(self.snapshot_file))
+        self.assertIsNone(store.load())
+        store.save({'feed_offset': 2, 'feeds': {}})
+        self.assertEqual(store.load(), {'version': 1, 'feed_offset': 2, 'feeds': {}})
+    
+    def test_unusable_snapshot_is_ignored(self):
+        """Test corrupt and incompatible snapshots load as None."""
+        store = SnapshotStore(str(self.snapshot_file))
+        self.snapshot_file.write_bytes(b'not gzip')
+        self.assertIsNone(store.load())
+        
+        with gzip.open(self.snapshot_file, 'wt') as f:
+            f.write('{"version": 99}')
+        self.assertIsNone(store.load())
+        
+        with gzip.open(self.snapshot_file, 'wt') as f:
+            f.write('[1, 2]')
+        self.assertIsNone(store.load())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -43,6 +43,33 @@ class TestStateManager(unittest.TestCase):
         self.assertTrue(manager2.is_processed("item-1"))
         self.assertTrue(manager2.is_processed("item-2"))
     
+    def test_refresh_merges_other_writers(self):
+        """Test refresh picks up items saved by another instance."""
+        manager1 = StateManager(str(self.state_file))
+        manager1.mark_processed("item-1")
+        manager2 = StateManager(str(self.state_file))
+        manager2.mark_processed("item-2")
+        
+        self.assertFalse(manager1.is_processed("item-2"))
+        manager1.refresh()
+        self.assertTrue(manager1.is_processed("item-1"))
+        self.assertTrue(manager1.is_processed("item-2"))
+    
+    def test_partial_writes_persist(self):
+        """Test outputs that wrote an item are remembered until it is processed."""
+        manager1 = StateManager(str(self.state_file))
+        manager1.record_writes('file:1', ["item-1", "item-2"], [])
+        
+        manager2 = StateManager(str(self.state_file))
+        self.assertEqual(manager2.written_outputs("item-1"), {'file:1'})
+        self.assertFalse(manager2.is_processed("item-1"))
+        manager2.record_writes('google_docs:0', [], ["item-1"])
+        
+        manager1.refresh()
+        self.assertTrue(manager1.is_processed("item-1"))
+        self.assertEqual(manager1.written_outputs("item-1"), set())
+        self.assertEqual(manager1.written_outputs("item-2"), {'file:1'})
+    
     def test_get_unprocessed_items(self):
         """Test filtering unprocessed items."""
         manager = StateManager(str(self.state_file))